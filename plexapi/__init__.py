@@ -20,6 +20,13 @@ VERSION = __version__ = const.__version__
 TIMEOUT = CONFIG.get('plexapi.timeout', 30, int)
 X_PLEX_CONTAINER_SIZE = CONFIG.get('plexapi.container_size', 100, int)
 X_PLEX_ENABLE_FAST_CONNECT = CONFIG.get('plexapi.enable_fast_connect', False, bool)
+XML_PARSER = CONFIG.get('plexapi.xml_parser', 'auto')
+KEEP_DATA = CONFIG.get('plexapi.keep_data', True, bool)
+MAX_WORKERS = CONFIG.get('plexapi.max_workers', 4, int)
+EDIT_CHUNK_SIZE = CONFIG.get('plexapi.edit_chunk_size', 500, int)
+DOWNLOAD_CHUNK_SIZE = CONFIG.get('plexapi.download_chunk_size', 1048576, int)
+CACHE_DIR = os.path.expanduser(CONFIG.get('plexapi.cache_dir', '~/.cache/plexapi'))
+IMAGE_CACHE_SIZE = CONFIG.get('plexapi.image_cache_size', 536870912, int)
 
 # Plex Header Configuration
 X_PLEX_PROVIDES = CONFIG.get('header.provides', 'controller')
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional, TypeVar
 
 from plexapi import media, utils
 from plexapi.base import Playable, PlexPartialObject, PlexHistory, PlexSession, cached_data_property
+from plexapi.download import DownloadManager
 from plexapi.exceptions import BadRequest
 from plexapi.mixins import (
     AdvancedSettingsMixin, SplitMergeMixin, UnmatchMatchMixin, ExtrasMixin, HubsMixin, PlayedUnplayedMixin, RatingMixin,
@@ -304,21 +305,30 @@ class Artist(
         """ Alias of :func:`~plexapi.audio.Artist.track`. """
         return self.track(title, album, track)
 
-    def download(self, savepath=None, keep_original_name=False, subfolders=False, **kwargs):
-        """ Download all tracks from the artist. See :func:`~plexapi.base.Playable.download` for details.
+    def download(self, savepath=None, keep_original_name=False, subfolders=False, maxworkers=None, resume=True,
+                 segments=None, window=None, **kwargs):
+        """ Download all tracks from the artist concurrently. See :func:`~plexapi.base.Playable.download` for details.
 
             Parameters:
                 savepath (str): Defaults to current working dir.
                 keep_original_name (bool): True to keep the original filename otherwise
                     a friendlier filename is generated.
                 subfolders (bool): True to separate tracks in to album folders.
+                maxworkers (int): Maximum number of concurrent downloads.
+                    Default is the ``plexapi.max_workers`` config value.
+                resume (bool): True to skip files which are already downloaded and resume partially
+                    downloaded files (default). False to always download the entire file.
+                segments (int): Number of connections used to download each part of the original files
+                    in byte ranges. See :func:`~plexapi.utils.downloadSegments`. Default is one connection.
+                window (int): Number of segments of each transcoded HLS stream fetched ahead concurrently.
+                    Default is the ``plexapi.max_workers`` config value.
                 **kwargs: Additional options passed into :func:`~plexapi.base.PlexObject.getStreamURL`.
         """
-        filepaths = []
+        manager = DownloadManager(maxworkers, resume=resume, segments=segments, window=window)
         for track in self.tracks():
             _savepath = os.path.join(savepath, track.parentTitle) if subfolders else savepath
-            filepaths += track.download(_savepath, keep_original_name, **kwargs)
-        return filepaths
+            manager.add(track, _savepath, keep_original_name, **kwargs)
+        return manager.download()
 
     def popularTracks(self):
         """ Returns a list of :class:`~plexapi.audio.Track` popular tracks by the artist. """
@@ -475,19 +485,28 @@ class Album(
         """ Return the album's :class:`~plexapi.audio.Artist`. """
         return self.fetchItem(self.parentKey)
 
-    def download(self, savepath=None, keep_original_name=False, **kwargs):
-        """ Download all tracks from the album. See :func:`~plexapi.base.Playable.download` for details.
+    def download(self, savepath=None, keep_original_name=False, maxworkers=None, resume=True, segments=None,
+                 window=None, **kwargs):
+        """ Download all tracks from the album concurrently. See :func:`~plexapi.base.Playable.download` for details.
 
             Parameters:
                 savepath (str): Defaults to current working dir.
                 keep_original_name (bool): True to keep the original filename otherwise
                     a friendlier filename is generated.
+                maxworkers (int): Maximum number of concurrent downloads.
+                    Default is the ``plexapi.max_workers`` config value.
+                resume (bool): True to skip files which are already downloaded and resume partially
+                    downloaded files (default). False to always download the entire file.
+                segments (int): Number of connections used to download each part of the original files
+                    in byte ranges. See :func:`~plexapi.utils.downloadSegments`. Default is one connection.
+                window (int): Number of segments of each transcoded HLS stream fetched ahead concurrently.
+                    Default is the ``plexapi.max_workers`` config value.
                 **kwargs: Additional options passed into :func:`~plexapi.base.PlexObject.getStreamURL`.
         """
-        filepaths = []
+        manager = DownloadManager(maxworkers, resume=resume, segments=segments, window=window)
         for track in self.tracks():
-            filepaths += track.download(savepath, keep_original_name, **kwargs)
-        return filepaths
+            manager.add(track, savepath, keep_original_name, **kwargs)
+        return manager.download()
 
     def _defaultSyncTitle(self):
         """ Returns str, default title for a new syncItem. """
@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
+import os
+import pickle
 import re
+import zlib
+from contextvars import ContextVar
+from hashlib import sha1
 from typing import TYPE_CHECKING, Generic, Iterable, List, Optional, TypeVar, Union
 import weakref
 from functools import cached_property
@@ -7,7 +12,10 @@ from urllib.parse import parse_qsl, urlencode, urlparse
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
-from plexapi import CONFIG, X_PLEX_CONTAINER_SIZE, log, utils
+import requests
+
+from plexapi import CONFIG, KEEP_DATA, X_PLEX_CONTAINER_SIZE, log, utils
+from plexapi.download import DownloadManager
 from plexapi.exceptions import BadRequest, NotFound, UnknownType, Unsupported
 
 if TYPE_CHECKING:
@@ -18,6 +26,12 @@ MediaContainerT = TypeVar("MediaContainerT", bound="MediaContainer")
 
 USER_DONT_RELOAD_FOR_KEYS = set()
 _DONT_RELOAD_FOR_KEYS = {'key', 'sourceURI'}
+_DONT_PICKLE_KEYS = {'_server', '_parent', '_data'}
+# Credentials and connections which are replaced with None when pickled
+_SECRET_KEYS = {'_token', '_session', 'authToken', 'authenticationToken', 'accessToken', 'token'}
+# Live PlexServer instances by (machineIdentifier, token hash), used to rebind unpickled objects
+SERVERS = weakref.WeakValueDictionary()
+_REBIND_SERVER = ContextVar('_REBIND_SERVER', default=None)
 OPERATORS = {
     'exact': lambda v, q: v == q,
     'iexact': lambda v, q: v.lower() == q.lower(),
@@ -110,6 +124,22 @@ class PlexObject(metaclass=PlexObjectMeta):
         name = self._clean(self.firstAttr('title', 'name', 'username', 'product', 'tag', 'value'))
         return f"<{':'.join([p for p in [self.__class__.__name__, uid, name] if p])}>"
 
+    def __reduce__(self):
+        """ Pickle the object as its class, its XML data and its loaded attributes. The server
+            is stored by machineIdentifier and token hash and rebound when loaded. Tokens and sessions
+            are never pickled. See :func:`~plexapi.base.loads`.
+        """
+        server = self.__dict__.get('_server')
+        if server is self:
+            serverID = True
+        else:
+            serverID = _serverKey(server)
+        skip = _DONT_PICKLE_KEYS | self._cached_data_properties
+        state = {k: None if k in _SECRET_KEYS else v for k, v in self.__dict__.items() if k not in skip}
+        data = _stripSecrets(utils.packXML(self.__dict__.get('_data')))
+        items = list(self) if isinstance(self, list) else None
+        return (_restorePlexObject, (self.__class__, serverID, state, data, items))
+
     def __setattr__(self, attr, value):
         overwriteNone = self.__dict__.get('_overwriteNone')
         # Don't overwrite an attr with None unless it's a private variable or overwrite None is True
@@ -213,6 +243,7 @@ class PlexObject(metaclass=PlexObjectMeta):
         container_size=None,
         maxresults=None,
         params=None,
+        keepData=None,
         **kwargs,
     ):
         """ Load the specified key to find and build all items with the specified tag
@@ -231,6 +262,9 @@ class PlexObject(metaclass=PlexObjectMeta):
                 container_size (None, int): How many items in data
                 maxresults (int, optional): Only return the specified number of results.
                 params (dict, optional): Any additional params to add to the request.
+                keepData (bool, optional): False to detach the raw XML data of each item from the
+                    response document once the item is built. Defaults to the ``plexapi.keep_data`` config.
+                    See :func:`~plexapi.base.PlexObject.findItems` for more details.
                 **kwargs (dict): Optionally add XML attribute to filter the items.
                     See the details below for more info.
 
@@ -314,7 +348,7 @@ class PlexObject(metaclass=PlexObjectMeta):
             headers['X-Plex-Container-Size'] = str(container_size)
 
             data = self._server.query(ekey, headers=headers, params=params)
-            subresults = self.findItems(data, cls, ekey, **kwargs)
+            subresults = self.findItems(data, cls, ekey, keepData=keepData, **kwargs)
             total_size = utils.cast(int, data.attrib.get('totalSize') or data.attrib.get('size')) or len(subresults)
 
             if not subresults:
@@ -370,11 +404,18 @@ class PlexObject(metaclass=PlexObjectMeta):
             clsname = cls.__name__ if cls else 'None'
             raise NotFound(f'Unable to find elem: cls={clsname}, attrs={kwargs}') from None
 
-    def findItems(self, data, cls=None, initpath=None, rtag=None, **kwargs):
+    def findItems(self, data, cls=None, initpath=None, rtag=None, keepData=None, **kwargs):
         """ Load the specified data to find and build all items with the specified tag
             and attrs. See :func:`~plexapi.base.PlexObject.fetchItem` for more details
             on how this is used.
+
+            By default each item keeps a reference to its XML element, which may keep the
+            entire response document alive (e.g. when parsing with lxml). Set ``keepData=False``
+            (or the ``plexapi.keep_data`` config to false) to only retain a detached copy of
+            each item's own element and drop the child elements of the returned
+            :class:`~plexapi.base.MediaContainer`.
         """
+        keepData = KEEP_DATA if keepData is None else keepData
         # filter on cls attrs if specified
         if cls and cls.TAG and 'tag' not in kwargs:
             kwargs['etag'] = cls.TAG
@@ -389,7 +430,11 @@ class PlexObject(metaclass=PlexObjectMeta):
             if self._checkAttrs(elem, **kwargs):
                 item = self._buildItemOrNone(elem, cls, initpath)
                 if item is not None:
+                    if not keepData:
+                        item._data = utils.detachXMLElement(elem)
                     items.append(item)
+        if not keepData and isinstance(items, MediaContainer):
+            items._data = utils.detachXMLElement(data, children=False)
         return items
 
     def findItem(self, data, cls=None, initpath=None, rtag=None, **kwargs):
@@ -508,7 +553,7 @@ class PlexObject(metaclass=PlexObjectMeta):
         if attrstr:
             results = [] if results is None else results
             for child in (c for c in elem if c.tag.lower() == attr.lower()):
-                results += self._getAttrValue(child, attrstr, results)
+                results += self._getAttrValue(child, attrstr)
             return [r for r in results if r is not None]
         # check were looking for the tag
         if attr.lower() == 'etag':
@@ -566,6 +611,108 @@ class PlexObject(metaclass=PlexObjectMeta):
         return self.TYPE
 
 
+def _serverKey(server):
+    """ Returns the ``(machineIdentifier, token hash)`` key of a :class:`~plexapi.server.PlexServer` connection. """
+    machineIdentifier = getattr(server, 'machineIdentifier', None)
+    if machineIdentifier is None:
+        return None
+    token = getattr(server, '_token', None) or ''
+    return machineIdentifier, sha1(token.encode('utf-8')).hexdigest()[:16]
+
+
+def _stripSecrets(packed):
+    """ Returns a packed XML element (see :func:`~plexapi.utils.packXML`) without the token attributes. """
+    if packed is None:
+        return None
+    tag, attrib, text, children = packed
+    attrib = {k: v for k, v in attrib.items() if k not in _SECRET_KEYS}
+    return tag, attrib, text, tuple(_stripSecrets(child) for child in children)
+
+
+def _lookupServer(serverKey, required=False):
+    """ Returns the live :class:`~plexapi.server.PlexServer` to bind unpickled objects to. Objects are only
+        bound to a connection with the same machineIdentifier and token, so they never act as another user.
+    """
+    server = _REBIND_SERVER.get()
+    if server is None and serverKey is not None:
+        server = SERVERS.get(tuple(serverKey))
+    if server is None and required:
+        raise NotFound(f'No connected PlexServer with machineIdentifier {serverKey[0]} and the same token. '
+                       'Connect to the server before loading the pickled objects, or pass the server to loads().')
+    return server
+
+
+def _restorePlexObject(cls, serverID, state, data, items=None):
+    """ Rebuilds an unpickled :class:`~plexapi.base.PlexObject`. See :func:`~plexapi.base.PlexObject.__reduce__`. """
+    obj = cls.__new__(cls)
+    if items:
+        list.extend(obj, items)
+    obj.__dict__.update(state)
+    if '_session' in state:
+        obj._session = requests.Session()
+    obj._data = utils.unpackXML(data)
+    obj._parent = None
+    obj._server = obj if serverID is True else _lookupServer(serverID)
+    return obj
+
+
+def dumps(obj, compress=True):
+    """ Serialize a :class:`~plexapi.base.PlexObject` (or any structure of them) to bytes.
+        Live connections, tokens, parent references and cached properties are not included. The XML
+        data is stored in a compact form and objects are rebound to a connected
+        :class:`~plexapi.server.PlexServer` with the same machineIdentifier and token when loaded.
+        Objects with their own token, such as :class:`~plexapi.myplex.MyPlexAccount`, are loaded without it.
+
+        Parameters:
+            obj (object): The object(s) to serialize.
+            compress (bool): True to zlib compress the pickled data (default).
+
+        Example:
+
+            .. code-block:: python
+
+                from concurrent.futures import ProcessPoolExecutor
+                from plexapi import base
+                from plexapi.server import PlexServer
+
+                def init(baseurl, token):
+                    global plex
+                    plex = PlexServer(baseurl, token)  # Unpickled objects are bound to this server
+
+                def process(movie):
+                    return movie.title, len(movie.genres)
+
+                with ProcessPoolExecutor(initializer=init, initargs=(baseurl, token)) as pool:
+                    results = list(pool.map(process, plex.library.section('Movies').all(), chunksize=100))
+
+                # Store to disk and load it again later
+                with open('movies.bin', 'wb') as f:
+                    f.write(base.dumps(movies))
+                with open('movies.bin', 'rb') as f:
+                    movies = base.loads(f.read(), server=plex)
+
+    """
+    data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    return zlib.compress(data) if compress else data
+
+
+def loads(data, server=None):
+    """ Load object(s) serialized with :func:`~plexapi.base.dumps` or :mod:`pickle`.
+
+        Parameters:
+            data (bytes): The serialized data.
+            server (:class:`~plexapi.server.PlexServer`, optional): Server to bind the loaded objects to.
+                Defaults to the connected server with the same machineIdentifier and token.
+    """
+    if data[:1] != b'\x80':  # Not a pickle protocol 2+ header, must be compressed
+        data = zlib.decompress(data)
+    token = _REBIND_SERVER.set(server)
+    try:
+        return pickle.loads(data)
+    finally:
+        _REBIND_SERVER.reset(token)
+
+
 class PlexPartialObject(PlexObject):
     """ Not all objects in the Plex listings return the complete list of elements
         for the object. This object will allow you to assume each object is complete,
@@ -909,17 +1056,33 @@ class Playable:
         """
         client.playMedia(self)
 
-    def download(self, savepath=None, keep_original_name=False, **kwargs):
+    def download(self, savepath=None, keep_original_name=False, maxworkers=None, resume=True, segments=None,
+                 window=None, **kwargs):
         """ Downloads the media item to the specified location. Returns a list of
-            filepaths that have been saved to disk.
+            filepaths that have been saved to disk. The media parts are downloaded concurrently
+            using a :class:`~plexapi.download.DownloadManager`.
 
             Parameters:
                 savepath (str): Defaults to current working dir.
                 keep_original_name (bool): True to keep the original filename otherwise
                     a friendlier filename is generated. See filenames below.
+                maxworkers (int): Maximum number of concurrent downloads.
+                    Default is the ``plexapi.max_workers`` config value.
+                resume (bool): True to skip files which are already downloaded and resume partially
+                    downloaded files (default). False to always download the entire file.
+                segments (int): Number of connections used to download each part of the original file
+                    in byte ranges. See :func:`~plexapi.utils.downloadSegments`. Default is one connection.
+                window (int): Number of segments of a transcoded HLS stream fetched ahead concurrently.
+                    See :class:`~plexapi.streaming.StreamFetcher`. Default is the ``plexapi.max_workers`` config value.
                 **kwargs (dict): Additional options passed into :func:`~plexapi.audio.Track.getStreamURL`
                     to download a transcoded stream, otherwise the media item will be downloaded
-                    as-is and saved to disk.
+                    as-is and saved to disk. HLS streams are downloaded by fetching the segments
+                    concurrently with a :class:`~plexapi.streaming.StreamFetcher` and saved as ``.ts`` files.
+
+            Raises:
+                :exc:`~plexapi.exceptions.Unsupported`: When downloading a DASH stream. Plex serves the video
+                    and audio of a DASH stream as separate representations, so use ``protocol='hls'``
+                    to download a transcoded stream.
 
             **Filenames**
 
@@ -928,7 +1091,18 @@ class Playable:
             * Track: ``<artist title> - <album title> - 00 - <track title>``
             * Photo: ``<photoalbum title> - <photo/clip title>`` or ``<photo/clip title>``
         """
-        filepaths = []
+        manager = DownloadManager(maxworkers, resume=resume, segments=segments, window=window)
+        manager.add(self, savepath, keep_original_name, **kwargs)
+        return manager.download()
+
+    def _downloadJobs(self, savepath=None, keep_original_name=False, **kwargs):
+        """ Returns a list of ``(url, token, filename, savepath, size, session)`` download jobs
+            for the media parts of the item. The size is only known when downloading the original file.
+            See :func:`~plexapi.base.Playable.download` for the parameters.
+        """
+        if kwargs.get('protocol') == 'dash':
+            raise Unsupported('Downloading a DASH stream is not supported, use protocol="hls" instead.')
+        jobs = []
         parts = [i for i in self.iterParts() if i]
 
         for part in parts:
@@ -938,25 +1112,21 @@ class Playable:
                 filename = part.file
 
             if kwargs:
-                # So this seems to be a a lot slower but allows transcode.
-                kwargs['mediaIndex'] = self.media.index(part._parent())
-                kwargs['partIndex'] = part._parent().parts.index(part)
-                download_url = self.getStreamURL(**kwargs)
+                # Transcoded HLS streams are fetched by segment with a StreamFetcher.
+                params = dict(kwargs)
+                params['mediaIndex'] = self.media.index(part._parent())
+                params['partIndex'] = part._parent().parts.index(part)
+                download_url = self.getStreamURL(**params)
+                size = None
+                if kwargs.get('protocol') in (None, 'hls'):
+                    filename = f'{os.path.splitext(filename)[0]}.ts'
             else:
                 download_url = self._server.url(f'{part.key}?download=1')
+                size = part.size
 
-            filepath = utils.download(
-                download_url,
-                self._server._token,
-                filename=filename,
-                savepath=savepath,
-                session=self._server._session
-            )
-
-            if filepath:
-                filepaths.append(filepath)
+            jobs.append((download_url, self._server._token, filename, savepath, size, self._server._session))
 
-        return filepaths
+        return jobs
 
     def updateProgress(self, time, state='stopped'):
         """ Set the watched progress for this video.
@@ -1154,6 +1324,16 @@ class MediaContainer(
         super().__init__(*args)
         PlexObject.__init__(self, server, data, initpath, parent)
 
+    def toColumns(self, fields, numpy=False):
+        """ Returns a :class:`~plexapi.utils.Columns` dictionary of typed arrays of the XML attributes
+            of the items. See :func:`~plexapi.utils.toColumns` for details.
+
+            Parameters:
+                fields (list or dict): List of attribute names, or a dict of attribute names to the column type.
+                numpy (bool): True to return NumPy arrays instead of arrays (requires NumPy).
+        """
+        return utils.toColumns((item._data for item in self), fields, numpy=numpy)
+
     def extend(
         self: MediaContainerT,
         __iterable: Union[Iterable[PlexObjectT], MediaContainerT],
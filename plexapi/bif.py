@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Reader for the BIF (Base Index Frames) preview thumbnail files generated by the Plex server.
+The BIF file of a :class:`~plexapi.media.MediaPart` is downloaded once and memory-mapped, so the
+thumbnail for any timestamp is read from the local file without additional requests to the server.
+
+.. code-block:: python
+
+    part = movie.media[0].parts[0]
+    with part.previewThumbnails() as bif:
+        jpeg = bif.frame(offset=90000)  # thumbnail at 1m30s
+        filepaths = bif.extract('/tmp/thumbs', offsets=range(0, movie.duration, 10000))
+
+"""
+import array
+import mmap
+import os
+import sys
+from bisect import bisect_right
+
+from plexapi.exceptions import BadRequest
+
+
+class BIF:
+    """ Memory-mapped reader for a BIF preview thumbnail file.
+
+        Parameters:
+            filepath (str): Path to the BIF file.
+
+        Attributes:
+            MAGIC (bytes): The BIF file signature.
+            filepath (str): Path to the BIF file.
+            version (int): The BIF format version.
+            interval (int): The timestamp multiplier of the frames in milliseconds.
+            timestamps (list): List of the frame timestamps in milliseconds.
+
+        Raises:
+            :exc:`~plexapi.exceptions.BadRequest`: The file is not a valid BIF file.
+    """
+    MAGIC = b'\x89BIF\r\n\x1a\n'
+    HEADER_SIZE = 64
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        if os.path.getsize(filepath) < self.HEADER_SIZE:
+            raise BadRequest(f'Invalid BIF file: {filepath}')
+        with open(filepath, 'rb') as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{os.path.basename(self.filepath)}:{len(self)}>'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        """ Returns the JPEG bytes of the frame at the index. """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('BIF frame index out of range')
+        return self._mmap[self._offsets[index]:self._offsets[index + 1]]
+
+    def _parse(self):
+        if len(self._mmap) < self.HEADER_SIZE or self._mmap[:8] != self.MAGIC:
+            raise BadRequest(f'Invalid BIF file: {self.filepath}')
+        header = self._uint32(self._mmap[8:20])
+        self.version, count, self.interval = header[0], header[1], header[2] or 1000
+        end = self.HEADER_SIZE + (count + 1) * 8
+        if len(self._mmap) < end:
+            raise BadRequest(f'Truncated BIF file: {self.filepath}')
+        table = self._uint32(self._mmap[self.HEADER_SIZE:end])
+        self.timestamps = [timestamp * self.interval for timestamp in table[0:count * 2:2]]
+        self._offsets = table[1::2]
+        if self._offsets[-1] > len(self._mmap):
+            raise BadRequest(f'Truncated BIF file: {self.filepath}')
+
+    @staticmethod
+    def _uint32(data):
+        """ Returns an array of the little-endian unsigned 32-bit integers in the data. """
+        values = array.array('I', data)
+        if sys.byteorder == 'big':  # pragma: no cover
+            values.byteswap()
+        return values
+
+    def index(self, offset):
+        """ Returns the index of the frame displayed at the offset in milliseconds. """
+        return max(bisect_right(self.timestamps, offset) - 1, 0)
+
+    def frame(self, offset):
+        """ Returns the JPEG bytes of the frame displayed at the offset in milliseconds. """
+        return self[self.index(offset)]
+
+    def frames(self, offsets):
+        """ Returns a list of the JPEG bytes of the frames displayed at each offset in milliseconds. """
+        return [self.frame(offset) for offset in offsets]
+
+    def extract(self, savepath=None, offsets=None):
+        """ Saves the frames as JPEG files and returns the list of filepaths.
+            The files are named by the frame timestamp in milliseconds.
+
+            Parameters:
+                savepath (str, optional): Directory to save the frames. Defaults to current working dir.
+                offsets (list, optional): List of offsets in milliseconds to extract the displayed frames.
+                    Default is all of the frames.
+        """
+        savepath = savepath or os.getcwd()
+        os.makedirs(savepath, exist_ok=True)
+        indexes = range(len(self)) if offsets is None else sorted({self.index(offset) for offset in offsets})
+        filepaths = []
+        for index in indexes:
+            filepath = os.path.join(savepath, f'{self.timestamps[index]:010d}.jpg')
+            with open(filepath, 'wb') as handle:
+                handle.write(self[index])
+            filepaths.append(filepath)
+        return filepaths
+
+    def close(self):
+        """ Closes the memory-mapped file. """
+        self._mmap.close()
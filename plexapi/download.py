@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+The :class:`~plexapi.download.DownloadManager` downloads the media parts of many items concurrently.
+Each file is downloaded to a temporary ``.part`` file which is resumed with an HTTP ``Range`` request
+if the download is interrupted, verified against the size of the :class:`~plexapi.media.MediaPart`,
+and renamed to the final filename once complete.
+
+.. code-block:: python
+
+    from plexapi.download import DownloadManager
+
+    def progress(manager):
+        print(f'{manager.downloadedSize / manager.totalSize:.1%} of {manager.total} files', end='\r')
+
+    manager = DownloadManager(maxworkers=4, callback=progress)
+    for show in plex.library.section('TV Shows').all():
+        for episode in show.episodes():
+            manager.add(episode, savepath=f'/mnt/archive/{show.title}')
+    filepaths = manager.download()
+
+"""
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from urllib.parse import urlparse
+
+from plexapi import MAX_WORKERS, log, utils
+from plexapi.exceptions import Unsupported
+from plexapi.streaming import StreamFetcher
+
+
+class DownloadManager:
+    """ Downloads the media parts of :class:`~plexapi.base.Playable` items concurrently.
+
+        Parameters:
+            maxworkers (int, optional): Maximum number of concurrent downloads.
+                Default is the ``plexapi.max_workers`` config value.
+            chunksize (int, optional): Size of the read/write buffer in bytes.
+                Default is the ``plexapi.download_chunk_size`` config value.
+            resume (bool, optional): True to resume partially downloaded files and skip files which are already
+                downloaded with the expected size (default). False to always download the entire file.
+            callback (func, optional): Function called with the download manager after each downloaded chunk
+                to report the aggregate progress.
+            segments (int, optional): Number of byte ranges to download concurrently for each file of a known size.
+                See :func:`~plexapi.utils.downloadSegments`. Default is one connection per file.
+            window (int, optional): Number of segments of a transcoded HLS stream fetched ahead concurrently
+                with a :class:`~plexapi.streaming.StreamFetcher`. Default is the ``plexapi.max_workers`` config value.
+
+        Attributes:
+            jobs (list): List of ``(url, token, filename, savepath, size, session)`` download jobs.
+            errors (list): List of ``(job, exception)`` tuples for the failed downloads.
+            total (int): Total number of files to download.
+            completed (int): Number of files downloaded.
+            totalSize (int): Total size in bytes of the files to download (when known).
+            downloadedSize (int): Number of bytes downloaded.
+    """
+
+    def __init__(self, maxworkers=None, chunksize=None, resume=True, callback=None, segments=None, window=None):
+        self.maxworkers = maxworkers or MAX_WORKERS
+        self.chunksize = chunksize
+        self.resume = resume
+        self.callback = callback
+        self.segments = segments
+        self.window = window
+        self.jobs = []
+        self.errors = []
+        self.completed = 0
+        self.totalSize = 0
+        self.downloadedSize = 0
+        self._lock = Lock()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.completed}/{self.total}>'
+
+    @property
+    def total(self):
+        return len(self.jobs)
+
+    def add(self, item, savepath=None, keep_original_name=False, **kwargs):
+        """ Add the media parts of a :class:`~plexapi.base.Playable` item to download.
+            See :func:`~plexapi.base.Playable.download` for the parameters.
+        """
+        for job in item._downloadJobs(savepath, keep_original_name, **kwargs):
+            self.addURL(*job)
+        return self
+
+    def addURL(self, url, token, filename=None, savepath=None, size=None, session=None):
+        """ Add a URL to download. See :func:`~plexapi.utils.download` for the parameters.
+
+            Raises:
+                :exc:`~plexapi.exceptions.Unsupported`: When the URL is a DASH stream.
+        """
+        if StreamFetcher.isStreamURL(url) and urlparse(url).path.endswith('.mpd'):
+            raise Unsupported('Downloading a DASH stream is not supported, use an HLS stream instead.')
+        self.jobs.append((url, token, filename, savepath, size, session))
+        self.totalSize += size or 0
+        return self
+
+    def _progress(self, nbytes):
+        with self._lock:
+            self.downloadedSize += nbytes
+        if self.callback:
+            self.callback(self)
+
+    def _download(self, job):
+        url, token, filename, savepath, size, session = job
+        if StreamFetcher.isStreamURL(url):
+            with StreamFetcher(url, token, session=session, window=self.window) as fetcher:
+                filepath = fetcher.download(filename, savepath, callback=self._progress)
+        elif self.segments and self.segments > 1 and filename and size:
+            filepath = utils.downloadSegments(
+                url, token, filename, size, savepath=savepath, session=session, segments=self.segments,
+                chunksize=self.chunksize, resume=self.resume, callback=self._progress)
+        else:
+            filepath = utils.download(
+                url, token, filename=filename, savepath=savepath, session=session, chunksize=self.chunksize,
+                resume=self.resume, size=size, callback=self._progress)
+        with self._lock:
+            self.completed += 1
+        return filepath
+
+    def download(self):
+        """ Download all of the added jobs and return the list of filepaths in the order the jobs were added.
+            The remaining downloads are completed before the first error is raised; the failed downloads
+            are kept as partial files to be resumed.
+        """
+        self.errors = []
+        self.completed = 0
+        self.downloadedSize = 0
+        filepaths = []
+        if not self.jobs:
+            return filepaths
+
+        with ThreadPoolExecutor(max_workers=min(self.maxworkers, len(self.jobs))) as pool:
+            futures = [(job, pool.submit(self._download, job)) for job in self.jobs]
+            for job, future in futures:
+                try:
+                    filepath = future.result()
+                except Exception as e:
+                    log.warning('Failed to download %s: %s', job[2] or job[0], e)
+                    self.errors.append((job, e))
+                    continue
+                if filepath:
+                    filepaths.append(filepath)
+
+        if self.errors:
+            raise self.errors[0][1]
+        return filepaths
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Federated search runs the same search concurrently against multiple :class:`~plexapi.server.PlexServer` and
+:class:`~plexapi.library.LibrarySection` targets and merges the results. The total search time is the time
+of the slowest target (up to the timeout) instead of the sum of all targets.
+
+.. code-block:: python
+
+    from plexapi import federated
+
+    servers = [resource.connect() for resource in account.resources() if resource.provides == 'server']
+    results = federated.search(servers, 'Arnold', timeout=5)
+    for item in results:
+        print(item._server.friendlyName, item.title)
+    print('Timed out:', results.pending, 'Failed:', results.errors)
+
+"""
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from time import monotonic
+
+from plexapi import MAX_WORKERS, TIMEOUT, log
+from plexapi.exceptions import BadRequest
+
+
+class SearchResults(list):
+    """ List of the merged results of a federated search.
+
+        Attributes:
+            results (dict): Mapping of each completed target to its list of results.
+            errors (dict): Mapping of each failed target to the raised exception.
+            pending (list): List of targets which did not complete before the timeout.
+    """
+
+    def __init__(self, items=(), results=None, errors=None, pending=None):
+        super(SearchResults, self).__init__(items)
+        self.results = results or {}
+        self.errors = errors or {}
+        self.pending = pending or []
+
+
+def _search(target, query, method, mediatype, limit, **kwargs):
+    """ Runs a single search against a :class:`~plexapi.server.PlexServer` or
+        :class:`~plexapi.library.LibrarySection` target.
+    """
+    isServer = hasattr(target, 'library')
+    if method == 'hub':
+        if isServer:
+            return target.search(query, mediatype=mediatype, limit=limit)
+        return target.hubSearch(query, mediatype=mediatype, limit=limit)
+    if method == 'search':
+        if isServer:
+            return target.library.search(title=query, libtype=mediatype, maxresults=limit, **kwargs)
+        return target.search(title=query, libtype=mediatype, maxresults=limit, **kwargs)
+    raise BadRequest(f'Unknown search method "{method}", must be "hub" or "search".')
+
+
+def searchIter(targets, query=None, method='hub', mediatype=None, limit=None, timeout=None,
+               maxworkers=None, **kwargs):
+    """ Searches all targets concurrently and yields ``(target, results)`` tuples in the order the
+        targets complete. Failed targets yield the raised exception instead of the results.
+        Targets which do not complete before the timeout are skipped.
+        See :func:`~plexapi.federated.search` for the parameters.
+    """
+    targets = list(targets)
+    if not targets:
+        return
+    timeout = TIMEOUT if timeout is None else timeout
+    deadline = monotonic() + timeout
+    pool = ThreadPoolExecutor(max_workers=min(maxworkers or MAX_WORKERS, len(targets)))
+    futures = {
+        pool.submit(_search, target, query, method, mediatype, limit, **kwargs): target
+        for target in targets
+    }
+    try:
+        while futures:
+            done, _ = wait(futures, timeout=max(deadline - monotonic(), 0), return_when=FIRST_COMPLETED)
+            if not done:
+                log.warning('Federated search timed out waiting for %s target(s)', len(futures))
+                break
+            for future in done:
+                target = futures.pop(future)
+                try:
+                    yield target, future.result()
+                except Exception as e:
+                    log.warning('Federated search failed for %s: %s', target, e)
+                    yield target, e
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def search(targets, query=None, method='hub', mediatype=None, limit=None, timeout=None,
+           maxworkers=None, key=None, **kwargs):
+    """ Searches multiple :class:`~plexapi.server.PlexServer` and :class:`~plexapi.library.LibrarySection`
+        targets concurrently and returns the merged results. The results are ranked by interleaving the
+        results of each target in order (the best result of each target first, then the second, etc.)
+        unless a sort ``key`` is provided. Results from targets which complete before the timeout are
+        returned even when other targets are slow or fail.
+
+        Parameters:
+            targets (list): List of :class:`~plexapi.server.PlexServer` or
+                :class:`~plexapi.library.LibrarySection` objects to search.
+            query (str): The search query string.
+            method (str, optional): ``hub`` to use the Plex hub search (default), or ``search`` to use the
+                library search with the query as the title.
+            mediatype (str, optional): Limit the search to the specified media type
+                (movie, show, episode, artist, album, track, etc.).
+            limit (int, optional): Limit the number of results per hub (``hub``) or per target (``search``).
+            timeout (int, optional): Maximum number of seconds to wait for all of the targets to complete.
+                Default is the ``plexapi.timeout`` config value.
+            maxworkers (int, optional): Maximum number of concurrent searches.
+                Default is the ``plexapi.max_workers`` config value.
+            key (func, optional): Function to sort the merged results (e.g. ``lambda item: item.title``).
+            **kwargs (dict): Additional filters for the ``search`` method.
+                See :func:`~plexapi.library.LibrarySection.search`.
+
+        Returns:
+            :class:`~plexapi.federated.SearchResults`: The merged list of results with the results, errors,
+            and pending targets.
+    """
+    targets = list(targets)
+    results, errors = {}, {}
+    for target, result in searchIter(targets, query, method=method, mediatype=mediatype, limit=limit,
+                                     timeout=timeout, maxworkers=maxworkers, **kwargs):
+        if isinstance(result, Exception):
+            errors[target] = result
+        else:
+            results[target] = list(result)
+    pending = [target for target in targets if target not in results and target not in errors]
+
+    completed = [results[target] for target in targets if target in results]
+    items = []
+    for rank in range(max(map(len, completed), default=0)):
+        items.extend(result[rank] for result in completed if rank < len(result))
+    if key is not None:
+        items.sort(key=key)
+    return SearchResults(items, results=results, errors=errors, pending=pending)
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+The :class:`~plexapi.imagecache.ImageCache` stores posters, artwork, and transcoded images on disk so the same
+image is only fetched from the Plex server once. Images are keyed by the server, the image path, the version of
+the item (``updatedAt``), and the transcode parameters, and the least recently used images are evicted when the cache
+grows larger than the maximum size.
+
+.. code-block:: python
+
+    from plexapi.imagecache import ImageCache
+
+    cache = ImageCache(plex)
+    cache.prewarm(plex.library.section('Movies'), sizes=[(300, 450), (150, 225)])
+    data = cache.getImage(movie, width=300, height=450)
+
+"""
+import json
+import os
+import time
+from collections import OrderedDict
+from hashlib import sha1
+from threading import Lock
+
+from plexapi import CACHE_DIR, IMAGE_CACHE_SIZE, log, utils
+from plexapi.exceptions import NotFound
+
+
+class ImageCache:
+    """ Content-addressed local disk cache for images from a Plex server.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): The server to fetch the images from.
+            path (str, optional): Directory to store the cached images.
+                Default is the ``images`` directory in the ``plexapi.cache_dir`` config value.
+            maxsize (int, optional): Maximum total size of the cached images in bytes.
+                Default is the ``plexapi.image_cache_size`` config value.
+
+        Attributes:
+            size (int): Total size of the cached images in bytes.
+            hits (int): Number of images served from the cache.
+            misses (int): Number of images fetched from the server.
+    """
+
+    def __init__(self, server, path=None, maxsize=None):
+        self._server = server
+        self.path = path or os.path.join(CACHE_DIR, 'images')
+        self.maxsize = IMAGE_CACHE_SIZE if maxsize is None else maxsize
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self._inflight = {}
+        self._entries = OrderedDict()
+        self._load()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.path}:{len(self._entries)}>'
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _load(self):
+        """ Loads the existing cached images ordered by the last access time. """
+        entries = []
+        if os.path.isdir(self.path):
+            for dirpath, _, filenames in os.walk(self.path):
+                for filename in filenames:
+                    if filename.endswith('.tmp'):
+                        continue
+                    stat = os.stat(os.path.join(dirpath, filename))
+                    entries.append((stat.st_mtime, filename, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._entries[name] = size
+            self.size += size
+
+    def _filepath(self, name):
+        return os.path.join(self.path, name[:2], name)
+
+    def cacheKey(self, image, width=None, height=None, attr='thumb', **kwargs):
+        """ Returns the image path and the cache key of an image.
+            See :func:`~plexapi.imagecache.ImageCache.getImage` for the parameters.
+        """
+        version = None
+        if isinstance(image, str):
+            path = image
+        else:
+            path = image._data.attrib.get(attr)
+            version = image._data.attrib.get('updatedAt')
+            if not path:
+                raise NotFound(f'{image.__class__.__name__} does not have a {attr} image.')
+        params = {'width': width, 'height': height, **kwargs} if width or height else {}
+        # image paths and item ratingKeys are only unique per server
+        key = json.dumps([self._server.machineIdentifier, path, version, sorted(params.items())], default=str)
+        return path, sha1(key.encode('utf-8')).hexdigest()
+
+    def _url(self, path, width=None, height=None, **kwargs):
+        if width or height:
+            return self._server.transcodeImage(path, height, width, **kwargs)
+        if path.startswith(('http://', 'https://')):
+            return path
+        return self._server.url(path, includeToken=True)
+
+    def _read(self, name):
+        with self._lock:
+            if name not in self._entries:
+                return None
+            self._entries.move_to_end(name)
+        filepath = self._filepath(name)
+        try:
+            with open(filepath, 'rb') as handle:
+                data = handle.read()
+            os.utime(filepath)
+        except OSError:
+            with self._lock:
+                self.size -= self._entries.pop(name, 0)
+            return None
+        return data
+
+    def _write(self, name, data):
+        filepath = self._filepath(name)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        tmppath = f'{filepath}.{os.getpid()}.tmp'
+        with open(tmppath, 'wb') as handle:
+            handle.write(data)
+        os.replace(tmppath, filepath)
+
+        evicted = []
+        with self._lock:
+            self.size += len(data) - self._entries.pop(name, 0)
+            self._entries[name] = len(data)
+            while self.size > self.maxsize and len(self._entries) > 1:
+                oldest, size = self._entries.popitem(last=False)
+                self.size -= size
+                evicted.append(oldest)
+        for oldest in evicted:
+            try:
+                os.remove(self._filepath(oldest))
+            except OSError:
+                pass
+
+    def getImage(self, image, width=None, height=None, attr='thumb', **kwargs):
+        """ Returns the bytes of an image from the cache, or fetches and caches the image from the server.
+            Concurrent requests for the same image only fetch the image once.
+
+            Parameters:
+                image (str or :class:`~plexapi.base.PlexObject`): The image path (e.g. ``/library/metadata/1/thumb``)
+                    or a Plex object. The cache key includes the ``updatedAt`` version of a Plex object.
+                width (int, optional): Width to transcode the image to.
+                height (int, optional): Height to transcode the image to.
+                attr (str, optional): The image attribute of a Plex object (``thumb``, ``art``, etc.).
+                    Default ``thumb``.
+                **kwargs (dict): Additional options passed to :func:`~plexapi.server.PlexServer.transcodeImage`.
+        """
+        path, name = self.cacheKey(image, width=width, height=height, attr=attr, **kwargs)
+        data = self._read(name)
+        if data is not None:
+            with self._lock:
+                self.hits += 1
+            return data
+        # the images are cached on disk, so the in-flight fetches are shared without an in-memory cache
+        return utils._cachedCall(None, self._inflight, self._lock, name, self._fetch, name, path, width, height, kwargs)
+
+    def _fetch(self, name, path, width, height, kwargs):
+        """ Fetches an image from the server and writes it to the cache. """
+        # another thread may have cached the image before this thread started fetching it
+        data = self._read(name)
+        if data is not None:
+            with self._lock:
+                self.hits += 1
+            return data
+        url = self._url(path, width=width, height=height, **kwargs)
+        response = self._server._session.get(url, headers=self._server._headers(), timeout=self._server._timeout)
+        utils._checkDownloadResponse(response)
+        data = response.content
+        self._write(name, data)
+        with self._lock:
+            self.misses += 1
+        return data
+
+    def prewarm(self, items, sizes=None, attr='thumb', maxworkers=None, **kwargs):
+        """ Fetches and caches the images of many items concurrently.
+
+            Parameters:
+                items (list or :class:`~plexapi.library.LibrarySection`): List of Plex objects,
+                    or a library section to prewarm all of the items in the section.
+                sizes (list, optional): List of ``(width, height)`` tuples to transcode the images to.
+                    Default is the original image.
+                attr (str, optional): The image attribute of the items (``thumb``, ``art``, etc.). Default ``thumb``.
+                maxworkers (int, optional): Maximum number of concurrent requests.
+                    Default is the ``plexapi.max_workers`` config value.
+                **kwargs (dict): Additional options passed to :func:`~plexapi.server.PlexServer.transcodeImage`.
+
+            Returns:
+                List: List of ``(item, size, exception)`` tuples for each failed image.
+        """
+        if hasattr(items, 'all'):
+            items = items.all()
+        sizes = sizes or [(None, None)]
+        jobs = [(item, size) for item in items if item._data.attrib.get(attr) for size in sizes]
+
+        def _get(item, size):
+            self.getImage(item, width=size[0], height=size[1], attr=attr, **kwargs)
+
+        start = time.time()
+        failures = []
+        for (item, size), _, error in utils._runJobs(_get, jobs, maxworkers=maxworkers):
+            if error is not None:
+                log.warning('Failed to cache %s image %s for %s: %s', attr, size, item.ratingKey, error)
+                failures.append((item, size, error))
+        log.debug('Prewarmed %s images in %.2fs', len(jobs) - len(failures), time.time() - start)
+        return failures
+
+    def clear(self):
+        """ Removes all of the cached images. """
+        with self._lock:
+            names = list(self._entries)
+            self._entries.clear()
+            self.size = 0
+        for name in names:
+            try:
+                os.remove(self._filepath(name))
+            except OSError:
+                pass
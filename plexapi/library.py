@@ -1,18 +1,24 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import json
+import os
 import re
+import time
 from typing import Any, TYPE_CHECKING
 import warnings
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from hashlib import sha1
+from threading import Lock
 from urllib.parse import parse_qs, quote_plus, urlencode, urlparse
 
-from plexapi import log, media, utils
+from plexapi import CACHE_DIR, EDIT_CHUNK_SIZE, MAX_WORKERS, X_PLEX_CONTAINER_SIZE, log, media, utils
 from plexapi.base import OPERATORS, PlexObject, cached_data_property
-from plexapi.exceptions import BadRequest, NotFound
+from plexapi.exceptions import BadRequest, NotFound, Unauthorized
 from plexapi.mixins import (
-    MovieEditMixins, ShowEditMixins, SeasonEditMixins, EpisodeEditMixins,
+    EditTagsMixin, MovieEditMixins, ShowEditMixins, SeasonEditMixins, EpisodeEditMixins,
     ArtistEditMixins, AlbumEditMixins, TrackEditMixins, PhotoalbumEditMixins, PhotoEditMixins
 )
 from plexapi.settings import Setting
@@ -23,6 +29,36 @@ if TYPE_CHECKING:
     from plexapi.audio import Track
 
 
+# Short lived cache of loaded hubs by (machineIdentifier, token hash, key, size)
+_HUBS_CACHE = {}
+
+
+def _loadHubs(obj, key, size=None, maxworkers=None, ttl=None):
+    """ Returns the list of :class:`~plexapi.library.Hub` from the key with the items of every hub
+        loaded concurrently. See :func:`~plexapi.library.Library.loadHubs`.
+    """
+    # hubs such as continue watching are user specific, so the cache is also keyed by the token of the connection
+    token = sha1((obj._server._token or '').encode('utf-8')).hexdigest()
+    cacheKey = (obj._server.machineIdentifier, token, key, size)
+    if ttl:
+        expires, hubs = _HUBS_CACHE.get(cacheKey, (0, None))
+        if expires > time.monotonic():
+            return hubs
+
+    hubs = obj.fetchItems(key, cls=Hub)
+    if hubs:
+        with ThreadPoolExecutor(max_workers=min(maxworkers or MAX_WORKERS, len(hubs))) as pool:
+            list(pool.map(lambda hub: hub._prefetch(size), hubs))
+
+    if ttl:
+        now = time.monotonic()
+        for _cacheKey, (expires, _) in list(_HUBS_CACHE.items()):
+            if expires <= now:
+                _HUBS_CACHE.pop(_cacheKey, None)
+        _HUBS_CACHE[cacheKey] = (now + ttl, hubs)
+    return hubs
+
+
 class Library(PlexObject):
     """ Represents a PlexServer library. This contains all sections of media defined
         in your Plex server including video, shows and audio.
@@ -141,6 +177,42 @@ class Library(PlexObject):
         key = f'/hubs{utils.joinArgs(kwargs)}'
         return self.fetchItems(key)
 
+    def loadHubs(self, sectionID=None, identifier=None, size=None, maxworkers=None, ttl=None, **kwargs):
+        """ Returns a list of :class:`~plexapi.library.Hub` across all library sections with the items of every
+            hub loaded concurrently, so :func:`~plexapi.library.Hub.items` does not make any additional requests.
+
+            Parameters:
+                sectionID (int or str or list, optional):
+                    IDs of the sections to limit results or "playlists".
+                identifier (str or list, optional):
+                    Names of identifiers to limit results. See :func:`~plexapi.library.Library.hubs`.
+                size (int, optional): Maximum number of items to load for each hub. Default loads all items.
+                maxworkers (int, optional): Maximum number of concurrent requests.
+                    Default is the ``plexapi.max_workers`` config value.
+                ttl (int, optional): Number of seconds to cache the loaded hubs. Subsequent calls with the same
+                    parameters return the same cached hubs until the cache expires. Default is no caching.
+
+            Example:
+
+                .. code-block:: python
+
+                    for hub in plex.library.loadHubs(size=20, ttl=60):
+                        print(hub.title, [item.title for item in hub.items()])
+
+        """
+        if sectionID:
+            if not isinstance(sectionID, list):
+                sectionID = [sectionID]
+            kwargs['contentDirectoryID'] = ",".join(map(str, sectionID))
+        if identifier:
+            if not isinstance(identifier, list):
+                identifier = [identifier]
+            kwargs['identifier'] = ",".join(identifier)
+        if size is not None:
+            kwargs['count'] = size
+        key = f'/hubs{utils.joinArgs(kwargs)}'
+        return _loadHubs(self, key, size=size, maxworkers=maxworkers, ttl=ttl)
+
     def all(self, **kwargs):
         """ Returns a list of all media from all library sections.
             This may be a very large dataset to retrieve.
@@ -159,7 +231,7 @@ class Library(PlexObject):
         """ Returns a list of all media items recently added. """
         return self.fetchItems('/library/recentlyAdded')
 
-    def search(self, title=None, libtype=None, **kwargs):
+    def search(self, title=None, libtype=None, maxresults=None, **kwargs):
         """ Searching within a library section is much more powerful. It seems certain
             attributes on the media objects can be targeted to filter this search down
             a bit, but I haven't found the documentation for it.
@@ -167,6 +239,9 @@ class Library(PlexObject):
             Example: "studio=Comedy%20Central" or "year=1999" "title=Kung Fu" all work. Other items
             such as actor=<id> seem to work, but require you already know the id of the actor.
             TLDR: This is untested but seems to work. Use library section search when you can.
+
+            Parameters:
+                maxresults (int, optional): Only return the specified number of results.
         """
         args = {}
         if title:
@@ -176,7 +251,7 @@ class Library(PlexObject):
         for attr, value in kwargs.items():
             args[attr] = value
         key = f'/library/all{utils.joinArgs(args)}'
-        return self.fetchItems(key)
+        return self.fetchItems(key, maxresults=maxresults)
 
     def cleanBundles(self):
         """ Poster images and other metadata for items in your library are kept in "bundle"
@@ -434,6 +509,7 @@ class LibrarySection(PlexObject):
             updatedAt (datetime): Datetime the library section was last updated.
             uuid (str): Unique id for the section (32258d7c-3e6c-4ac5-98ad-bad7a3b78c63)
     """
+    _guidIndex = None
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
@@ -661,18 +737,18 @@ class LibrarySection(PlexObject):
                     result3 = library.getGuid('tmdb://1399')
                     result4 = library.getGuid('tvdb://121361')
 
-                    # Alternatively, create your own guid lookup dictionary for faster performance
-                    guidLookup = {}
-                    for item in library.all():
-                        guidLookup[item.guid] = item
-                        guidLookup.update({guid.id: item for guid in item.guids})
-
-                    result1 = guidLookup['plex://show/5d9c086c46115600200aa2fe']
-                    result2 = guidLookup['imdb://tt0944947']
-                    result3 = guidLookup['tmdb://1399']
-                    result4 = guidLookup['tvdb://121361']
+                    # Alternatively, load the persistent guid index for faster performance
+                    library.guidIndex()
+                    result1 = library.getGuid('imdb://tt0944947')
 
         """
+        if self._guidIndex is not None:
+            ratingKey = self._guidIndex.get(guid)
+            if ratingKey is not None:
+                try:
+                    return self.fetchItem(ratingKey)
+                except NotFound:
+                    self._guidIndex.remove(ratingKey)
 
         try:
             if guid.startswith('plex://'):
@@ -685,6 +761,24 @@ class LibrarySection(PlexObject):
         except IndexError:
             raise NotFound(f"Guid '{guid}' is not found in the library") from None
 
+    def guidIndex(self, path=None, refresh=True):
+        """ Loads and returns the :class:`~plexapi.library.GuidIndex` for this library section.
+            Once loaded, :func:`~plexapi.library.LibrarySection.getGuid` looks up guids in the index
+            instead of searching the library.
+
+            Parameters:
+                path (str, optional): The file path to persist the index. Default is a file in the
+                    ``plexapi.cache_dir`` config directory. Set to ``False`` to keep the index in memory only.
+                refresh (bool, optional): True to refresh the index with any items updated since it was saved
+                    (default). False to use the saved index as is.
+        """
+        if path is None:
+            path = os.path.join(CACHE_DIR, f'guids-{self._server.machineIdentifier}-{self.key}.json')
+        self._guidIndex = GuidIndex(self, path=path or None)
+        if refresh or not self._guidIndex.ratingKeys:
+            self._guidIndex.refresh()
+        return self._guidIndex
+
     def all(self, libtype=None, **kwargs):
         """ Returns a list of all items from this library section.
             See description of :func:`~plexapi.library.LibrarySection.search()` for details about filtering / sorting.
@@ -716,6 +810,15 @@ class LibrarySection(PlexObject):
         key = f'/hubs/sections/{self.key}?includeStations=1'
         return self.fetchItems(key)
 
+    def loadHubs(self, size=None, maxworkers=None, ttl=None):
+        """ Returns a list of available :class:`~plexapi.library.Hub` for this library section with the items of
+            every hub loaded concurrently. See :func:`~plexapi.library.Library.loadHubs` for the parameters.
+        """
+        key = f'/hubs/sections/{self.key}?includeStations=1'
+        if size is not None:
+            key += f'&count={size}'
+        return _loadHubs(self, key, size=size, maxworkers=maxworkers, ttl=ttl)
+
     def agents(self):
         """ Returns a list of available :class:`~plexapi.media.Agent` for this library section.
         """
@@ -1289,7 +1392,7 @@ class LibrarySection(PlexObject):
         return self._server.search(query, mediatype, limit, sectionId=self.key)
 
     def search(self, title=None, sort=None, maxresults=None, libtype=None,
-               container_start=None, container_size=None, limit=None, filters=None, **kwargs):
+               container_start=None, container_size=None, limit=None, filters=None, keepData=None, **kwargs):
         """ Search the library. The http requests will be batched in container_size. If you are only looking for the
             first <num> results, it would be wise to set the maxresults option to that amount so the search doesn't iterate
             over all results on the server.
@@ -1306,6 +1409,8 @@ class LibrarySection(PlexObject):
                 container_size (int, optional): Default X_PLEX_CONTAINER_SIZE in your config file.
                 limit (int, optional): Limit the number of results from the filter.
                 filters (dict, optional): A dictionary of advanced filters. See the details below for more info.
+                keepData (bool, optional): False to detach the raw XML data of each item from the response.
+                    See :func:`~plexapi.base.PlexObject.findItems` for more details.
                 **kwargs (dict): Additional custom filters to apply to the search results.
                     See the details below for more info.
 
@@ -1546,7 +1651,375 @@ class LibrarySection(PlexObject):
         key, kwargs = self._buildSearchKey(
             title=title, sort=sort, libtype=libtype, limit=limit, filters=filters, returnKwargs=True, **kwargs)
         return self.fetchItems(
-            key, container_start=container_start, container_size=container_size, maxresults=maxresults, **kwargs)
+            key, container_start=container_start, container_size=container_size, maxresults=maxresults,
+            keepData=keepData, **kwargs)
+
+    def _scanBoundaries(self, key, field, partitions):
+        """ Returns the sorted unique values of a field which split the search results of the
+            search key into partitions of approximately equal size.
+        """
+        headers = {'X-Plex-Container-Start': '0', 'X-Plex-Container-Size': '0'}
+        data = self._server.query(key, headers=headers)
+        totalSize = utils.cast(int, data.attrib.get('totalSize')) or 0
+        boundaries = set()
+        for i in range(1, partitions):
+            headers = {'X-Plex-Container-Start': str(i * totalSize // partitions), 'X-Plex-Container-Size': '1'}
+            data = self._server.query(key, headers=headers)
+            value = data[0].attrib.get(field) if data is not None and len(data) else None
+            if value:
+                boundaries.add(value)
+        return sorted(boundaries, key=lambda v: int(v) if v.isdigit() else v)
+
+    def _scanPartitionFilters(self, key, field, fieldType, partitions, filters=None):
+        """ Returns the list of search filters for each partition of :func:`~plexapi.library.LibrarySection.scan`. """
+        boundaries = []
+        for value in self._scanBoundaries(key, field, max(int(partitions), 1)):
+            if value.isdigit():
+                value = int(value)
+            elif fieldType == 'date':
+                value = int(utils.toDatetime(value, '%Y-%m-%d').timestamp())
+            else:
+                continue
+            boundaries.append(value)
+
+        def _value(value):
+            return datetime.fromtimestamp(value) if fieldType == 'date' else value
+
+        partitionFilters = []
+        for lower, upper in zip([None] + boundaries, boundaries + [None]):
+            partitionFilter = {}
+            if lower is not None:
+                partitionFilter[f'{field}>>'] = _value(lower - 1)
+            if upper is not None:
+                partitionFilter[f'{field}<<'] = _value(upper)
+            if filters and partitionFilter:
+                partitionFilter = {'and': [filters, partitionFilter]}
+            partitionFilters.append(partitionFilter or filters)
+        return partitionFilters
+
+    def scan(self, partitions=4, libtype=None, field='addedAt', filters=None, executor=None, **kwargs):
+        """ Returns all items in the library by splitting the library into partitions which are fetched
+            concurrently. Each partition is a range of the partition ``field`` (filtered by the Plex server),
+            so items added or removed while scanning only shift the results of their own partition. Each
+            partition is still paged by offset, so an item added to or removed from a partition during the scan
+            can cause an item of that partition to be skipped or returned twice. The results are deduplicated
+            by ratingKey.
+
+            Parameters:
+                partitions (int): The number of partitions to split the library into. Default 4.
+                libtype (str, optional): The library type to return (movie, show, season, episode,
+                    artist, album, track, photoalbum). Default is the main library type.
+                field (str, optional): The date or integer filter field used to partition the library
+                    (e.g. addedAt, year). Items without a value for the field are not returned. Default addedAt.
+                filters (dict, optional): Additional filters to apply. See :func:`~plexapi.library.LibrarySection.search`.
+                executor (:class:`~concurrent.futures.Executor`, optional): Executor used to fetch the partitions.
+                    Default is a thread pool with up to ``plexapi.max_workers`` threads. Objects are picklable, so a
+                    :class:`~concurrent.futures.ProcessPoolExecutor` can be used as long as each worker process
+                    connects to the same :class:`~plexapi.server.PlexServer` with the same token
+                    (see :func:`~plexapi.base.dumps`).
+                **kwargs (dict): Additional search options. See :func:`~plexapi.library.LibrarySection.search`.
+
+            Raises:
+                :exc:`~plexapi.exceptions.BadRequest`: The partition field is not a date or integer field.
+
+            Example:
+
+                .. code-block:: python
+
+                    tracks = plex.library.section('Music').scan(partitions=8, libtype='track')
+
+        """
+        _libtype = libtype or self.TYPE
+        fieldType = next((f.type for f in self.listFields(_libtype) if f.key.split('.')[-1] == field), None)
+        if fieldType not in {'date', 'integer'}:
+            raise BadRequest(f'Partition field "{field}" must be a date or integer filter field for libtype "{_libtype}".')
+
+        key = self._buildSearchKey(sort=f'{field}:asc', libtype=libtype, filters=filters, includeGuids=False)
+        partitionFilters = self._scanPartitionFilters(key, field, fieldType, partitions, filters)
+
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(partitionFilters))) as pool:
+                futures = [pool.submit(self.search, libtype=libtype, filters=f, **kwargs) for f in partitionFilters]
+                results = [future.result() for future in futures]
+        else:
+            futures = [executor.submit(self.search, libtype=libtype, filters=f, **kwargs) for f in partitionFilters]
+            results = [future.result() for future in futures]
+
+        items, seen = [], set()
+        for result in results:
+            for item in result:
+                if item.ratingKey not in seen:
+                    seen.add(item.ratingKey)
+                    items.append(item)
+        return items
+
+    def _searchElements(self, title=None, libtype=None, filters=None, container_size=None, **kwargs):
+        """ Yields the raw XML elements of the search results page by page without building any objects.
+            See :func:`~plexapi.library.LibrarySection.search` for the parameters.
+        """
+        kwargs.setdefault('includeGuids', False)
+        key, kwargs = self._buildSearchKey(
+            title=title, libtype=libtype, filters=filters, returnKwargs=True, **kwargs)
+        container_start = 0
+        container_size = container_size or X_PLEX_CONTAINER_SIZE
+        while True:
+            headers = {'X-Plex-Container-Start': str(container_start), 'X-Plex-Container-Size': str(container_size)}
+            data = self._server.query(key, headers=headers)
+            if data is None or not len(data):
+                break
+            for elem in data:
+                if not kwargs or self._checkAttrs(elem, **kwargs):
+                    yield elem
+            total_size = utils.cast(int, data.attrib.get('totalSize') or data.attrib.get('size')) or 0
+            container_start += container_size
+            if container_start >= total_size:
+                break
+
+    def _aggregateValues(self, attr, **kwargs):
+        """ Yields the numeric values of an XML attribute for each search result. """
+        for elem in self._searchElements(**kwargs):
+            for value in self._getAttrValue(elem, attr):
+                try:
+                    yield float(value) if '.' in value else int(value)
+                except ValueError:
+                    continue
+
+    def count(self, title=None, libtype=None, filters=None, **kwargs):
+        """ Returns the number of items matching a search without loading any items. When only Plex filters are
+            used, the count is returned by the Plex server (``X-Plex-Container-Size=0``) in a single request.
+            PlexAPI operators require streaming the raw XML results to filter the items.
+            See :func:`~plexapi.library.LibrarySection.search` for the parameters.
+
+            Example:
+
+                .. code-block:: python
+
+                    unwatched4K = movies.count(unwatched=True, resolution='4k')
+
+        """
+        key, _kwargs = self._buildSearchKey(
+            title=title, libtype=libtype, filters=filters, includeGuids=False, returnKwargs=True, **kwargs)
+        if _kwargs:
+            return sum(1 for _ in self._searchElements(title=title, libtype=libtype, filters=filters, **kwargs))
+        headers = {'X-Plex-Container-Start': '0', 'X-Plex-Container-Size': '0'}
+        data = self._server.query(key, headers=headers)
+        return utils.cast(int, data.attrib.get('totalSize')) or 0
+
+    def sum(self, attr, **kwargs):
+        """ Returns the sum of a numeric XML attribute over the search results without building any objects.
+
+            Parameters:
+                attr (str): The XML attribute to sum. Nested attributes can be specified using ``__``
+                    (e.g. ``media__part__size``).
+                **kwargs (dict): Search options. See :func:`~plexapi.library.LibrarySection.search`.
+
+            Example:
+
+                .. code-block:: python
+
+                    totalDuration = movies.sum('duration', unwatched=True, resolution='4k')
+                    totalSize = movies.sum('media__part__size')
+
+        """
+        return sum(self._aggregateValues(attr, **kwargs))
+
+    def min(self, attr, **kwargs):
+        """ Returns the minimum of a numeric XML attribute over the search results without building any objects,
+            or None if there are no values. See :func:`~plexapi.library.LibrarySection.sum` for the parameters.
+        """
+        return min(self._aggregateValues(attr, **kwargs), default=None)
+
+    def max(self, attr, **kwargs):
+        """ Returns the maximum of a numeric XML attribute over the search results without building any objects,
+            or None if there are no values. See :func:`~plexapi.library.LibrarySection.sum` for the parameters.
+        """
+        return max(self._aggregateValues(attr, **kwargs), default=None)
+
+    def groupby(self, attr, sumAttr=None, **kwargs):
+        """ Returns a dictionary of the XML attribute values of the search results and the number of
+            items for each value without building any objects.
+
+            Parameters:
+                attr (str): The XML attribute to group by. Nested attributes can be specified using ``__``
+                    (e.g. ``genre__tag``). Items with multiple values are counted in each group.
+                sumAttr (str, optional): A numeric XML attribute to sum for each group instead of counting the items.
+                **kwargs (dict): Search options. See :func:`~plexapi.library.LibrarySection.search`.
+
+            Example:
+
+                .. code-block:: python
+
+                    episodesPerShow = shows.groupby('grandparentTitle', libtype='episode')
+                    durationPerResolution = movies.groupby('media__videoResolution', sumAttr='duration')
+
+        """
+        results = defaultdict(int)
+        for elem in self._searchElements(**kwargs):
+            if sumAttr is None:
+                amount = 1
+            else:
+                amount = 0
+                for value in self._getAttrValue(elem, sumAttr):
+                    try:
+                        amount += float(value) if '.' in value else int(value)
+                    except ValueError:
+                        continue
+            for key in set(self._getAttrValue(elem, attr)) or {None}:
+                results[key] += amount
+        return dict(results)
+
+    def columns(self, fields, numpy=False, **kwargs):
+        """ Returns a :class:`~plexapi.utils.Columns` dictionary of typed arrays of the XML attributes of the
+            search results without building any objects. See :func:`~plexapi.utils.toColumns` for details.
+
+            Parameters:
+                fields (list or dict): List of attribute names, or a dict of attribute names to the column type
+                    (int, float, datetime, bool, or str).
+                numpy (bool): True to return NumPy arrays instead of arrays (requires NumPy).
+                **kwargs (dict): Search options. See :func:`~plexapi.library.LibrarySection.search`.
+
+            Example:
+
+                .. code-block:: python
+
+                    columns = movies.columns({'ratingKey': 'int', 'addedAt': 'datetime', 'Media__videoResolution': 'str'})
+                    resolutions = columns.decode('Media__videoResolution')
+
+        """
+        return utils.toColumns(self._searchElements(**kwargs), fields, numpy=numpy)
+
+    def mediaStats(self, fields, libtype=None, batchSize=None, maxworkers=None, numpy=False, **kwargs):
+        """ Returns a :class:`~plexapi.utils.Columns` dictionary of typed arrays of the media, part, and stream
+            attributes of the items in the section. The full metadata of the items is fetched from
+            ``/library/metadata/<ratingKeys>`` in concurrent batches and the attributes are read directly
+            from the XML without building any objects. See :func:`~plexapi.utils.toColumns` for details.
+
+            Parameters:
+                fields (list or dict): List of attribute names, or a dict of attribute names to the column type
+                    (e.g. ``Media__videoResolution``, ``Media__Part__Stream__codec``).
+                libtype (str, optional): The library type of the items. Default is the main library type
+                    of the section.
+                batchSize (int, optional): Number of items fetched per request.
+                    Default is the ``plexapi.container_size`` config value.
+                maxworkers (int, optional): Maximum number of concurrent requests.
+                    Default is the ``plexapi.max_workers`` config value.
+                numpy (bool): True to return NumPy arrays instead of arrays (requires NumPy).
+                **kwargs (dict): Additional search filters to limit the items.
+                    See :func:`~plexapi.library.LibrarySection.search`.
+
+            Example:
+
+                .. code-block:: python
+
+                    stats = movies.mediaStats({
+                        'Media__videoResolution': 'str',
+                        'Media__bitrate': 'int',
+                        'Media__Part__Stream__streamType': 'int',
+                        'Media__Part__Stream__codec': 'str',
+                        'Media__Part__Stream__bitDepth': 'int',
+                    })
+                    hevc10 = stats.groupby('Media__Part__Stream__codec',
+                                           where={'Media__Part__Stream__streamType': 1, 'Media__Part__Stream__bitDepth': 10})
+                    bitrates = stats.groupby('Media__videoResolution', 'Media__bitrate', agg='mean',
+                                             where={'Media__Part__Stream__streamType': 1})
+
+        """
+        batchSize = batchSize or X_PLEX_CONTAINER_SIZE
+        libtype = libtype or self.METADATA_TYPE
+        ratingKeys = [elem.attrib['ratingKey'] for elem in self._searchElements(libtype=libtype, **kwargs)]
+        batches = [ratingKeys[i:i + batchSize] for i in range(0, len(ratingKeys), batchSize)]
+
+        def _fetch(batch):
+            return self._server.query(f'/library/metadata/{",".join(batch)}')
+
+        def _elements():
+            if not batches:
+                return
+            window = min(maxworkers or MAX_WORKERS, len(batches))
+            with ThreadPoolExecutor(max_workers=window) as pool:
+                pending = deque(pool.submit(_fetch, batch) for batch in batches[:window])
+                for batch in batches[window:]:
+                    data = pending.popleft().result()
+                    pending.append(pool.submit(_fetch, batch))
+                    yield from data
+                while pending:
+                    yield from pending.popleft().result()
+
+        return utils.toColumns(_elements(), fields, numpy=numpy)
+
+    def changesSince(self, watermark=None, libtypes=None, **kwargs):
+        """ Returns the items added, updated, and removed in the library since a previous watermark.
+            Changed items are found with an ``updatedAt`` filter (which also includes newly added items),
+            and removed items are detected by comparing the total item count and, only when the count does not
+            match, the set of ratingKeys with the ratingKeys stored in the watermark.
+
+            Items updated in the same second as the previous watermark may be returned again.
+
+            Parameters:
+                watermark (dict, optional): The watermark returned by the previous call. Default None returns
+                    all items in the library as added.
+                libtypes (list, optional): The library types to check for changes (e.g. ``['show', 'episode']``).
+                    Default is all library types of the section except collections.
+                **kwargs (dict): Additional search filters and options. The same filters must be used for every
+                    call with the watermark. See :func:`~plexapi.library.LibrarySection.search`.
+
+            Returns:
+                dict: Dictionary with the lists of ``added`` and ``updated`` objects, the list of ``removed``
+                ratingKeys, and the new ``watermark`` to use for the next call. The watermark is JSON serializable.
+
+            Example:
+
+                .. code-block:: python
+
+                    changes = tvshows.changesSince()
+                    while True:
+                        time.sleep(60)
+                        changes = tvshows.changesSince(changes['watermark'], libtypes=['show', 'episode'])
+                        for item in changes['added'] + changes['updated']:
+                            index(item)
+                        for ratingKey in changes['removed']:
+                            unindex(ratingKey)
+
+        """
+        if libtypes is None:
+            libtypes = [filterType.type for filterType in self.filterTypes() if filterType.type != 'collection']
+        watermark = watermark or {}
+        updatedAt = watermark.get('updatedAt')
+        previousKeys = watermark.get('ratingKeys', {})
+
+        # the deletion checks use the same filters as the search so the counts of filtered results match
+        baseFilters = kwargs.pop('filters', None)
+        searchOptions = {'sort', 'maxresults', 'container_start', 'container_size', 'limit', 'keepData'}
+        filterKwargs = {key: value for key, value in kwargs.items() if key not in searchOptions}
+        filters = baseFilters
+        if updatedAt:
+            filters = {'updatedAt>>': datetime.fromtimestamp(updatedAt - 1)}
+            filters = {'and': [baseFilters, filters]} if baseFilters else filters
+        added, updated, removed, ratingKeys = [], [], [], {}
+        newUpdatedAt = updatedAt or 0
+
+        for libtype in libtypes:
+            previous = set(previousKeys.get(libtype, [])) if updatedAt else set()
+            current = set(previous)
+            for item in self.search(libtype=libtype, filters=filters, **kwargs):
+                (updated if item.ratingKey in previous else added).append(item)
+                current.add(item.ratingKey)
+                for attr in ('updatedAt', 'addedAt'):
+                    newUpdatedAt = max(newUpdatedAt, utils.cast(int, item._data.attrib.get(attr)) or 0)
+
+            if updatedAt and len(current) != self.count(libtype=libtype, filters=baseFilters, **filterKwargs):
+                elems = self._searchElements(libtype=libtype, filters=baseFilters, **filterKwargs)
+                existing = {utils.cast(int, elem.attrib.get('ratingKey')) for elem in elems}
+                removed.extend(sorted(current - existing))
+                current &= existing
+            ratingKeys[libtype] = sorted(current)
+
+        return {
+            'added': added,
+            'updated': updated,
+            'removed': removed,
+            'watermark': {'updatedAt': newUpdatedAt, 'ratingKeys': ratingKeys},
+        }
 
     def _locations(self):
         """ Returns a list of :class:`~plexapi.library.Location` objects
@@ -1660,6 +2133,73 @@ class LibrarySection(PlexObject):
         """
         return self.search(libtype='collection', **kwargs)
 
+    def reconcileCollections(self, collections, libtype=None, remove=True, locked=True, chunkSize=None, maxworkers=None):
+        """ Reconcile the membership of many regular collections at once. The current members of each collection
+            are loaded concurrently using the collection filter, and the items to add or remove are applied with
+            chunked multi-item collection tag edits (see :func:`~plexapi.library.LibrarySection.bulkEdit`).
+            Collections which do not exist yet are created by adding the collection tag to the items.
+
+            Parameters:
+                collections (dict): Mapping of collection titles to the set of ratingKeys (or objects)
+                    which should be in the collection.
+                libtype (str, optional): The library type of the items in the collections. Default is the main
+                    library type.
+                remove (bool, optional): True to remove the items which are not in the mapping from the
+                    collections (default). False to only add the missing items.
+                locked (bool, optional): True (default) to lock the collection field of the edited items.
+                chunkSize (int, optional): Maximum number of items edited per request.
+                    Default is the ``plexapi.edit_chunk_size`` config value.
+                maxworkers (int, optional): Maximum number of concurrent requests.
+                    Default is the ``plexapi.max_workers`` config value.
+
+            Returns:
+                List: List of ``(ratingKeys, exception)`` tuples for each failed request.
+                An empty list is returned when all of the edits are successful.
+
+            Example:
+
+                .. code-block:: python
+
+                    failures = MovieSection.reconcileCollections({
+                        'Marvel Cinematic Universe': {1234, 1235, 1236},
+                        'James Bond': {2345, 2346},
+                    })
+
+        """
+        libtype = libtype or self.TYPE
+        desired = {
+            title: {utils.cast(int, getattr(item, 'ratingKey', item)) for item in items}
+            for title, items in collections.items()
+        }
+        choices = {choice.title: choice for choice in self.listFilterChoices('collection', libtype)}
+
+        def _members(choice):
+            elems = self._searchElements(libtype=libtype, filters={'collection': choice})
+            return {utils.cast(int, elem.attrib.get('ratingKey')) for elem in elems}
+
+        current = {}
+        existing = [title for title in desired if title in choices]
+        if existing:
+            with ThreadPoolExecutor(max_workers=min(maxworkers or MAX_WORKERS, len(existing))) as pool:
+                for title, members in zip(existing, pool.map(lambda t: _members(choices[t]), existing)):
+                    current[title] = members
+
+        searchType = utils.searchType(libtype)
+        edits = []
+        for title, ratingKeys in desired.items():
+            members = current.get(title, set())
+            added = sorted(ratingKeys - members)
+            removed = sorted(members - ratingKeys) if remove else []
+            if added:
+                kwargs = EditTagsMixin._tagHelper('collection', [title], locked=locked)
+                edits.append((added, {'type': searchType, **kwargs}))
+            if removed:
+                kwargs = EditTagsMixin._tagHelper('collection', [title], locked=locked, remove=True)
+                edits.append((removed, {'type': searchType, **kwargs}))
+            log.debug('Reconciling collection "%s": %s added, %s removed', title, len(added), len(removed))
+
+        return self._editChunks(edits, chunkSize=chunkSize, maxworkers=maxworkers)
+
     def createPlaylist(self, title, items=None, smart=False, limit=None,
                        sort=None, filters=None, m3ufilepath=None, **kwargs):
         """ Alias for :func:`~plexapi.server.PlexServer.createPlaylist` using this
@@ -1745,14 +2285,40 @@ class LibrarySection(PlexObject):
             self._edits.update(kwargs)
             return self
 
-        kwargs['id'] = ','.join(str(item.ratingKey) for item in self._validateItems(items))
-        if 'type' not in kwargs:
-            kwargs['type'] = utils.searchType(items[0].type)
-
-        part = f'/library/sections/{self.key}/all{utils.joinArgs(kwargs)}'
-        self._server.query(part, method=self._server._session.put)
+        items = self._validateItems(items)
+        kwargs.setdefault('type', utils.searchType(items[0].type))
+        failures = self._editChunks([([item.ratingKey for item in items], kwargs)])
+        if failures:
+            ratingKeys, error = failures[0]
+            if len(ratingKeys) == len(items):
+                raise error
+            raise BadRequest(f'Failed to edit {sum(len(keys) for keys, _ in failures)} item(s) '
+                             f'in {len(failures)} request(s): {error}') from error
         return self
 
+    def _editChunks(self, edits, chunkSize=None, maxworkers=None):
+        """ Edits each list of ratingKeys with the edit kwargs (including the search ``type``) in chunks
+            of ratingKeys concurrently. Returns a list of ``(ratingKeys, exception)`` tuples for the failed chunks.
+        """
+        chunkSize = chunkSize or EDIT_CHUNK_SIZE
+        parts = []
+        for ratingKeys, kwargs in edits:
+            kwargs = dict(kwargs)
+            for i in range(0, len(ratingKeys), chunkSize):
+                chunk = ratingKeys[i:i + chunkSize]
+                kwargs['id'] = ','.join(str(ratingKey) for ratingKey in chunk)
+                parts.append((chunk, f'/library/sections/{self.key}/all{utils.joinArgs(kwargs)}'))
+
+        def _put(ratingKeys, part):
+            self._server.query(part, method=self._server._session.put)
+
+        failures = []
+        for (ratingKeys, _), _, error in utils._runJobs(_put, parts, maxworkers=maxworkers):
+            if error is not None:
+                log.warning('Failed to edit items %s: %s', ratingKeys, error)
+                failures.append((ratingKeys, error))
+        return failures
+
     def multiEdit(self, items, **kwargs):
         """ Edit multiple objects at once.
             Note: This is a low level method and you need to know all the field/tag keys.
@@ -1766,6 +2332,329 @@ class LibrarySection(PlexObject):
         """
         return self._edit(items, **kwargs)
 
+    def bulkEdit(self, edits, chunkSize=None, maxworkers=None):
+        """ Edit many objects with different values for each object. Objects with identical edits are
+            grouped together and edited in chunks of ratingKeys with concurrent requests.
+            Note: This is a low level method and you need to know all the field/tag keys.
+
+            Parameters:
+                edits (dict or list): Dict of objects to the dict of settings to edit for each object, or a list
+                    of ``(items, kwargs)`` tuples where items is a list of objects and kwargs is the dict of
+                    settings to edit.
+                chunkSize (int, optional): Maximum number of objects edited per request.
+                    Default is the ``plexapi.edit_chunk_size`` config value.
+                maxworkers (int, optional): Maximum number of concurrent requests.
+                    Default is the ``plexapi.max_workers`` config value.
+
+            Returns:
+                List: List of ``(ratingKeys, exception)`` tuples for each failed request.
+                An empty list is returned when all of the edits are successful.
+
+            Example:
+
+                .. code-block:: python
+
+                    # Set the track number of each track from a dict of {track: number}
+                    failures = MusicSection.bulkEdit({
+                        track: {'index.value': number, 'index.locked': 1}
+                        for track, number in trackNumbers.items()
+                    })
+                    for ratingKeys, error in failures:
+                        print(f'Failed to edit {ratingKeys}: {error}')
+
+        """
+        if isinstance(edits, dict):
+            edits = [([item], kwargs) for item, kwargs in edits.items()]
+
+        groups = {}
+        for items, kwargs in edits:
+            items = items if isinstance(items, list) else [items]
+            groupKey = (items[0].type, utils.joinArgs(dict(sorted(kwargs.items()))))
+            groups.setdefault(groupKey, (kwargs, []))[1].extend(items)
+
+        chunks = []
+        for kwargs, items in groups.values():
+            items = self._validateItems(items)
+            kwargs = {'type': utils.searchType(items[0].type), **kwargs}
+            chunks.append(([item.ratingKey for item in items], kwargs))
+        return self._editChunks(chunks, chunkSize=chunkSize, maxworkers=maxworkers)
+
+    def bulkUpload(self, uploads, maxworkers=None, retries=2):
+        """ Upload posters, background artwork, logos, themes, and subtitles for many objects concurrently.
+            Files are streamed from disk instead of being read into memory, and failed uploads are retried
+            with an increasing delay.
+
+            Parameters:
+                uploads (dict or list): Dict of objects to the dict of uploads for each object, or a list
+                    of ``(item, kwargs)`` tuples. The upload keys are ``poster``, ``art``, ``logo``, ``theme``,
+                    and ``subtitles``, and the values are a URL, a file path, or a file-like object.
+                maxworkers (int, optional): Maximum number of concurrent uploads.
+                    Default is the ``plexapi.max_workers`` config value.
+                retries (int, optional): Number of times to retry a failed upload (default 2).
+
+            Returns:
+                List: List of ``(item, key, exception)`` tuples for each failed upload.
+                An empty list is returned when all of the uploads are successful.
+
+            Example:
+
+                .. code-block:: python
+
+                    failures = MovieSection.bulkUpload({
+                        movie: {'poster': f'/mnt/artwork/{movie.guid}/poster.jpg'}
+                        for movie in MovieSection.all()
+                    }, maxworkers=8)
+                    for item, key, error in failures:
+                        print(f'Failed to upload {key} for {item.title}: {error}')
+
+        """
+        methods = {
+            'poster': 'uploadPoster',
+            'art': 'uploadArt',
+            'logo': 'uploadLogo',
+            'theme': 'uploadTheme',
+            'subtitles': 'uploadSubtitles',
+        }
+        if isinstance(uploads, dict):
+            uploads = uploads.items()
+
+        jobs = []
+        for item, kwargs in uploads:
+            for key, source in kwargs.items():
+                if key not in methods:
+                    raise BadRequest(f'Unknown upload "{key}", must be one of: {", ".join(methods)}.')
+                if not hasattr(item, methods[key]):
+                    raise BadRequest(f'{item.__class__.__name__} does not support uploading {key}.')
+                jobs.append((item, key, source))
+
+        def _upload(item, key, source):
+            return self._upload(item, key, getattr(item, methods[key]), source, retries)
+
+        failures = []
+        for (item, key, _), _, error in utils._runJobs(_upload, jobs, maxworkers=maxworkers):
+            if error is not None:
+                log.warning('Failed to upload %s for %s: %s', key, item.ratingKey, error)
+                failures.append((item, key, error))
+        return failures
+
+    @staticmethod
+    def _upload(item, key, method, source, retries=2):
+        """ Uploads a file or URL with the upload method of an item, retrying failed uploads
+            with an increasing delay.
+        """
+        position = source.tell() if hasattr(source, 'seek') else None
+        for attempt in range(retries + 1):
+            try:
+                if key == 'subtitles':
+                    return method(source)
+                if isinstance(source, str) and source.startswith(('http://', 'https://')):
+                    return method(url=source)
+                return method(filepath=source)
+            except (NotFound, Unauthorized):
+                raise
+            except Exception as e:
+                if attempt == retries:
+                    raise
+                log.debug('Retrying %s upload for %s: %s', key, item.ratingKey, e)
+                time.sleep(2 ** attempt)
+                if position is not None:
+                    source.seek(position)
+
+    def downloadMissingSubtitles(self, language='en', languageCode='eng', libtype=None, items=None,
+                                 hearingImpaired=0, forced=0, minScore=None, pick=None, maxworkers=None,
+                                 rate=None, callback=None, **kwargs):
+        """ Search and download on-demand subtitles for all of the videos in the section which do not have
+            subtitles in a language. The subtitle searches run concurrently and the best match for each video
+            is downloaded. See https://support.plex.tv/articles/subtitle-search/.
+
+            Parameters:
+                language (str, optional): Language code (ISO 639-1) of the subtitles to search for. Default 'en'.
+                languageCode (str, optional): Language code (ISO 639-2) used to find the videos without subtitles
+                    with the ``subtitleLanguage!`` filter. Default 'eng'.
+                libtype (str, optional): The library type of the videos (movie or episode).
+                    Default is the main library type of the section.
+                items (List, optional): List of :class:`~plexapi.video.Video` objects to use instead of searching
+                    the section. Videos with loaded subtitle streams in the language are skipped.
+                hearingImpaired (int, optional): Search option for SDH subtitles.
+                    See :func:`~plexapi.video.Video.searchSubtitles`.
+                forced (int, optional): Search option for forced subtitles.
+                    See :func:`~plexapi.video.Video.searchSubtitles`.
+                minScore (int, optional): Minimum score of the subtitles to download.
+                pick (func, optional): Function called with the video and the list of
+                    :class:`~plexapi.media.SubtitleStream` search results which returns the subtitle to download
+                    or None. Default picks the perfect match or the highest score.
+                maxworkers (int, optional): Maximum number of concurrent searches.
+                    Default is the ``plexapi.max_workers`` config value.
+                rate (float, optional): Maximum number of subtitle searches per second. Default is no limit.
+                callback (func, optional): Function called with the number of completed and total videos
+                    after each video.
+                **kwargs (dict): Additional search filters to limit the videos.
+                    See :func:`~plexapi.library.LibrarySection.search`.
+
+            Returns:
+                dict: Dict with the ``downloaded`` list of ``(video, subtitleStream)`` tuples,
+                the ``missing`` list of videos without a matching subtitle, and the ``failed`` list of
+                ``(video, exception)`` tuples.
+
+            Example:
+
+                .. code-block:: python
+
+                    results = MovieSection.downloadMissingSubtitles(
+                        language='fr', languageCode='fra', minScore=90, rate=2,
+                        callback=lambda done, total: print(f'{done}/{total}', end='\\r'))
+                    print(f'Downloaded {len(results["downloaded"])} subtitles')
+
+        """
+        def _pick(video, subtitles):
+            subtitles = [sub for sub in subtitles if minScore is None or (sub.score or 0) >= minScore]
+            return max(subtitles, key=lambda sub: (bool(sub.perfectMatch), sub.score or 0), default=None)
+
+        pick = pick or _pick
+        if items is None:
+            filters = kwargs.pop('filters', {})
+            filters = {'and': [filters, {'subtitleLanguage!': languageCode}]} if filters else \
+                {'subtitleLanguage!': languageCode}
+            items = self.search(libtype=libtype or self.METADATA_TYPE, filters=filters, **kwargs)
+        videos = [(video,) for video in items if not self._hasSubtitles(video, languageCode)]
+
+        rateLimit = utils._rateLimiter(rate)
+
+        def _search(video):
+            rateLimit()
+            subtitles = video.searchSubtitles(language=language, hearingImpaired=hearingImpaired, forced=forced)
+            subtitle = pick(video, subtitles)
+            if subtitle is not None:
+                video.downloadSubtitles(subtitle)
+            return subtitle
+
+        results = {'downloaded': [], 'missing': [], 'failed': []}
+        jobs = utils._runJobs(_search, videos, maxworkers=maxworkers)
+        for completed, ((video,), subtitle, error) in enumerate(jobs, start=1):
+            if error is not None:
+                log.warning('Failed to download subtitles for %s: %s', video.ratingKey, error)
+                results['failed'].append((video, error))
+            elif subtitle is None:
+                results['missing'].append(video)
+            else:
+                results['downloaded'].append((video, subtitle))
+            if callback:
+                callback(completed, len(videos))
+        return results
+
+    @staticmethod
+    def _hasSubtitles(video, languageCode):
+        """ Returns True if the loaded streams of the video include a subtitle stream in the language. """
+        for elem in video._data.iter('Stream'):
+            if elem.attrib.get('streamType') == '3' and elem.attrib.get('languageCode') == languageCode:
+                return True
+        return False
+
+    def matchUnmatched(self, agent=None, minScore=95, libtype=None, items=None, apply=True, cache=None,
+                       maxworkers=None, rate=None, reviewPath=None, callback=None, **kwargs):
+        """ Search for metadata matches of all of the unmatched items in the section and fix the match of the
+            items with a match above a score threshold. The match searches run concurrently and are cached by
+            ``(agent, title, year)`` so items with the same title and year (e.g. editions) are only searched once.
+
+            Parameters:
+                agent (str, optional): Agent name to be used (imdb, thetvdb, themoviedb, etc.).
+                    Default is the agent of the section.
+                minScore (int, optional): Minimum score (0 to 100) of the best match to fix automatically. Default 95.
+                libtype (str, optional): The library type of the items. Default is the main library type
+                    of the section (e.g. ``show`` for a TV show section).
+                items (List, optional): List of items to match instead of searching the section for
+                    unmatched items.
+                apply (bool, optional): True to fix the matches above the score threshold (default).
+                    False to only return the matches.
+                cache (dict, optional): Dict to cache the lists of :class:`~plexapi.media.SearchResult` by
+                    ``(agent, title, year)``. Pass the same dict to later calls to reuse the results.
+                maxworkers (int, optional): Maximum number of concurrent searches.
+                    Default is the ``plexapi.max_workers`` config value.
+                rate (float, optional): Maximum number of match searches per second. Default is no limit.
+                reviewPath (str, optional): Path to export the items to review as a JSON file.
+                callback (func, optional): Function called with the number of completed and total items
+                    after each item.
+                **kwargs (dict): Additional search filters to limit the items.
+                    See :func:`~plexapi.library.LibrarySection.search`.
+
+            Returns:
+                dict: Dict with the ``matched`` list of ``(item, searchResult)`` tuples, the ``review`` list
+                of ``(item, searchResults)`` tuples without a match above the score threshold, and the
+                ``failed`` list of ``(item, exception)`` tuples.
+
+            Example:
+
+                .. code-block:: python
+
+                    results = MovieSection.matchUnmatched(minScore=98, rate=5, reviewPath='review.json')
+                    print(f'Matched {len(results["matched"])}, {len(results["review"])} to review')
+
+        """
+        cache = {} if cache is None else cache
+        if items is None:
+            filters = kwargs.pop('filters', {})
+            filters = {'and': [filters, {'unmatched': True}]} if filters else {'unmatched': True}
+            items = self.search(libtype=libtype or self.TYPE, filters=filters, **kwargs)
+        sectionAgent = utils.getAgentIdentifier(self, agent) if agent else self.agent
+        rateLimit = utils._rateLimiter(rate)
+        lock = Lock()
+        inflight = {}
+
+        def _search(item, title, year):
+            rateLimit()
+            return item.matches(agent=sectionAgent if agent else None, title=title, year=year, language=self.language)
+
+        def _matches(item):
+            title = item._data.attrib.get('title', '')
+            year = item._data.attrib.get('year', '')
+            cacheKey = (sectionAgent, title.lower(), year)
+            return utils._cachedCall(cache, inflight, lock, cacheKey, _search, item, title, year)
+
+        def _match(item):
+            searchResults = sorted(_matches(item), key=lambda result: result.score or 0, reverse=True)
+            if searchResults and (searchResults[0].score or 0) >= minScore:
+                if apply:
+                    item.fixMatch(searchResults[0])
+                return searchResults[0], searchResults
+            return None, searchResults
+
+        results = {'matched': [], 'review': [], 'failed': []}
+        jobs = utils._runJobs(_match, [(item,) for item in items], maxworkers=maxworkers)
+        for completed, ((item,), result, error) in enumerate(jobs, start=1):
+            if error is not None:
+                log.warning('Failed to match %s: %s', item.ratingKey, error)
+                results['failed'].append((item, error))
+            elif result[0] is None:
+                results['review'].append((item, result[1]))
+            else:
+                results['matched'].append((item, result[0]))
+            if callback:
+                callback(completed, len(items))
+
+        if reviewPath:
+            self._exportMatchReview(results['review'], reviewPath)
+        return results
+
+    @staticmethod
+    def _exportMatchReview(review, path):
+        """ Writes the ``(item, searchResults)`` tuples to review from
+            :func:`~plexapi.library.LibrarySection.matchUnmatched` to a JSON file.
+        """
+        review = [
+            {
+                'ratingKey': item.ratingKey,
+                'title': item._data.attrib.get('title'),
+                'year': utils.cast(int, item._data.attrib.get('year')),
+                'matches': [
+                    {'guid': result.guid, 'name': result.name, 'year': result.year, 'score': result.score}
+                    for result in searchResults
+                ],
+            }
+            for item, searchResults in review
+        ]
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(review, handle, indent=2)
+
     def batchMultiEdits(self, items):
         """ Enable batch multi-editing mode to save API calls.
             Must call :func:`~plexapi.library.LibrarySection.saveMultiEdits` at the end to save all the edits.
@@ -2254,6 +3143,18 @@ class Hub(PlexObject):
         """ Returns a list of all items in the hub. """
         return self._items
 
+    def _prefetch(self, size=None):
+        """ Loads up to size items (or all items) of the hub into the items cache. """
+        partialItems = self._partialItems
+        if self.more and self.key and (size is None or len(partialItems) < size):
+            items = self.fetchItems(self.key, maxresults=size)
+            self.more = size is not None and len(items) == size
+        else:
+            items = partialItems[:size] if size is not None else partialItems
+        self.size = len(items)
+        self._items = items
+        return self
+
     @cached_data_property
     def _section(self):
         """ Cache for section. """
@@ -3222,9 +4123,9 @@ class Path(PlexObject):
         """ Alias for :func:`~plexapi.server.PlexServer.browse`. """
         return self._server.browse(self, includeFiles)
 
-    def walk(self):
+    def walk(self, **kwargs):
         """ Alias for :func:`~plexapi.server.PlexServer.walk`. """
-        for path, paths, files in self._server.walk(self):
+        for path, paths, files in self._server.walk(self, **kwargs):
             yield path, paths, files
 
 
@@ -3389,3 +4290,108 @@ class Common(PlexObject):
     def items(self):
         """ Returns a list of the common items. """
         return self._server.fetchItems(self.ratingKeys)
+
+
+class GuidIndex:
+    """ Persistent index of the Plex, IMDB, TMDB, and TVDB guids to ratingKeys of the items in a
+        :class:`~plexapi.library.LibrarySection`. The index is built from the library search results
+        including guids and refreshed incrementally with the items updated since the last refresh.
+        See :func:`~plexapi.library.LibrarySection.guidIndex`.
+
+        Parameters:
+            section (:class:`~plexapi.library.LibrarySection`): The library section to index.
+            path (str, optional): The file path to load and save the index.
+
+        Attributes:
+            path (str): The file path to persist the index.
+            updatedAt (int): Timestamp of the most recently updated item in the index.
+            guids (dict): Mapping of guids to ratingKeys.
+            ratingKeys (dict): Mapping of ratingKeys to a list of guids.
+    """
+    VERSION = 1
+
+    def __init__(self, section, path=None):
+        self._section = section
+        self.path = path
+        self.updatedAt = 0
+        self.guids = {}
+        self.ratingKeys = {}
+        if path and os.path.exists(path):
+            self.load()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self._section.title}:{len(self.ratingKeys)}>'
+
+    def __contains__(self, guid):
+        return guid in self.guids
+
+    def __len__(self):
+        return len(self.ratingKeys)
+
+    def get(self, guid):
+        """ Returns the ratingKey for the specified guid or None if the guid is not in the index. """
+        return self.guids.get(guid)
+
+    def add(self, ratingKey, guids):
+        """ Adds or replaces the guids for a ratingKey in the index. """
+        self.remove(ratingKey)
+        self.ratingKeys[ratingKey] = guids
+        for guid in guids:
+            self.guids[guid] = ratingKey
+
+    def remove(self, ratingKey):
+        """ Removes a ratingKey and its guids from the index. """
+        for guid in self.ratingKeys.pop(ratingKey, []):
+            if self.guids.get(guid) == ratingKey:
+                del self.guids[guid]
+
+    def refresh(self, full=False):
+        """ Refreshes the index with the items updated since the last refresh and saves the index.
+            A full rebuild is done if items have been removed from the library.
+
+            Parameters:
+                full (bool, optional): True to rebuild the entire index.
+        """
+        filters = None
+        if not full and self.updatedAt:
+            filters = {'updatedAt>>': datetime.fromtimestamp(self.updatedAt - 1)}
+        else:
+            self.guids, self.ratingKeys, self.updatedAt = {}, {}, 0
+
+        for elem in self._section._searchElements(filters=filters, includeGuids=True):
+            ratingKey = utils.cast(int, elem.attrib.get('ratingKey'))
+            guids = [elem.attrib.get('guid')] + [guid.attrib.get('id') for guid in elem.iter('Guid')]
+            self.add(ratingKey, [guid for guid in guids if guid])
+            self.updatedAt = max(self.updatedAt, utils.cast(int, elem.attrib.get('updatedAt')) or 0)
+
+        if filters and len(self.ratingKeys) != self._section.count():
+            return self.refresh(full=True)
+        self.save()
+        return self
+
+    def load(self):
+        """ Loads the index from the file path. """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as handle:
+                data = json.load(handle)
+        except (OSError, ValueError) as e:
+            log.warning('Failed to load guid index %s: %s', self.path, e)
+            return self
+        if data.get('version') != self.VERSION:
+            return self
+        self.updatedAt = data.get('updatedAt', 0)
+        for ratingKey, guids in data.get('ratingKeys', {}).items():
+            self.add(int(ratingKey), guids)
+        return self
+
+    def save(self):
+        """ Saves the index to the file path. """
+        if not self.path:
+            return self
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        data = {'version': self.VERSION, 'updatedAt': self.updatedAt, 'ratingKeys': self.ratingKeys}
+        tmppath = f'{self.path}.tmp'
+        with open(tmppath, 'w', encoding='utf-8') as handle:
+            json.dump(data, handle)
+        os.replace(tmppath, self.path)
+        return self
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
+import os
 from pathlib import Path
 from urllib.parse import quote_plus
 from xml.etree import ElementTree
 
-from plexapi import log, settings, utils
+from plexapi import CACHE_DIR, log, settings, utils
 from plexapi.base import PlexObject, cached_data_property
+from plexapi.bif import BIF
 from plexapi.exceptions import BadRequest
 from plexapi.utils import deprecated
 
@@ -173,6 +175,35 @@ class MediaPart(PlexObject):
         """ Returns True if the media part has generated preview (BIF) thumbnails. """
         return self.indexes == 'sd'
 
+    def previewThumbnails(self, savepath=None, refresh=False):
+        """ Downloads the preview (BIF) thumbnails of the media part once and returns a memory-mapped
+            :class:`~plexapi.bif.BIF` reader to get the thumbnail for any timestamp without additional requests.
+
+            Parameters:
+                savepath (str, optional): Directory to save the BIF file. The file is named by the server, the part,
+                    and the ``updatedAt`` version of the item, so a file from before the item was analyzed again
+                    is not reused. Default is the ``bif`` directory in the ``plexapi.cache_dir`` config value.
+                refresh (bool, optional): True to download the BIF file again if it was already downloaded.
+
+            Raises:
+                :exc:`~plexapi.exceptions.BadRequest`: The media part does not have preview thumbnails.
+        """
+        if not self.hasPreviewThumbnails:
+            raise BadRequest('Media part does not have preview thumbnails.')
+        savepath = savepath or os.path.join(CACHE_DIR, 'bif')
+        # part ids are only unique per server, and the thumbnails are regenerated when the item is analyzed
+        media = self._parent() if self._parent else None
+        item = media._parent() if media is not None and media._parent else None
+        updatedAt = item._data.attrib.get('updatedAt') if item is not None and item._data is not None else None
+        filename = f'{self._server.machineIdentifier}.{self.id}.{self.indexes}'
+        filename += f'.{updatedAt}.bif' if updatedAt else '.bif'
+        filepath = os.path.join(savepath, filename)
+        if refresh or not os.path.isfile(filepath):
+            url = self._server.url(f'/library/parts/{self.id}/indexes/{self.indexes}')
+            filepath = utils.download(
+                url, self._server._token, filename=filename, savepath=savepath, session=self._server._session)
+        return BIF(filepath)
+
     def videoStreams(self):
         """ Returns a list of :class:`~plexapi.media.VideoStream` objects in this MediaPart. """
         return [stream for stream in self.streams if isinstance(stream, VideoStream)]
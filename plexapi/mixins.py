@@ -6,7 +6,7 @@ from urllib.parse import parse_qsl, quote, quote_plus, unquote, urlencode, urlsp
 
 from plexapi import media, settings, utils
 from plexapi.exceptions import BadRequest, NotFound
-from plexapi.utils import deprecated, openOrRead
+from plexapi.utils import deprecated, openFile
 
 
 class AdvancedSettingsMixin:
@@ -389,8 +389,8 @@ class ArtMixin(ArtUrlMixin, ArtLockMixin):
             self._server.query(key, method=self._server._session.post)
         elif filepath:
             key = f'/library/metadata/{self.ratingKey}/arts'
-            data = openOrRead(filepath)
-            self._server.query(key, method=self._server._session.post, data=data)
+            with openFile(filepath) as data:
+                self._server.query(key, method=self._server._session.post, data=data)
         return self
 
     def setArt(self, art):
@@ -444,8 +444,8 @@ class LogoMixin(LogoUrlMixin, LogoLockMixin):
             self._server.query(key, method=self._server._session.post)
         elif filepath:
             key = f'/library/metadata/{self.ratingKey}/clearLogos'
-            data = openOrRead(filepath)
-            self._server.query(key, method=self._server._session.post, data=data)
+            with openFile(filepath) as data:
+                self._server.query(key, method=self._server._session.post, data=data)
         return self
 
     def setLogo(self, logo):
@@ -506,8 +506,8 @@ class PosterMixin(PosterUrlMixin, PosterLockMixin):
             self._server.query(key, method=self._server._session.post)
         elif filepath:
             key = f'/library/metadata/{self.ratingKey}/posters'
-            data = openOrRead(filepath)
-            self._server.query(key, method=self._server._session.post, data=data)
+            with openFile(filepath) as data:
+                self._server.query(key, method=self._server._session.post, data=data)
         return self
 
     def setPoster(self, poster):
@@ -565,8 +565,8 @@ class ThemeMixin(ThemeUrlMixin, ThemeLockMixin):
             self._server.query(key, method=self._server._session.post, timeout=timeout)
         elif filepath:
             key = f'/library/metadata/{self.ratingKey}/themes'
-            data = openOrRead(filepath)
-            self._server.query(key, method=self._server._session.post, data=data, timeout=timeout)
+            with openFile(filepath) as data:
+                self._server.query(key, method=self._server._session.post, data=data, timeout=timeout)
         return self
 
     def setTheme(self, theme):
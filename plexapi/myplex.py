@@ -257,7 +257,7 @@ class MyPlexAccount(PlexObject):
             return response.json()
         elif 'text/plain' in response.headers.get('Content-Type', ''):
             return response.text.strip()
-        return utils.parseXMLString(response.text)
+        return utils.parseXML(response.content)
 
     def ping(self):
         """ Ping the Plex.tv API.
@@ -1894,7 +1894,7 @@ class MyPlexPinLogin:
             codename = codes.get(response.status_code)[0]
             errtext = response.text.replace('\n', ' ')
             raise BadRequest(f'({response.status_code}) {codename} {response.url}; {errtext}')
-        return utils.parseXMLString(response.text)
+        return utils.parseXML(response.content)
 
 
 def _connect(cls, url, token, session, timeout, results, i, job_is_done_event=None):
@@ -5,6 +5,7 @@ from urllib.parse import quote_plus
 
 from plexapi import media, utils, video
 from plexapi.base import Playable, PlexPartialObject, PlexSession, cached_data_property
+from plexapi.download import DownloadManager
 from plexapi.exceptions import BadRequest
 from plexapi.mixins import (
     RatingMixin,
@@ -127,22 +128,31 @@ class Photoalbum(
         """ Alias to :func:`~plexapi.photo.Photoalbum.photo`. """
         return self.episode(title)
 
-    def download(self, savepath=None, keep_original_name=False, subfolders=False):
-        """ Download all photos and clips from the photo album. See :func:`~plexapi.base.Playable.download` for details.
+    def download(self, savepath=None, keep_original_name=False, subfolders=False, maxworkers=None, resume=True):
+        """ Download all photos and clips from the photo album concurrently.
+            See :func:`~plexapi.base.Playable.download` for details.
 
             Parameters:
                 savepath (str): Defaults to current working dir.
                 keep_original_name (bool): True to keep the original filename otherwise
                     a friendlier filename is generated.
                 subfolders (bool): True to separate photos/clips in to photo album folders.
+                maxworkers (int): Maximum number of concurrent downloads.
+                    Default is the ``plexapi.max_workers`` config value.
+                resume (bool): True to skip files which are already downloaded and resume partially
+                    downloaded files (default). False to always download the entire file.
         """
-        filepaths = []
+        manager = DownloadManager(maxworkers, resume=resume)
+        self._addDownloads(manager, savepath, keep_original_name, subfolders)
+        return manager.download()
+
+    def _addDownloads(self, manager, savepath=None, keep_original_name=False, subfolders=False):
+        """ Adds the photos and clips from the photo album and its sub-albums to the download manager. """
         for album in self.albums():
             _savepath = os.path.join(savepath, album.title) if subfolders else savepath
-            filepaths += album.download(_savepath, keep_original_name)
+            album._addDownloads(manager, _savepath, keep_original_name)
         for photo in self.photos() + self.clips():
-            filepaths += photo.download(savepath, keep_original_name)
-        return filepaths
+            manager.add(photo, savepath, keep_original_name)
 
     def _getWebURL(self, base=None):
         """ Get the Plex Web URL with the correct parameters. """
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import re
+from collections import defaultdict, deque
 from itertools import groupby
 from pathlib import Path
 from urllib.parse import quote_plus, unquote
@@ -306,6 +307,90 @@ class Playlist(
         self._server.query(key, method=self._server._session.put)
         return self
 
+    def syncTo(self, items):
+        """ Synchronize the playlist to the specified ordered list of items using the minimal number of requests.
+            Items which are no longer in the list are removed, new items are added in batched requests,
+            and only the items which are out of order are moved.
+
+            Parameters:
+                items (List): Ordered list of :class:`~plexapi.audio.Audio`, :class:`~plexapi.video.Video`,
+                    or :class:`~plexapi.photo.Photo` objects the playlist should contain.
+
+            Raises:
+                :class:`plexapi.exceptions.BadRequest`: When trying to sync a smart playlist.
+
+            Example:
+
+                .. code-block:: python
+
+                    tracks = [music.get(artist).track(title) for artist, title in externalPlaylist]
+                    playlist.syncTo(tracks)
+
+        """
+        if self.smart:
+            raise BadRequest('Cannot sync items in a smart playlist.')
+
+        items = list(items)
+        self._syncRemoveAdd(items)
+        self._syncMove(items)
+        return self
+
+    @staticmethod
+    def _syncKey(item):
+        return getattr(item._server, 'machineIdentifier', None), item.ratingKey
+
+    def _syncMatches(self, items):
+        """ Matches each existing playlist item to the next unmatched position of the same item in the list of
+            items. Returns a list of ``(position, playlistItem)`` tuples and the list of unmatched playlist items.
+        """
+        positions = defaultdict(deque)
+        for index, item in enumerate(items):
+            positions[self._syncKey(item)].append(index)
+
+        matched, unmatched = [], []
+        for item in self.items():
+            itemPositions = positions.get(self._syncKey(item))
+            if itemPositions:
+                matched.append((itemPositions.popleft(), item))
+            else:
+                unmatched.append(item)
+        return matched, unmatched
+
+    def _syncRemoveAdd(self, items):
+        """ Removes the playlist items which are not in the list of items and adds the new items. """
+        matched, removed = self._syncMatches(items)
+        if removed and not matched:
+            self._server.query(f'{self.key}/items', method=self._server._session.delete)
+        else:
+            for item in removed:
+                self._server.query(f'{self.key}/items/{item.playlistItemID}', method=self._server._session.delete)
+
+        matched = {index for index, _ in matched}
+        added = [item for index, item in enumerate(items) if index not in matched]
+        if added:
+            self.addItems(added)
+        if removed or added:
+            self._invalidateCachedProperties()
+
+    def _syncMove(self, items):
+        """ Moves the playlist items which are not in the longest run of items already in the correct order. """
+        synced, _ = self._syncMatches(items)
+        inOrder = utils.longestIncreasingSubsequence([index for index, _ in synced])
+        inOrder = {synced[i][1].playlistItemID for i in inOrder}
+
+        moved, previous = False, None
+        for _, item in sorted(synced, key=lambda pair: pair[0]):
+            if item.playlistItemID not in inOrder:
+                key = f'{self.key}/items/{item.playlistItemID}/move'
+                if previous is not None:
+                    key += f'?after={previous.playlistItemID}'
+                self._server.query(key, method=self._server._session.put)
+                moved = True
+            previous = item
+
+        if moved:
+            self._invalidateCachedProperties()
+
     def updateFilters(self, limit=None, sort=None, filters=None, **kwargs):
         """ Update the filters for a smart playlist.
 
@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
+import json
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from fnmatch import fnmatch
 from urllib.parse import urlencode
+from xml.etree.ElementTree import Element
 
 import requests
 
 from plexapi import BASE_HEADERS, CONFIG, TIMEOUT, log, logfilter
 from plexapi import utils
 from plexapi.alert import AlertListener
-from plexapi.base import PlexObject, cached_data_property
+from plexapi.base import SERVERS, PlexObject, _lookupServer, _serverKey, cached_data_property
 from plexapi.client import PlexClient
 from plexapi.collection import Collection
 from plexapi.exceptions import BadRequest, NotFound, Unauthorized
@@ -27,6 +31,9 @@ from plexapi import photo as _photo  # noqa: F401
 from plexapi import playlist as _playlist  # noqa: F401
 from plexapi import video as _video  # noqa: F401
 
+# Attributes of the directory listings stored in the PlexServer.walk cache file
+_WALK_CACHE_ATTRS = {Path: ('key', 'path', 'title', 'home', 'network'), File: ('key', 'path', 'title')}
+
 
 class PlexServer(PlexObject):
     """ This is the main entry point to interacting with a Plex server. It allows you to
@@ -110,6 +117,13 @@ class PlexServer(PlexObject):
         self._timeout = timeout or TIMEOUT
         data = self.query(self.key, timeout=self._timeout)
         super(PlexServer, self).__init__(self, data, self.key)
+        SERVERS[_serverKey(self)] = self
+
+    def __reduce__(self):
+        """ Pickle the server by reference only. Loading requires a connected server with the
+            same machineIdentifier and token (only a hash of the token is pickled).
+        """
+        return (_lookupServer, (_serverKey(self), True))
 
     def _loadData(self, data):
         """ Load attribute values from Plex XML response. """
@@ -361,7 +375,7 @@ class PlexServer(PlexObject):
         key += f'?includeFiles={int(includeFiles)}'  # starting with PMS v1.32.7.7621 this must set explicitly
         return self.fetchItems(key)
 
-    def walk(self, path=None):
+    def walk(self, path=None, maxdepth=None, include=None, exclude=None, maxworkers=1, cache=None):
         """ Walk the system file tree using the Plex API similar to `os.walk`.
             Yields a 3-tuple `(path, paths, files)` where
             `path` is a string of the directory path,
@@ -370,23 +384,121 @@ class PlexServer(PlexObject):
 
             Parameters:
                 path (:class:`~plexapi.library.Path` or str, optional): Full path to walk.
+                maxdepth (int, optional): Maximum depth of sub-directories to walk (0 only lists the path).
+                    Default walks the entire tree.
+                include (str or list, optional): Shell-style pattern(s) (see :mod:`fnmatch`) of the full file
+                    paths to include in `files`. Directories are always walked.
+                exclude (str or list, optional): Shell-style pattern(s) of the full paths of directories and
+                    files to exclude. Excluded directories are not walked.
+                maxworkers (int, optional): Maximum number of directories to browse concurrently. When greater
+                    than 1, the directories are yielded in the order they are browsed instead of top-down order.
+                    Default 1.
+                cache (dict or str, optional): Dictionary or JSON file path used to cache the directory listings
+                    between walks. Cached directories are not browsed again, so the cache must be cleared
+                    (or the file deleted) to pick up changes on disk.
+
+            Example:
+
+                .. code-block:: python
+
+                    for path, paths, files in plex.walk('/media/Movies', include='*.mkv', exclude='*/@eaDir',
+                                                        maxworkers=8, cache='walk.cache'):
+                        print(path, len(files))
+
         """
-        paths = []
-        files = []
-        for item in self.browse(path):
-            if isinstance(item, Path):
-                paths.append(item)
-            elif isinstance(item, File):
-                files.append(item)
+        include = [include] if isinstance(include, str) else include
+        exclude = [exclude] if isinstance(exclude, str) else exclude
+        cachePath, listings = None, cache
+        if isinstance(cache, str):
+            cachePath, listings = cache, self._loadWalkCache(cache)
 
-        if isinstance(path, Path):
-            path = path.path
+        def _browse(_path):
+            return self._walkBrowse(_path, listings, include, exclude)
 
-        yield path or '', paths, files
+        try:
+            yield from self._walkTree(_browse, path, maxdepth, maxworkers)
+        finally:
+            if cachePath:
+                self._saveWalkCache(cachePath, listings)
+
+    def _loadWalkCache(self, path):
+        """ Returns the directory listings of :func:`~plexapi.server.PlexServer.walk` from a JSON cache file. """
+        listings = {}
+        if not os.path.exists(path):
+            return listings
+        with open(path, 'r', encoding='utf-8') as handle:
+            data = json.load(handle)
+        for key, entries in data.items():
+            listings[key] = []
+            for entry in entries:
+                cls = Path if entry.get('type') == 'path' else File
+                attrib = {attr: str(entry[attr]) for attr in _WALK_CACHE_ATTRS[cls] if entry.get(attr) is not None}
+                listings[key].append(cls(self, Element(cls.TAG, attrib), initpath=key))
+        return listings
+
+    def _saveWalkCache(self, path, listings):
+        """ Saves the directory listings of :func:`~plexapi.server.PlexServer.walk` to a JSON cache file. """
+        data = {}
+        for key, items in listings.items():
+            data[key] = []
+            for item in items:
+                entry = {'type': 'path' if isinstance(item, Path) else 'file'}
+                for attr in _WALK_CACHE_ATTRS[type(item)]:
+                    value = getattr(item, attr, None)
+                    entry[attr] = int(value) if isinstance(value, bool) else value
+                data[key].append(entry)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(data, handle)
+
+    def _walkBrowse(self, path, listings=None, include=None, exclude=None):
+        """ Returns the filtered lists of :class:`~plexapi.library.Path` and :class:`~plexapi.library.File`
+            objects in a directory for :func:`~plexapi.server.PlexServer.walk`.
+        """
+        def _excluded(_path, patterns):
+            return any(fnmatch(_path, pattern) for pattern in patterns or [])
 
-        for _path in paths:
-            for path, paths, files in self.walk(_path):
-                yield path, paths, files
+        key = path.key if isinstance(path, Path) else (path or '')
+        if listings is not None and key in listings:
+            items = listings[key]
+        else:
+            items = self.browse(path)
+            if listings is not None:
+                listings[key] = items
+        paths = [item for item in items if isinstance(item, Path) and not _excluded(item.path, exclude)]
+        files = [
+            item for item in items if isinstance(item, File)
+            and not _excluded(item.path, exclude) and (not include or _excluded(item.path, include))
+        ]
+        return paths, files
+
+    @staticmethod
+    def _walkTree(browse, path, maxdepth=None, maxworkers=1):
+        """ Yields the ``(path, paths, files)`` tuples of the directories browsed with the browse function
+            top-down, or concurrently in the order they are browsed when ``maxworkers`` is greater than 1.
+        """
+        def _result(_path, depth, paths, files):
+            children = [(child, depth + 1) for child in paths] if maxdepth is None or depth < maxdepth else []
+            return (_path.path if isinstance(_path, Path) else _path) or '', paths, files, children
+
+        if maxworkers <= 1:
+            stack = [(path, 0)]
+            while stack:
+                _path, depth = stack.pop()
+                _path, paths, files, children = _result(_path, depth, *browse(_path))
+                yield _path, paths, files
+                stack.extend(reversed(children))
+            return
+
+        with ThreadPoolExecutor(max_workers=maxworkers) as pool:
+            pending = {pool.submit(browse, path): (path, 0)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _path, paths, files, children = _result(*pending.pop(future), *future.result())
+                    for child, depth in children:
+                        pending[pool.submit(browse, child)] = (child, depth)
+                    yield _path, paths, files
 
     def isBrowsable(self, path):
         """ Returns True if the Plex server can browse the given path.
@@ -771,7 +883,7 @@ class PlexServer(PlexObject):
                 raise NotFound(message)
             else:
                 raise BadRequest(message)
-        return utils.parseXMLString(response.text)
+        return utils.parseXML(response.content)
 
     def search(self, query, mediatype=None, limit=None, sectionId=None):
         """ Returns a list of media items or filter categories from the resulting
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+The :class:`~plexapi.streaming.StreamFetcher` downloads a transcoded HLS or DASH stream from the
+universal transcoder by parsing the playlist or manifest and fetching the segments concurrently,
+instead of reading the stream at playback speed. The transcode session is kept alive with periodic
+pings while the segments are fetched and stopped when the fetcher is closed.
+
+.. code-block:: python
+
+    from plexapi.streaming import StreamFetcher
+
+    url = movie.getStreamURL(protocol='hls', videoResolution='1280x720', maxVideoBitrate=4000)
+    with StreamFetcher(url, plex._token, session=plex._session, window=8) as fetcher:
+        filepath = fetcher.download(filename='movie.ts', savepath='/tmp')
+
+"""
+import math
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Thread
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse
+from uuid import uuid4
+
+import requests
+
+from plexapi import MAX_WORKERS, TIMEOUT, log, utils
+from plexapi.exceptions import BadRequest
+
+
+class StreamFetcher:
+    """ Fetches the segments of a transcoded HLS or DASH stream concurrently.
+
+        Parameters:
+            url (str): The stream URL returned by :func:`~plexapi.base.Playable.getStreamURL`
+                with ``protocol='hls'`` or ``protocol='dash'``.
+            token (str): Plex auth token to include in headers.
+            session (requests.Session, optional): Session used for the requests.
+            window (int, optional): Maximum number of segments fetched ahead concurrently.
+                Default is the ``plexapi.max_workers`` config value.
+            pingInterval (int, optional): Number of seconds between the keep-alive pings of the transcode
+                session (default 30).
+            representation (str or int, optional): The ``id`` or index of the DASH representation to fetch.
+                Plex serves the video and audio of a DASH stream as separate representations.
+                Default is the first representation.
+            stallTimeout (int, optional): Number of seconds to wait for new segments of an HLS playlist which
+                has not ended before raising :exc:`~plexapi.exceptions.BadRequest` (default 60).
+
+        Attributes:
+            protocol (str): ``hls`` or ``dash``.
+            sessionKey (str): The transcode session identifier.
+    """
+
+    def __init__(self, url, token, session=None, window=None, pingInterval=30, representation=None,
+                 stallTimeout=60):
+        parsed = urlparse(url)
+        params = dict(parse_qsl(parsed.query))
+        self.sessionKey = params.setdefault('session', uuid4().hex)
+        self.url = parsed._replace(query=urlencode(params)).geturl()
+        self.protocol = 'dash' if parsed.path.endswith('.mpd') else 'hls'
+        self._baseurl = f'{parsed.scheme}://{parsed.netloc}{parsed.path.split("/:/")[0]}'
+        self._token = token
+        self._session = session or requests.Session()
+        self.window = window or MAX_WORKERS
+        self.pingInterval = pingInterval
+        self.representation = representation
+        self.stallTimeout = stallTimeout
+        self._stopped = Event()
+        self._pinger = None
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.protocol}:{self.sessionKey}>'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self):
+        return self.iterSegments()
+
+    @classmethod
+    def isStreamURL(cls, url):
+        """ Returns True if the URL is an HLS or DASH universal transcoder stream URL. """
+        parsed = urlparse(url)
+        params = dict(parse_qsl(parsed.query))
+        return bool(re.search(r'/transcode/universal/start\.(m3u8|mpd)$', parsed.path)) and \
+            params.get('protocol') in (None, 'hls', 'dash')
+
+    def _get(self, url):
+        response = self._session.get(url, headers={'X-Plex-Token': self._token}, timeout=TIMEOUT)
+        utils._checkDownloadResponse(response)
+        return response
+
+    def _fetch(self, url):
+        return self._get(url).content
+
+    def _transcode(self, action):
+        """ Sends a ``ping`` or ``stop`` request for the transcode session. """
+        self._get(f'{self._baseurl}/:/transcode/universal/{action}?{urlencode({"session": self.sessionKey})}')
+
+    def _ping(self):
+        while not self._stopped.wait(self.pingInterval):
+            try:
+                self._transcode('ping')
+            except Exception as e:
+                log.warning('Failed to ping transcode session %s: %s', self.sessionKey, e)
+
+    def _startPing(self):
+        if self._pinger is None and self.pingInterval:
+            self._pinger = Thread(target=self._ping, name=f'plexapi-ping-{self.sessionKey}', daemon=True)
+            self._pinger.start()
+
+    def _hlsSegments(self):
+        """ Yields the segment URLs of an HLS stream. The media playlist is reloaded until it ends,
+            or raises :exc:`~plexapi.exceptions.BadRequest` if it stops growing for ``stallTimeout`` seconds.
+        """
+        url = self.url
+        text = self._get(url).text
+        if '#EXT-X-STREAM-INF' in text:
+            url = urljoin(url, _m3u8URIs(text)[0][0])
+            text = self._get(url).text
+        seen = set()
+        lastSegment = time.monotonic()
+        while True:
+            uris, ended, targetDuration = _m3u8URIs(text)
+            new = [uri for uri in uris if uri not in seen]
+            for uri in new:
+                seen.add(uri)
+                yield urljoin(url, uri)
+            if ended:
+                return
+            if new:
+                lastSegment = time.monotonic()
+            elif self.stallTimeout and time.monotonic() - lastSegment >= self.stallTimeout:
+                raise BadRequest(f'HLS playlist has no new segments after {self.stallTimeout} seconds: {url}')
+            else:
+                time.sleep(targetDuration)
+            text = self._get(url).text
+
+    def _dashSegments(self):
+        """ Yields the initialization and segment URLs of a DASH representation. """
+        response = self._get(self.url)
+        return [urljoin(self.url, uri) for uri in _mpdURIs(response.content, self.representation)]
+
+    def segments(self):
+        """ Returns an iterator of the segment URLs of the stream. """
+        return self._dashSegments() if self.protocol == 'dash' else self._hlsSegments()
+
+    def iterSegments(self):
+        """ Yields the bytes of each segment of the stream in order while prefetching
+            up to ``window`` segments concurrently.
+        """
+        self._startPing()
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.window) as pool:
+            try:
+                for url in self.segments():
+                    pending.append(pool.submit(self._fetch, url))
+                    if len(pending) >= self.window:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def download(self, filename=None, savepath=None, callback=None):
+        """ Downloads and concatenates the segments of the stream to a file. Returns the local path
+            to the downloaded file. The file is written to a temporary ``.part`` file which is renamed
+            to the final filename once the download is complete.
+
+            Parameters:
+                filename (str, optional): Filename of the downloaded file.
+                    Default is ``<session>.ts`` for HLS or ``<session>.mp4`` for DASH.
+                savepath (str, optional): Defaults to current working dir.
+                callback (func, optional): Function called with the number of bytes written after each segment.
+        """
+        savepath = savepath or os.getcwd()
+        os.makedirs(savepath, exist_ok=True)
+        filename = filename or f'{self.sessionKey}.{"mp4" if self.protocol == "dash" else "ts"}'
+        fullpath = os.path.join(savepath, os.path.basename(filename))
+        partpath = f'{fullpath}.part'
+        log.info('Downloading: %s', fullpath)
+        with open(partpath, 'wb') as handle:
+            for data in self.iterSegments():
+                handle.write(data)
+                if callback:
+                    callback(len(data))
+        os.replace(partpath, fullpath)
+        return fullpath
+
+    def close(self):
+        """ Stops the keep-alive pings and the transcode session. """
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        try:
+            self._transcode('stop')
+        except Exception as e:
+            log.debug('Failed to stop transcode session %s: %s', self.sessionKey, e)
+
+
+def _m3u8URIs(text):
+    """ Returns a tuple of the URIs in an HLS playlist (including the ``EXT-X-MAP`` initialization
+        segment), True if the playlist has ended, and the target segment duration.
+    """
+    uris = []
+    ended = False
+    targetDuration = 1
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('#EXT-X-MAP:'):
+            match = re.search(r'URI="([^"]+)"', line)
+            if match:
+                uris.append(match.group(1))
+        elif line.startswith('#EXT-X-TARGETDURATION:'):
+            targetDuration = utils.cast(float, line.split(':', 1)[1]) or 1
+        elif line.startswith('#EXT-X-ENDLIST'):
+            ended = True
+        elif not line.startswith('#'):
+            uris.append(line)
+    return uris, ended, targetDuration
+
+
+def _isoDuration(value):
+    """ Returns the number of seconds of an ISO 8601 duration (e.g. ``PT1H2M3.5S``). """
+    match = re.match(r'^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:([\d.]+)S)?)?$', value or '')
+    if not match:
+        return 0
+    days, hours, minutes, seconds = (float(group or 0) for group in match.groups())
+    return days * 86400 + hours * 3600 + minutes * 60 + seconds
+
+
+def _mpdTemplate(template, representationID, number=None, segmentTime=None):
+    """ Substitutes the identifiers of a DASH ``SegmentTemplate`` URL. """
+    def _replace(match):
+        name, fmt = match.group(1), match.group(2)
+        if not name:
+            return '$'
+        value = {'RepresentationID': representationID, 'Number': number, 'Time': segmentTime}[name]
+        return (fmt % value) if fmt else str(value)
+    return re.sub(r'\$(RepresentationID|Number|Time|)(%0\d+d)?\$', _replace, template)
+
+
+def _mpdTag(elem):
+    return elem.tag.rsplit('}', 1)[-1]
+
+
+def _mpdChild(elem, name):
+    return next((child for child in elem if _mpdTag(child) == name), None)
+
+
+def _mpdRepresentation(root, representation=None):
+    """ Returns the ``(AdaptationSet, Representation)`` elements of a representation ``id`` or index
+        in a DASH manifest. Default is the first representation.
+    """
+    representations = [
+        (adaptationSet, elem)
+        for adaptationSet in root.iter() if _mpdTag(adaptationSet) == 'AdaptationSet'
+        for elem in adaptationSet if _mpdTag(elem) == 'Representation'
+    ]
+    if not representations:
+        raise BadRequest('DASH manifest does not contain any representations.')
+    if representation is None:
+        return representations[0]
+    if isinstance(representation, int):
+        if not -len(representations) <= representation < len(representations):
+            raise BadRequest(f'DASH manifest does not contain representation index {representation}.')
+        return representations[representation]
+    match = next((r for r in representations if r[1].attrib.get('id') == str(representation)), None)
+    if match is None:
+        raise BadRequest(f'DASH manifest does not contain representation "{representation}".')
+    return match
+
+
+def _mpdURIs(content, representation=None):
+    """ Returns the initialization and segment URIs of a representation in a DASH manifest. """
+    root = utils.parseXML(content)
+    if root is None:
+        raise BadRequest('DASH manifest is empty.')
+    adaptationSet, elem = _mpdRepresentation(root, representation)
+    representationID = elem.attrib.get('id', '')
+    template = _mpdChild(elem, 'SegmentTemplate')
+    if template is None:
+        template = _mpdChild(adaptationSet, 'SegmentTemplate')
+    if template is None:
+        raise BadRequest('DASH representation does not contain a SegmentTemplate.')
+    uris = []
+    if template.attrib.get('initialization'):
+        uris.append(_mpdTemplate(template.attrib['initialization'], representationID))
+
+    media = template.attrib['media']
+    number = int(template.attrib.get('startNumber', 1))
+    timeline = _mpdChild(template, 'SegmentTimeline')
+    if timeline is not None:
+        segmentTime = 0
+        for segment in timeline:
+            segmentTime = int(segment.attrib.get('t', segmentTime))
+            duration = int(segment.attrib['d'])
+            for _ in range(int(segment.attrib.get('r', 0)) + 1):
+                uris.append(_mpdTemplate(media, representationID, number, segmentTime))
+                number += 1
+                segmentTime += duration
+    else:
+        timescale = int(template.attrib.get('timescale', 1))
+        duration = int(template.attrib['duration']) / timescale
+        total = _isoDuration(root.attrib.get('mediaPresentationDuration'))
+        for i in range(math.ceil(total / duration)):
+            uris.append(_mpdTemplate(media, representationID, number + i))
+    return uris
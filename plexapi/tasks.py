@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+The :class:`~plexapi.tasks.TaskQueue` refreshes and analyzes many items without flooding the Plex server.
+The jobs are sent with a limit on the number of unfinished jobs, the limit is lowered while the server is
+busy transcoding or running other activities, and the completion of each job is tracked with the ``activity``
+and ``timeline`` alerts of the :class:`~plexapi.alert.AlertListener` (requires ``websocket-client``).
+
+.. code-block:: python
+
+    from plexapi.tasks import TaskQueue
+
+    def progress(queue):
+        print(f'{queue.finished}/{queue.total} finished, {len(queue.failed)} failed', end='\\r')
+
+    queue = TaskQueue(plex, maxworkers=4, maxTranscodes=2, callback=progress)
+    queue.add(plex.library.section('Movies').all(), action='refresh')
+    report = queue.run()
+
+"""
+import time
+from collections import deque
+from threading import Condition
+
+from plexapi import MAX_WORKERS, log
+from plexapi.exceptions import BadRequest
+
+
+class TaskQueue:
+    """ Queue of refresh and analyze jobs for many items with load-aware throttling.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): The server of the items.
+            maxworkers (int, optional): Maximum number of unfinished jobs.
+                Default is the ``plexapi.max_workers`` config value.
+            maxActivities (int, optional): Pause sending jobs while the server has at least this many
+                :func:`~plexapi.server.PlexServer.activities`. Default no limit.
+            maxTranscodes (int, optional): Pause sending jobs while the server has at least this many
+                :func:`~plexapi.server.PlexServer.transcodeSessions`. The limit of unfinished jobs is also
+                lowered by the number of transcode sessions. Default no limit.
+            pollInterval (int, optional): Number of seconds between checks of the server load (default 5).
+            timeout (int, optional): Number of seconds to wait for the completion alert of a job before it is
+                reported as unconfirmed (default 600).
+            track (bool, optional): True to track the completion of the jobs with the alert listener (default).
+                The completion alerts only identify the item, so a job is not sent while another job for the
+                same item is unfinished. When False or when ``websocket-client`` is not installed, the number of
+                server activities is used as the number of unfinished jobs.
+            callback (func, optional): Function called with the task queue after each job is sent or finished.
+
+        Attributes:
+            ACTIONS (tuple): The supported actions (refresh, analyze).
+            total (int): Total number of jobs.
+            completed (list): List of ``(item, action)`` tuples for the jobs confirmed as completed.
+            unconfirmed (list): List of ``(item, action)`` tuples for the jobs sent without a completion alert.
+            failed (list): List of ``(item, action, exception)`` tuples for the jobs which could not be sent.
+    """
+    ACTIONS = ('refresh', 'analyze')
+
+    def __init__(self, server, maxworkers=None, maxActivities=None, maxTranscodes=None, pollInterval=5,
+                 timeout=600, track=True, callback=None):
+        self._server = server
+        self.maxworkers = maxworkers or MAX_WORKERS
+        self.maxActivities = maxActivities
+        self.maxTranscodes = maxTranscodes
+        self.pollInterval = pollInterval
+        self.timeout = timeout
+        self.track = track
+        self.callback = callback
+        self.jobs = []
+        self.completed = []
+        self.unconfirmed = []
+        self.failed = []
+        self._pending = {}
+        self._listener = None
+        self._condition = Condition()
+        self._load = None
+        self._loadCheckedAt = 0
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}:{self.finished}/{self.total}>'
+
+    @property
+    def total(self):
+        return len(self.jobs)
+
+    @property
+    def finished(self):
+        """ Number of completed, unconfirmed, and failed jobs. """
+        return len(self.completed) + len(self.unconfirmed) + len(self.failed)
+
+    def add(self, items, action='refresh'):
+        """ Add jobs to refresh or analyze the items.
+
+            Parameters:
+                items (list): List of :class:`~plexapi.base.PlexPartialObject` items.
+                action (str, optional): ``refresh`` or ``analyze``. Default ``refresh``.
+        """
+        if action not in self.ACTIONS:
+            raise BadRequest(f'Unknown action "{action}", must be one of: {", ".join(self.ACTIONS)}.')
+        items = items if isinstance(items, list) else [items]
+        self.jobs.extend((item, action) for item in items)
+        return self
+
+    def _notify(self):
+        if self.callback:
+            self.callback(self)
+
+    def _complete(self, ratingKey):
+        with self._condition:
+            job = self._pending.pop(str(ratingKey), None)
+            if job is None:
+                return
+            self.completed.append(job[:2])
+            self._condition.notify_all()
+        self._notify()
+
+    def _onAlert(self, data):
+        """ Marks the jobs as completed from the ``activity`` and ``timeline`` alerts. """
+        if data.get('type') == 'activity':
+            for notification in data.get('ActivityNotification', []):
+                if notification.get('event') != 'ended':
+                    continue
+                key = notification.get('Activity', {}).get('Context', {}).get('key', '')
+                if key.startswith('/library/metadata/'):
+                    self._complete(key.rsplit('/', 1)[-1])
+        elif data.get('type') == 'timeline':
+            for entry in data.get('TimelineEntry', []):
+                if entry.get('state') == 5 and entry.get('itemID'):
+                    self._complete(entry['itemID'])
+
+    def _startListener(self):
+        if not self.track:
+            return None
+        try:
+            import websocket  # noqa: F401
+        except ImportError:
+            log.warning('Install websocket-client to track the completion of the jobs')
+            return None
+        return self._server.startAlertListener(callback=self._onAlert)
+
+    def _serverLoad(self):
+        """ Returns the cached ``(activities, transcodes)`` counts of the server, refreshed every poll interval. """
+        if self._load is None or time.monotonic() - self._loadCheckedAt >= self.pollInterval:
+            activities = len(self._server.activities()) if self.maxActivities or self._listener is None else 0
+            transcodes = len(self._server.transcodeSessions()) if self.maxTranscodes else 0
+            self._load = (activities, transcodes)
+            self._loadCheckedAt = time.monotonic()
+        return self._load
+
+    def _limit(self):
+        """ Returns the number of jobs which can be sent now. """
+        activities, transcodes = self._serverLoad()
+        if self.maxActivities and activities >= self.maxActivities:
+            return 0
+        if self.maxTranscodes and transcodes >= self.maxTranscodes:
+            return 0
+        limit = max(self.maxworkers - transcodes, 1)
+        unfinished = len(self._pending) if self._listener is not None else activities
+        return max(limit - unfinished, 0)
+
+    def _send(self, item, action):
+        key = str(item.ratingKey)
+        if self._listener is not None:
+            # register the job before sending it in case the completion alert arrives first
+            with self._condition:
+                self._pending[key] = (item, action, time.monotonic())
+        try:
+            getattr(item, action)()
+        except Exception as e:
+            log.warning('Failed to %s %s: %s', action, item.ratingKey, e)
+            with self._condition:
+                self._pending.pop(key, None)
+            self.failed.append((item, action, e))
+        else:
+            if self._listener is None:
+                self.unconfirmed.append((item, action))
+        self._notify()
+
+    def _expire(self):
+        """ Reports the jobs without a completion alert before the timeout as unconfirmed. """
+        now = time.monotonic()
+        with self._condition:
+            expired = [key for key, (_, _, sentAt) in self._pending.items() if now - sentAt >= self.timeout]
+            for key in expired:
+                item, action, _ = self._pending.pop(key)
+                log.warning('Timed out waiting for %s of %s', action, item.ratingKey)
+                self.unconfirmed.append((item, action))
+        if expired:
+            self._notify()
+
+    def _sendNext(self, queue, limit):
+        """ Sends up to ``limit`` jobs from the queue. Jobs for items with an unfinished job are kept in the
+            queue in order until the unfinished job is completed.
+        """
+        deferred = []
+        while queue and limit > 0:
+            item, action = queue.popleft()
+            if str(item.ratingKey) in self._pending:
+                deferred.append((item, action))
+                continue
+            self._send(item, action)
+            limit -= 1
+        queue.extendleft(reversed(deferred))
+
+    def run(self):
+        """ Sends all of the jobs and waits until they are finished. Running the queue again sends
+            all of the jobs again and starts a new report.
+
+            Returns:
+                dict: Report with the ``completed``, ``unconfirmed``, and ``failed`` lists
+                and the ``duration`` in seconds.
+        """
+        start = time.monotonic()
+        self.completed = []
+        self.unconfirmed = []
+        self.failed = []
+        self._pending = {}
+        self._load = None
+        self._listener = self._startListener()
+        queue = deque(self.jobs)
+        try:
+            while queue or self._pending:
+                self._expire()
+                self._sendNext(queue, self._limit())
+                if queue or self._pending:
+                    with self._condition:
+                        self._condition.wait(self.pollInterval)
+        finally:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+        return {
+            'completed': self.completed,
+            'unconfirmed': self.unconfirmed,
+            'failed': self.failed,
+            'duration': time.monotonic() - start,
+        }
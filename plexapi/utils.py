@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
+import array
 import base64
+import bisect
+import copy
 import functools
 import json
 import logging
@@ -12,10 +15,12 @@ import unicodedata
 import warnings
 import zipfile
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from getpass import getpass
 from hashlib import sha1
-from threading import Event, Thread
+from threading import Event, Lock, Thread, local
 from urllib.parse import quote
 from xml.etree import ElementTree
 
@@ -27,6 +32,10 @@ try:
     from tqdm import tqdm
 except ImportError:
     tqdm = None
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
 
 log = logging.getLogger('plexapi')
 
@@ -99,6 +108,9 @@ REVERSETAGTYPES = {v: k for k, v in TAGTYPES.items()}
 # Plex Objects - Populated at runtime
 PLEXOBJECTS = {}
 
+# XML Parsers - Populated at import time, see registerXMLParser()
+XMLPARSERS = {}
+
 
 class SecretsFilter(logging.Filter):
     """ Logging filter to hide secrets. """
@@ -322,6 +334,74 @@ def threaded(callback, listargs):
     return [r for r in results if r is not None]
 
 
+def _rateLimiter(rate=None):
+    """ Returns a thread-safe function which sleeps as required to call it at most ``rate`` times per second. """
+    interval = 1 / rate if rate else 0
+    lock = Lock()
+    nextCall = [time.monotonic()]
+
+    def _wait():
+        if not interval:
+            return
+        with lock:
+            now = time.monotonic()
+            wait = nextCall[0] - now
+            nextCall[0] = max(nextCall[0], now) + interval
+        if wait > 0:
+            time.sleep(wait)
+    return _wait
+
+
+def _cachedCall(cache, inflight, lock, key, func, *args):
+    """ Returns the cached result of the key, or calls ``func(*args)`` and caches the result.
+        Concurrent calls for the same key wait for the result of the first call instead of calling
+        the function again. Failed calls are not cached. When ``cache`` is None the results are not
+        cached and only the concurrent calls are shared.
+    """
+    with lock:
+        if cache is not None and key in cache:
+            return cache[key]
+        future = inflight.get(key)
+        owner = future is None
+        if owner:
+            future = inflight[key] = Future()
+    if not owner:
+        return future.result()
+    try:
+        result = func(*args)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        if cache is not None:
+            with lock:
+                cache[key] = result
+    finally:
+        with lock:
+            inflight.pop(key, None)
+    return result
+
+
+def _runJobs(func, jobs, maxworkers=None):
+    """ Calls ``func(*job)`` for each job tuple concurrently and yields a ``(job, result, exception)`` tuple
+        for each job in the order of the jobs. A single job is called in the current thread.
+    """
+    def _call(job):
+        try:
+            return job, func(*job), None
+        except Exception as e:
+            return job, None, e
+
+    from plexapi import MAX_WORKERS
+
+    if len(jobs) <= 1:
+        yield from map(_call, jobs)
+        return
+    with ThreadPoolExecutor(max_workers=min(maxworkers or MAX_WORKERS, len(jobs))) as pool:
+        yield from pool.map(_call, jobs)
+
+
 def toDatetime(value, format=None):
     """ Returns a datetime object from the specified value.
 
@@ -382,6 +462,234 @@ def toList(value, itemcast=None, delim=','):
     return [itemcast(item) for item in value.split(delim) if item != '']
 
 
+def longestIncreasingSubsequence(values):
+    """ Returns the set of indexes of a longest strictly increasing subsequence of the values.
+
+        Parameters:
+            values (list): List of comparable values.
+    """
+    tails, tailIndexes, previous = [], [], [None] * len(values)
+    for i, value in enumerate(values):
+        pos = bisect.bisect_left(tails, value)
+        if pos == len(tails):
+            tails.append(value)
+            tailIndexes.append(i)
+        else:
+            tails[pos] = value
+            tailIndexes[pos] = i
+        previous[i] = tailIndexes[pos - 1] if pos else None
+    result = set()
+    i = tailIndexes[-1] if tailIndexes else None
+    while i is not None:
+        result.add(i)
+        i = previous[i]
+    return result
+
+
+class Columns(dict):
+    """ Dictionary of column names to typed arrays returned by :func:`~plexapi.utils.toColumns`.
+        String columns are dictionary-encoded as an array of integer codes (-1 for missing values)
+        into the list of unique values in :attr:`categories`.
+
+        Attributes:
+            categories (dict): Mapping of the string column names to the list of unique values.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(Columns, self).__init__(*args, **kwargs)
+        self.categories = {}
+
+    def decode(self, name):
+        """ Returns the list of string values (or None) for a dictionary-encoded column. """
+        categories = self.categories[name]
+        return [categories[code] if code >= 0 else None for code in self[name]]
+
+    def tolist(self, name):
+        """ Returns the list of values of a column with the string columns decoded and the missing
+            numeric values as None.
+        """
+        if name in self.categories:
+            return self.decode(name)
+        return [None if value != value else value for value in self[name].tolist()]
+
+    def _rows(self, where):
+        """ Returns the row indexes matching the dict of column names to values. """
+        rows = range(len(next(iter(self.values()), ())))
+        if not where:
+            return rows
+        columns = {name: self.tolist(name) for name in where}
+        return [i for i in rows if all(columns[name][i] == value for name, value in where.items())]
+
+    def groupby(self, by, column=None, agg='count', where=None):
+        """ Returns a dict of the aggregated column values grouped by the values of one or more columns.
+
+            Parameters:
+                by (str or list): Column name or list of column names to group by.
+                    The keys are tuples of values when grouping by multiple columns.
+                column (str, optional): Column name of the values to aggregate. Not required for ``count``.
+                agg (str, optional): The aggregate function (count, sum, mean, min, or max). Default count.
+                    Missing values are excluded from the aggregate.
+                where (dict, optional): Dict of column names to values to only include the matching rows.
+
+            Example:
+
+                .. code-block:: python
+
+                    # Number of video streams by codec and bit depth
+                    columns.groupby(['Media__Part__Stream__codec', 'Media__Part__Stream__bitDepth'],
+                                    where={'Media__Part__Stream__streamType': 1})
+
+        """
+        functions = {'count': len, 'sum': sum, 'mean': lambda values: sum(values) / len(values), 'min': min, 'max': max}
+        if agg not in functions:
+            raise BadRequest(f'Unknown aggregate "{agg}", must be one of: {", ".join(functions)}.')
+        names = [by] if isinstance(by, str) else list(by)
+        keys = list(zip(*(self.tolist(name) for name in names)))
+        values = self.tolist(column) if column else None
+        groups = {}
+        for i in self._rows(where):
+            key = keys[i] if len(names) > 1 else keys[i][0]
+            group = groups.setdefault(key, [])
+            if values is None:
+                group.append(1)
+            elif values[i] is not None:
+                group.append(values[i])
+        return {key: functions[agg](group) if group else None for key, group in groups.items()}
+
+    def histogram(self, name, bins=10, where=None):
+        """ Returns a list of ``(lower, upper, count)`` tuples of the number of values of a numeric column
+            in each bin. The upper edge of the last bin is inclusive.
+
+            Parameters:
+                name (str): The numeric column name.
+                bins (int or list, optional): Number of equal width bins between the minimum and maximum
+                    values, or a sorted list of the bin edges. Default 10. A single bin is returned
+                    when all of the values are equal.
+                where (dict, optional): Dict of column names to values to only include the matching rows.
+        """
+        column = self.tolist(name)
+        values = [column[i] for i in self._rows(where) if column[i] is not None]
+        if isinstance(bins, int):
+            if not values:
+                return []
+            low, high = min(values), max(values)
+            if low == high:
+                return [(low, high, len(values))]
+            width = (high - low) / bins
+            edges = [low + width * i for i in range(bins)] + [high]
+        else:
+            edges = list(bins)
+        counts = [0] * (len(edges) - 1)
+        for value in values:
+            if edges[0] <= value <= edges[-1]:
+                counts[min(bisect.bisect_right(edges, value) - 1, len(counts) - 1)] += 1
+        return [(edges[i], edges[i + 1], count) for i, count in enumerate(counts)]
+
+
+def _columnAttr(elem, attr):
+    """ Returns the value of an XML attribute matching the case of the attribute name if possible. """
+    if elem is None:
+        return None
+    value = elem.attrib.get(attr)
+    if value is None:
+        attr = attr.lower()
+        value = next((v for k, v in elem.attrib.items() if k.lower() == attr), None)
+    return value
+
+
+def _explodeElem(elem, path):
+    """ Yields the chain of elements ``[elem, child, grandchild, ...]`` for every branch of the path of child tags.
+        A chain is padded with None when the element has no matching children.
+    """
+    if not path:
+        yield [elem]
+        return
+    tag = path[0].lower()
+    children = [child for child in elem if child.tag.lower() == tag] if elem is not None else []
+    for child in children or [None]:
+        for chain in _explodeElem(child, path[1:]):
+            yield [elem] + chain
+
+
+def _toColumn(values, columnType):
+    """ Returns the typed array (and list of categories for strings) of the raw string values. """
+    present = [value for value in values if value is not None]
+    if columnType is None:
+        if present and all(value.lstrip('-').isdigit() for value in present):
+            columnType = 'int'
+        else:
+            try:
+                [float(value) for value in present]
+                columnType = 'float' if present else 'str'
+            except ValueError:
+                columnType = 'str'
+
+    if columnType == 'datetime':
+        values = [
+            None if value is None else int(value) if value.lstrip('-').isdigit()
+            else int(toDatetime(value, '%Y-%m-%d').timestamp())
+            for value in values
+        ]
+        columnType = 'int'
+    if columnType in ('int', 'bool'):
+        if len(present) == len(values):
+            return array.array('q', (int(value) for value in values)), None
+        columnType = 'float'
+    if columnType == 'float':
+        return array.array('d', (float('nan') if value is None else float(value) for value in values)), None
+    if columnType == 'str':
+        categories, codes = {}, array.array('l')
+        for value in values:
+            codes.append(-1 if value is None else categories.setdefault(value, len(categories)))
+        return codes, list(categories)
+    raise BadRequest(f'Unknown column type "{columnType}", must be int, float, datetime, bool, or str.')
+
+
+def toColumns(elems, fields, numpy=False):
+    """ Returns a :class:`~plexapi.utils.Columns` dictionary of typed arrays read directly from the
+        XML attributes of the elements without building any :class:`~plexapi.base.PlexObject`.
+
+        Integer and epoch datetime columns are returned as ``array('q')`` and float columns as ``array('d')``.
+        Integer columns with missing values are returned as float columns with ``nan`` for the missing values.
+        String columns are dictionary-encoded as an ``array('l')`` of codes into :attr:`Columns.categories`.
+
+        Parameters:
+            elems (iterable): XML elements (e.g. the raw search results).
+            fields (list or dict): List of attribute names, or a dict of attribute names to the column type
+                (int, float, datetime, bool, or str). The type is inferred from the values when not specified.
+                Nested attributes can be specified using ``__`` (e.g. ``Media__videoResolution``)
+                which explodes each element to one row per nested element. All nested attributes must be
+                on the same branch (e.g. ``Media__bitrate`` and ``Media__Part__size``).
+            numpy (bool): True to return NumPy arrays instead of arrays (requires NumPy).
+
+        Raises:
+            :exc:`~plexapi.exceptions.BadRequest`: When nested attributes are on different branches.
+    """
+    if not isinstance(fields, dict):
+        fields = {field: None for field in fields}
+    paths = {name: name.split('__') for name in fields}
+    branch = max((path[:-1] for path in paths.values()), key=len, default=[])
+    for name, path in paths.items():
+        if [tag.lower() for tag in path[:-1]] != [tag.lower() for tag in branch[:len(path) - 1]]:
+            raise BadRequest(f'Nested attribute "{name}" is not on the same branch as "{"__".join(branch)}".')
+
+    raw = {name: [] for name in fields}
+    for elem in elems:
+        for chain in _explodeElem(elem, branch):
+            for name, path in paths.items():
+                raw[name].append(_columnAttr(chain[len(path) - 1], path[-1]))
+
+    columns = Columns()
+    for name, columnType in fields.items():
+        columns[name], categories = _toColumn(raw.pop(name), columnType)
+        if categories is not None:
+            columns.categories[name] = categories
+        if numpy:
+            import numpy as np
+            columns[name] = np.asarray(columns[name])
+    return columns
+
+
 def cleanFilename(filename, replace='_'):
     whitelist = f"-_.()[] {string.ascii_letters}{string.digits}"
     cleaned_filename = unicodedata.normalize('NFKD', filename).encode('ASCII', 'ignore').decode()
@@ -422,10 +730,25 @@ def downloadSessionImages(server, filename=None, height=150, width=150,
     return info
 
 
-def download(url, token, filename=None, savepath=None, session=None, chunksize=4096,   # noqa: C901
-             unpack=False, mocked=False, showstatus=False):
+def _checkDownloadResponse(response):
+    """ Raises the matching :mod:`~plexapi.exceptions` error for an unsuccessful download response. """
+    if response.status_code not in (200, 201, 204, 206):
+        codename = codes.get(response.status_code)[0]
+        errtext = response.text.replace('\n', ' ')
+        message = f'({response.status_code}) {codename}; {response.url} {errtext}'
+        if response.status_code == 401:
+            raise Unauthorized(message)
+        elif response.status_code == 404:
+            raise NotFound(message)
+        else:
+            raise BadRequest(message)
+
+
+def download(url, token, filename=None, savepath=None, session=None, chunksize=None,   # noqa: C901
+             unpack=False, mocked=False, showstatus=False, resume=False, size=None, callback=None):
     """ Helper to download a thumb, videofile or other media item. Returns the local
-        path to the downloaded file.
+        path to the downloaded file. The file is downloaded to a temporary ``.part`` file
+        which is renamed to the final filename once the download is complete.
 
        Parameters:
             url (str): URL where the content be reached.
@@ -433,31 +756,51 @@ def download(url, token, filename=None, savepath=None, session=None, chunksize=4
             filename (str): Filename of the downloaded file, default None.
             savepath (str): Defaults to current working dir.
             chunksize (int): What chunksize read/write at the time.
+                Default is the ``plexapi.download_chunk_size`` config value.
             mocked (bool): Helper to do everything except write the file.
             unpack (bool): Unpack the zip file.
             showstatus(bool): Display a progressbar.
+            resume (bool): True to skip the download if the file already exists with the expected size,
+                and to resume a partially downloaded ``.part`` file using an HTTP ``Range`` request.
+                Requires the filename and size.
+            size (int): Expected size of the file in bytes. The partial file is kept and
+                :class:`~plexapi.exceptions.BadRequest` is raised if the downloaded size does not match.
+            callback (func): Function called with the number of bytes written after each chunk.
 
         Example:
             >>> download(a_episode.getStreamURL(), a_episode.location)
             /path/to/file
     """
-    # fetch the data to be saved
+    from plexapi import DOWNLOAD_CHUNK_SIZE
+    chunksize = chunksize or DOWNLOAD_CHUNK_SIZE
     session = session or requests.Session()
     headers = {'X-Plex-Token': token}
+    savepath = savepath or os.getcwd()
+
+    # skip a completed download or resume a partial download of the same file
+    offset = 0
+    if resume and filename and size and not mocked:
+        fullpath = os.path.join(savepath, os.path.basename(filename))
+        if os.path.isfile(fullpath) and os.path.getsize(fullpath) == size:
+            log.debug('Already downloaded %s', fullpath)
+            if callback:
+                callback(size)
+            return fullpath
+        if os.path.isfile(f'{fullpath}.part'):
+            offset = os.path.getsize(f'{fullpath}.part')
+            if offset >= size:
+                offset = 0
+        if offset:
+            headers['Range'] = f'bytes={offset}-'
+
+    # fetch the data to be saved
     response = session.get(url, headers=headers, stream=True)
-    if response.status_code not in (200, 201, 204):
-        codename = codes.get(response.status_code)[0]
-        errtext = response.text.replace('\n', ' ')
-        message = f'({response.status_code}) {codename}; {response.url} {errtext}'
-        if response.status_code == 401:
-            raise Unauthorized(message)
-        elif response.status_code == 404:
-            raise NotFound(message)
-        else:
-            raise BadRequest(message)
+    _checkDownloadResponse(response)
+    if response.status_code != 206:
+        # the server ignored the range request, restart the download
+        offset = 0
 
     # make sure the savepath directory exists
-    savepath = savepath or os.getcwd()
     os.makedirs(savepath, exist_ok=True)
 
     # try getting filename from header if not specified in arguments (used for logs, db)
@@ -482,17 +825,27 @@ def download(url, token, filename=None, savepath=None, session=None, chunksize=4
     # save the file to disk
     log.info('Downloading: %s', fullpath)
     if showstatus and tqdm:  # pragma: no cover
-        total = int(response.headers.get('content-length', 0))
-        bar = tqdm(unit='B', unit_scale=True, total=total, desc=filename)
+        total = offset + int(response.headers.get('content-length', 0))
+        bar = tqdm(unit='B', unit_scale=True, total=total, initial=offset, desc=filename)
+    if offset and callback:
+        callback(offset)
 
-    with open(fullpath, 'wb') as handle:
+    partpath = f'{fullpath}.part'
+    with open(partpath, 'ab' if offset else 'wb') as handle:
         for chunk in response.iter_content(chunk_size=chunksize):
             handle.write(chunk)
+            if callback:
+                callback(len(chunk))
             if showstatus and tqdm:
                 bar.update(len(chunk))
 
     if showstatus and tqdm:  # pragma: no cover
         bar.close()
+    downloaded = os.path.getsize(partpath)
+    if size and downloaded != size:
+        raise BadRequest(f'Downloaded {downloaded} bytes, expected {size} bytes: {partpath}')
+    os.replace(partpath, fullpath)
+
     # check we want to unzip the contents
     if fullpath.endswith('zip') and unpack:
         with zipfile.ZipFile(fullpath, 'r') as handle:
@@ -501,6 +854,133 @@ def download(url, token, filename=None, savepath=None, session=None, chunksize=4
     return fullpath
 
 
+def downloadSegments(url, token, filename, size, savepath=None, session=None, segments=4, chunksize=None,
+                     resume=True, callback=None):
+    """ Helper to download a large file by splitting it into byte ranges which are fetched concurrently
+        over multiple connections. The ranges are written at their offsets into a preallocated ``.part`` file
+        which is renamed to the final filename once the download is complete. The progress of each range
+        is checkpointed to a ``.segments`` file so an interrupted download only fetches the missing bytes.
+        Returns the local path to the downloaded file.
+
+        Parameters:
+            url (str): URL where the content be reached. The server must support HTTP ``Range`` requests.
+            token (str): Plex auth token to include in headers.
+            filename (str): Filename of the downloaded file.
+            size (int): Size of the file in bytes.
+            savepath (str): Defaults to current working dir.
+            session (requests.Session): Session used for the requests. The connection pool of the session
+                should allow at least as many connections as segments.
+            segments (int): Number of byte ranges to download concurrently.
+            chunksize (int): What chunksize read/write at the time.
+                Default is the ``plexapi.download_chunk_size`` config value.
+            resume (bool): True to skip the download if the file already exists with the expected size,
+                and to resume an interrupted download from the checkpoint (default).
+            callback (func): Function called with the number of bytes written after each chunk.
+
+        Raises:
+            :exc:`~plexapi.exceptions.BadRequest`: The server does not support range requests.
+    """
+    from plexapi import DOWNLOAD_CHUNK_SIZE
+    chunksize = chunksize or DOWNLOAD_CHUNK_SIZE
+    session = session or requests.Session()
+    savepath = savepath or os.getcwd()
+    os.makedirs(savepath, exist_ok=True)
+    fullpath = os.path.join(savepath, os.path.basename(filename))
+    partpath = f'{fullpath}.part'
+    checkpointpath = f'{fullpath}.segments'
+
+    if resume and os.path.isfile(fullpath) and os.path.getsize(fullpath) == size:
+        log.debug('Already downloaded %s', fullpath)
+        if callback:
+            callback(size)
+        return fullpath
+
+    ranges = _loadSegments(partpath, checkpointpath, size, segments, resume)
+    if callback and any(done for _, _, done in ranges):
+        callback(sum(done for _, _, done in ranges))
+
+    lock = Lock()
+
+    def saveCheckpoint():
+        _saveSegments(checkpointpath, size, ranges, lock)
+
+    def fetchRange(segment):
+        _fetchSegment(session, url, token, partpath, segment, chunksize, lock, callback, saveCheckpoint)
+
+    log.info('Downloading: %s (%s segments)', fullpath, len(ranges))
+    with ThreadPoolExecutor(max_workers=len(ranges) or 1) as executor:
+        futures = [executor.submit(fetchRange, segment) for segment in ranges]
+    saveCheckpoint()
+    for future in futures:
+        future.result()
+
+    os.replace(partpath, fullpath)
+    os.remove(checkpointpath)
+    return fullpath
+
+
+def _loadSegments(partpath, checkpointpath, size, segments, resume=True):
+    """ Returns the ``[start, end, done]`` byte ranges from the checkpoint of an interrupted download,
+        or splits the file into new byte ranges and preallocates the ``.part`` file.
+    """
+    if resume and os.path.isfile(partpath) and os.path.isfile(checkpointpath):
+        try:
+            with open(checkpointpath, 'r', encoding='utf-8') as handle:
+                checkpoint = json.load(handle)
+            if checkpoint['size'] == size and os.path.getsize(partpath) == size:
+                return checkpoint['ranges']
+        except (OSError, ValueError, KeyError):
+            log.warning('Ignoring invalid download checkpoint %s', checkpointpath)
+    segmentsize = max(-(-size // max(segments, 1)), 1)
+    with open(partpath, 'wb') as handle:
+        handle.truncate(size)
+    return [[start, min(start + segmentsize, size), 0] for start in range(0, size, segmentsize)]
+
+
+def _saveSegments(checkpointpath, size, ranges, lock):
+    """ Atomically writes the byte ranges to the checkpoint file. The lock is held while writing
+        and renaming the temporary file, so concurrent segments do not replace each other's file.
+    """
+    with lock:
+        with open(f'{checkpointpath}.tmp', 'w', encoding='utf-8') as handle:
+            json.dump({'size': size, 'ranges': ranges}, handle)
+        os.replace(f'{checkpointpath}.tmp', checkpointpath)
+
+
+def _fetchSegment(session, url, token, partpath, segment, chunksize, lock, callback=None, checkpoint=None):
+    """ Downloads the remaining bytes of a ``[start, end, done]`` byte range and writes them at their
+        offset into the ``.part`` file. The checkpoint function is called every 64 chunks.
+    """
+    start, end, _ = segment
+    if start + segment[2] >= end:
+        return
+    headers = {'X-Plex-Token': token, 'Range': f'bytes={start + segment[2]}-{end - 1}'}
+    response = session.get(url, headers=headers, stream=True)
+    _checkDownloadResponse(response)
+    if response.status_code != 206:
+        response.close()
+        raise BadRequest(f'Server does not support range requests: {response.url}')
+    fd = os.open(partpath, os.O_WRONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        for i, chunk in enumerate(response.iter_content(chunk_size=chunksize)):
+            chunk = chunk[:end - start - segment[2]]
+            if hasattr(os, 'pwrite'):
+                os.pwrite(fd, chunk, start + segment[2])
+            else:  # pragma: no cover
+                os.lseek(fd, start + segment[2], os.SEEK_SET)
+                os.write(fd, chunk)
+            with lock:
+                segment[2] += len(chunk)
+            if callback:
+                callback(len(chunk))
+            if checkpoint and i % 64 == 63:
+                checkpoint()
+    finally:
+        os.close(fd)
+    if start + segment[2] != end:
+        raise BadRequest(f'Downloaded {segment[2]} bytes, expected {end - start} bytes: {partpath}')
+
+
 def getMyPlexAccount(opts=None):  # pragma: no cover
     """ Helper function tries to get a MyPlex Account instance by checking
         the the following locations for a username and password. This is
@@ -673,6 +1153,18 @@ def openOrRead(file):
         return f.read()
 
 
+@contextmanager
+def openFile(file):
+    """ Context manager which opens a file path for reading in binary mode, or yields a file-like object
+        as-is without closing it. Used to stream uploads instead of reading the entire file into memory.
+    """
+    if hasattr(file, 'read'):
+        yield file
+        return
+    with open(file, 'rb') as f:
+        yield f
+
+
 def sha1hash(guid):
     """ Return the SHA1 hash of a guid. """
     return sha1(guid.encode('utf-8')).hexdigest()
@@ -720,12 +1212,139 @@ def cleanXMLString(s):
     return _illegal_XML_re.sub('', s)
 
 
-def parseXMLString(s: str):
-    """ Parse an XML string and return an ElementTree object. """
-    if not s.strip():
-        return None
+def registerXMLParser(name):
+    """ Registry of XML parser backends used to parse the responses from Plex. A backend is
+        a function accepting the raw response bytes and returning the root element, or None
+        if the response is empty. Backends must raise :exc:`xml.etree.ElementTree.ParseError`
+        when the response is not XML. See :func:`~plexapi.utils.parseXML` for usage.
+
+        Parameters:
+            name (str): Name of the parser backend (used in the ``plexapi.xml_parser`` config).
+    """
+    def decorator(func):
+        XMLPARSERS[name] = func
+        return func
+    return decorator
+
+
+@registerXMLParser('elementtree')
+def _parseXMLElementTree(data):
+    """ Parse XML bytes using the standard library ElementTree parser. """
     try:  # Attempt to parse the string as-is without cleaning (which is expensive)
-        return ElementTree.fromstring(s.encode('utf-8'))
+        return ElementTree.fromstring(data)
     except ElementTree.ParseError:  # If it fails, clean the string and try again
-        cleaned_s = cleanXMLString(s).encode('utf-8')
-        return ElementTree.fromstring(cleaned_s) if cleaned_s.strip() else None
+        cleaned = cleanXMLString(data.decode('utf-8', errors='replace')).encode('utf-8')
+        return ElementTree.fromstring(cleaned) if cleaned.strip() else None
+
+
+if lxml_etree is not None:
+    # lxml parsers lock while parsing, so each thread uses its own parser to parse responses concurrently
+    _lxmlParsers = local()
+
+    def _lxmlParser():
+        parser = getattr(_lxmlParsers, 'parser', None)
+        if parser is None:
+            parser = _lxmlParsers.parser = lxml_etree.XMLParser(
+                recover=True, remove_comments=True, remove_pis=True,
+                resolve_entities=False, no_network=True, huge_tree=True)
+        return parser
+
+    @registerXMLParser('lxml')
+    def _parseXMLlxml(data):
+        """ Parse XML bytes using lxml in recover mode, which skips illegal characters
+            without having to clean the entire document first.
+        """
+        try:
+            elem = lxml_etree.fromstring(data, _lxmlParser())
+        except lxml_etree.XMLSyntaxError as err:
+            raise ElementTree.ParseError(str(err)) from None
+        if elem is None:
+            raise ElementTree.ParseError('No XML root element found')
+        return elem
+
+
+def getXMLParser(name=None):
+    """ Returns the registered XML parser backend function.
+
+        Parameters:
+            name (str, optional): Name of the parser backend (auto, elementtree, lxml).
+                Defaults to the ``plexapi.xml_parser`` config value. ``auto`` uses lxml when
+                it is installed and falls back to the standard library ElementTree parser.
+    """
+    if name is None:
+        import plexapi
+        name = plexapi.XML_PARSER
+    if name == 'auto':
+        name = 'lxml' if 'lxml' in XMLPARSERS else 'elementtree'
+    try:
+        return XMLPARSERS[name]
+    except KeyError:
+        log.warning('XML parser "%s" is not available, falling back to "elementtree"', name)
+        return XMLPARSERS['elementtree']
+
+
+def parseXML(data, parser=None):
+    """ Parse an XML response and return an ElementTree object (or None if the response is empty).
+
+        Parameters:
+            data (bytes or str): The raw XML response. Pass ``response.content`` to avoid
+                decoding and re-encoding the response.
+            parser (str, optional): Name of the parser backend. See :func:`~plexapi.utils.getXMLParser`.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if not data or data.isspace():
+        return None
+    return getXMLParser(parser)(data)
+
+
+def detachXMLElement(elem, children=True):
+    """ Returns a copy of an XML element which does not keep the rest of the response document alive.
+        lxml elements reference their entire document, so they are copied when still attached to
+        a parent. Standard library elements do not reference their parent and are returned as-is.
+
+        Parameters:
+            elem (Element): The XML element to detach.
+            children (bool): False to only copy the element attributes without any child elements.
+    """
+    if elem is None:
+        return None
+    if not children:
+        return elem.makeelement(elem.tag, dict(elem.attrib))
+    getparent = getattr(elem, 'getparent', None)
+    if getparent is not None and getparent() is not None:
+        return copy.deepcopy(elem)
+    return elem
+
+
+def packXML(elem):
+    """ Returns a compact nested tuple ``(tag, attrib, text, children)`` representation of an XML
+        element which can be pickled efficiently. See :func:`~plexapi.utils.unpackXML`.
+
+        Parameters:
+            elem (Element): The XML element to pack.
+    """
+    if elem is None:
+        return None
+    attrib = {sys.intern(k): v for k, v in elem.attrib.items()}
+    return (sys.intern(elem.tag), attrib, elem.text, tuple(packXML(child) for child in elem))
+
+
+def unpackXML(packed):
+    """ Returns an ElementTree element from a tuple created by :func:`~plexapi.utils.packXML`.
+
+        Parameters:
+            packed (tuple): The packed XML element.
+    """
+    if packed is None:
+        return None
+    tag, attrib, text, children = packed
+    elem = ElementTree.Element(tag, attrib)
+    elem.text = text
+    elem.extend(unpackXML(child) for child in children)
+    return elem
+
+
+def parseXMLString(s: str):
+    """ Parse an XML string and return an ElementTree object. """
+    return parseXML(s)
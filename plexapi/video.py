@@ -5,7 +5,8 @@ from urllib.parse import quote_plus
 
 from plexapi import media, utils
 from plexapi.base import Playable, PlexPartialObject, PlexHistory, PlexSession, cached_data_property
-from plexapi.exceptions import BadRequest
+from plexapi.download import DownloadManager
+from plexapi.exceptions import BadRequest, NotFound
 from plexapi.mixins import (
     AdvancedSettingsMixin, SplitMergeMixin, UnmatchMatchMixin, ExtrasMixin, HubsMixin, PlayedUnplayedMixin, RatingMixin,
     ArtUrlMixin, ArtMixin, LogoMixin, PosterUrlMixin, PosterMixin, ThemeUrlMixin, ThemeMixin,
@@ -107,17 +108,17 @@ class Video(PlexPartialObject, PlayedUnplayedMixin):
         """ Upload a subtitle file for the video.
 
             Parameters:
-                filepath (str): Path to subtitle file.
+                filepath (str): Path to subtitle file or file-like object with a ``name``.
         """
         url = f'{self.key}/subtitles'
-        filename = os.path.basename(filepath)
-        subFormat = os.path.splitext(filepath)[1][1:]
+        filename = os.path.basename(getattr(filepath, 'name', filepath))
+        subFormat = os.path.splitext(filename)[1][1:]
         params = {
             'title': filename,
             'format': subFormat,
         }
         headers = {'Accept': 'text/plain, */*'}
-        with open(filepath, 'rb') as subfile:
+        with utils.openFile(filepath) as subfile:
             self._server.query(url, self._server._session.post, data=subfile, params=params, headers=headers)
         return self
 
@@ -741,13 +742,17 @@ class Show(
             Raises:
                 :exc:`~plexapi.exceptions.BadRequest`: If title or season and episode parameters are missing.
         """
-        key = f'{self.key}/allLeaves'
         if title is not None:
-            return self.fetchItem(key, Episode, title__iexact=title)
+            return _lookupEpisode(self, title=title.lower())
         elif season is not None and episode is not None:
-            return self.fetchItem(key, Episode, parentIndex=season, index=episode)
+            return _lookupEpisode(self, index=(utils.cast(int, season), utils.cast(int, episode)))
         raise BadRequest('Missing argument: title or season and episode are required')
 
+    @cached_data_property
+    def _episodeIndex(self):
+        """ Cache for the episode lookup index. """
+        return _buildEpisodeIndex(self.episodes())
+
     def episodes(self, **kwargs):
         """ Returns a list of :class:`~plexapi.video.Episode` objects in the show. """
         key = f'{self.key}/allLeaves'
@@ -765,21 +770,30 @@ class Show(
         """ Returns list of unwatched :class:`~plexapi.video.Episode` objects. """
         return self.episodes(viewCount=0)
 
-    def download(self, savepath=None, keep_original_name=False, subfolders=False, **kwargs):
-        """ Download all episodes from the show. See :func:`~plexapi.base.Playable.download` for details.
+    def download(self, savepath=None, keep_original_name=False, subfolders=False, maxworkers=None, resume=True,
+                 segments=None, window=None, **kwargs):
+        """ Download all episodes from the show concurrently. See :func:`~plexapi.base.Playable.download` for details.
 
             Parameters:
                 savepath (str): Defaults to current working dir.
                 keep_original_name (bool): True to keep the original filename otherwise
                     a friendlier filename is generated.
                 subfolders (bool): True to separate episodes in to season folders.
+                maxworkers (int): Maximum number of concurrent downloads.
+                    Default is the ``plexapi.max_workers`` config value.
+                resume (bool): True to skip files which are already downloaded and resume partially
+                    downloaded files (default). False to always download the entire file.
+                segments (int): Number of connections used to download each part of the original files
+                    in byte ranges. See :func:`~plexapi.utils.downloadSegments`. Default is one connection.
+                window (int): Number of segments of each transcoded HLS stream fetched ahead concurrently.
+                    Default is the ``plexapi.max_workers`` config value.
                 **kwargs: Additional options passed into :func:`~plexapi.base.PlexObject.getStreamURL`.
         """
-        filepaths = []
+        manager = DownloadManager(maxworkers, resume=resume, segments=segments, window=window)
         for episode in self.episodes():
             _savepath = os.path.join(savepath, f'Season {str(episode.seasonNumber).zfill(2)}') if subfolders else savepath
-            filepaths += episode.download(_savepath, keep_original_name, **kwargs)
-        return filepaths
+            manager.add(episode, _savepath, keep_original_name, **kwargs)
+        return manager.download()
 
     @property
     def metadataDirectory(self):
@@ -788,6 +802,33 @@ class Show(
         return str(Path('Metadata') / 'TV Shows' / guid_hash[0] / f'{guid_hash[1:]}.bundle')
 
 
+def _buildEpisodeIndex(episodes):
+    """ Returns a dict of the episodes by ``('index', (parentIndex, index))`` and ``('title', lowercase title)``.
+        The first episode is kept when multiple episodes have the same key.
+    """
+    episodeIndex = {}
+    for episode in episodes:
+        episodeIndex.setdefault(('index', (episode.parentIndex, episode.index)), episode)
+        if episode.title is not None:
+            episodeIndex.setdefault(('title', episode.title.lower()), episode)
+    return episodeIndex
+
+
+def _lookupEpisode(obj, **kwargs):
+    """ Returns the episode from the cached episode index of a :class:`~plexapi.video.Show` or
+        :class:`~plexapi.video.Season`. The index is rebuilt once when the episode is not found
+        in case new episodes were added since the index was built.
+    """
+    lookup = next(iter(kwargs.items()))
+    episode = obj._episodeIndex.get(lookup)
+    if episode is None:
+        obj.__dict__.pop('_episodeIndex', None)
+        episode = obj._episodeIndex.get(lookup)
+    if episode is None:
+        raise NotFound(f'Unable to find episode {lookup[0]}={lookup[1]!r} in {obj.title}')
+    return episode
+
+
 @utils.registerPlexObject
 class Season(
     Video,
@@ -913,17 +954,21 @@ class Season(
             Raises:
                 :exc:`~plexapi.exceptions.BadRequest`: If title or episode parameter is missing.
         """
-        key = f'{self.key}/children'
         if title is not None and not isinstance(title, int):
-            return self.fetchItem(key, Episode, title__iexact=title)
+            return _lookupEpisode(self, title=title.lower())
         elif episode is not None or isinstance(title, int):
             if isinstance(title, int):
                 index = title
             else:
                 index = episode
-            return self.fetchItem(key, Episode, parentIndex=self.index, index=index)
+            return _lookupEpisode(self, index=(self.index, utils.cast(int, index)))
         raise BadRequest('Missing argument: title or episode is required')
 
+    @cached_data_property
+    def _episodeIndex(self):
+        """ Cache for the episode lookup index. """
+        return _buildEpisodeIndex(self.episodes())
+
     def episodes(self, **kwargs):
         """ Returns a list of :class:`~plexapi.video.Episode` objects in the season. """
         key = f'{self.key}/children'
@@ -945,19 +990,28 @@ class Season(
         """ Returns list of unwatched :class:`~plexapi.video.Episode` objects. """
         return self.episodes(viewCount=0)
 
-    def download(self, savepath=None, keep_original_name=False, **kwargs):
-        """ Download all episodes from the season. See :func:`~plexapi.base.Playable.download` for details.
+    def download(self, savepath=None, keep_original_name=False, maxworkers=None, resume=True, segments=None,
+                 window=None, **kwargs):
+        """ Download all episodes from the season concurrently. See :func:`~plexapi.base.Playable.download` for details.
 
             Parameters:
                 savepath (str): Defaults to current working dir.
                 keep_original_name (bool): True to keep the original filename otherwise
                     a friendlier filename is generated.
+                maxworkers (int): Maximum number of concurrent downloads.
+                    Default is the ``plexapi.max_workers`` config value.
+                resume (bool): True to skip files which are already downloaded and resume partially
+                    downloaded files (default). False to always download the entire file.
+                segments (int): Number of connections used to download each part of the original files
+                    in byte ranges. See :func:`~plexapi.utils.downloadSegments`. Default is one connection.
+                window (int): Number of segments of each transcoded HLS stream fetched ahead concurrently.
+                    Default is the ``plexapi.max_workers`` config value.
                 **kwargs: Additional options passed into :func:`~plexapi.base.PlexObject.getStreamURL`.
         """
-        filepaths = []
+        manager = DownloadManager(maxworkers, resume=resume, segments=segments, window=window)
         for episode in self.episodes():
-            filepaths += episode.download(savepath, keep_original_name, **kwargs)
-        return filepaths
+            manager.add(episode, savepath, keep_original_name, **kwargs)
+        return manager.download()
 
     def _defaultSyncTitle(self):
         """ Returns str, default title for a new syncItem. """
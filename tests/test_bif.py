@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import struct
+
+import pytest
+from plexapi.bif import BIF
+from plexapi.exceptions import BadRequest
+
+
+def test_bif(tmpdir):
+    frames = [b"frame0", b"frame-1", b"frame--2"]
+    offset = BIF.HEADER_SIZE + (len(frames) + 1) * 8
+    table = b""
+    for index, frame in enumerate(frames):
+        table += struct.pack("<II", index * 10, offset)
+        offset += len(frame)
+    table += struct.pack("<II", 0xFFFFFFFF, offset)
+    header = BIF.MAGIC + struct.pack("<III", 0, len(frames), 1000)
+    filepath = tmpdir.join("part.bif")
+    filepath.write_binary(header.ljust(BIF.HEADER_SIZE, b"\0") + table + b"".join(frames))
+
+    with BIF(str(filepath)) as bif:
+        assert len(bif) == 3
+        assert bif.timestamps == [0, 10000, 20000]
+        assert bif[1] == b"frame-1"
+        assert bif[-1] == b"frame--2"
+        assert bif.frame(9999) == b"frame0"
+        assert bif.frame(10000) == b"frame-1"
+        assert bif.frames([0, 25000]) == [b"frame0", b"frame--2"]
+        filepaths = bif.extract(str(tmpdir.join("frames")), offsets=[15000, 16000])
+        assert len(filepaths) == 1
+        assert tmpdir.join("frames", "0000010000.jpg").read_binary() == b"frame-1"
+
+    tmpdir.join("invalid.bif").write_binary(b"\0" * BIF.HEADER_SIZE)
+    with pytest.raises(BadRequest):
+        BIF(str(tmpdir.join("invalid.bif")))
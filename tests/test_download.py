@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+import pytest
+from plexapi.download import DownloadManager
+from plexapi.exceptions import Unsupported
+from plexapi.streaming import StreamFetcher
+
+
+def test_downloadManager_hls(tmpdir, requests_mock, monkeypatch):
+    base = "http://plex.test/video/:/transcode/universal"
+    url = f"{base}/start.m3u8?protocol=hls&session=abc"
+    requests_mock.get(url, text="#EXTM3U\n" + "".join(f"#EXTINF:1,\n{i:05d}.ts\n" for i in range(3)) + "#EXT-X-ENDLIST\n")
+    for i in range(3):
+        requests_mock.get(f"{base}/{i:05d}.ts", content=f"segment{i}".encode())
+    requests_mock.get(f"{base}/stop?session=abc", text="")
+    windows = []
+    monkeypatch.setattr(StreamFetcher, "_startPing", lambda self: windows.append(self.window))
+
+    manager = DownloadManager(segments=4, window=2)
+    manager.addURL(url, "token", filename="movie.ts", savepath=str(tmpdir))
+    assert manager.download() == [str(tmpdir.join("movie.ts"))]
+    assert tmpdir.join("movie.ts").read_binary() == b"segment0segment1segment2"
+    assert windows == [2]
+    assert manager.downloadedSize == len(b"segment0segment1segment2")
+
+
+def test_downloadManager_dash():
+    manager = DownloadManager()
+    with pytest.raises(Unsupported):
+        manager.addURL("http://plex.test/video/:/transcode/universal/start.mpd?protocol=dash", "token")
+    assert manager.total == 0
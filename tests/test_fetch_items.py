@@ -1,7 +1,14 @@
 from xml.etree.ElementTree import Element
 
+import pytest
+from plexapi import base, utils
 from plexapi.audio import Track
-from plexapi.base import MediaContainer
+from plexapi.base import MediaContainer, PlexObject
+from plexapi.myplex import MyPlexAccount
+from plexapi.server import PlexServer
+from requests import Session
+
+from .payloads import ACCOUNT_XML
 
 
 def test_media_container_is_list():
@@ -39,3 +46,79 @@ def test_find_items_empty_data(plex):
     assert len(result) == 0
     result = plex.findItems(Element("MediaContainer"))
     assert isinstance(result, MediaContainer)
+
+
+@pytest.mark.parametrize("parser", ["elementtree", "lxml"])
+def test_find_items_keep_data(parser):
+    if parser not in utils.XMLPARSERS:
+        pytest.skip(f"{parser} is not installed")
+    xml = (
+        '<MediaContainer size="2">'
+        '<Track ratingKey="1" key="/library/metadata/1" type="track" title="One"><Genre tag="Rock" /></Track>'
+        '<Track ratingKey="2" key="/library/metadata/2" type="track" title="Two" />'
+        '</MediaContainer>'
+    )
+    data = utils.parseXML(xml, parser=parser)
+    container = MediaContainer(None, None)
+    items = container.findItems(data, Track)
+    assert items._data is data
+    assert items[0]._data is data[0]
+
+    items = container.findItems(data, Track, keepData=False)
+    assert [item.title for item in items] == ["One", "Two"]
+    assert items.size == 2
+    assert len(items._data) == 0
+    assert items[0]._data.attrib.get("title") == "One"
+    assert [genre.tag for genre in items[0].genres] == ["Rock"]
+    if parser == "lxml":
+        assert items[0]._data.getparent() is None
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_pickle_items(compress):
+    xml = (
+        '<MediaContainer size="2">'
+        '<Track ratingKey="1" key="/library/metadata/1" type="track" title="One"><Genre tag="Rock" /></Track>'
+        '<Track ratingKey="2" key="/library/metadata/2" type="track" title="Two" />'
+        '</MediaContainer>'
+    )
+    items = MediaContainer(None, None).findItems(utils.parseXML(xml), Track)
+    assert [genre.tag for genre in items[0].genres] == ["Rock"]
+    loaded = base.loads(base.dumps(items, compress=compress))
+    assert isinstance(loaded, MediaContainer)
+    assert loaded.size == 2
+    assert [item.title for item in loaded] == ["One", "Two"]
+    assert "genres" not in loaded[0].__dict__
+    assert [genre.tag for genre in loaded[0].genres] == ["Rock"]
+    assert loaded[0]._server is None
+    assert loaded[0]._data.attrib.get("ratingKey") == "1"
+
+
+def test_pickle_server_token():
+    servers = []
+    for token in ("token1", "token2"):
+        server = PlexServer.__new__(PlexServer)
+        server.__dict__.update(machineIdentifier="abc", _token=token)
+        base.SERVERS[base._serverKey(server)] = server
+        servers.append(server)
+    track = Track(servers[0], Element("Track", {"ratingKey": "1", "title": "One"}))
+    data = base.dumps(track)
+    assert b"token1" not in data
+    # Objects are rebound to the connection with the same token
+    assert base.loads(data)._server is servers[0]
+    assert base.loads(data, server=servers[1])._server is servers[1]
+    del base.SERVERS[base._serverKey(servers[0])]
+    assert base.loads(data)._server is None
+
+
+def test_pickle_account_token():
+    account = MyPlexAccount.__new__(MyPlexAccount)
+    account._session = Session()
+    PlexObject.__init__(account, account, utils.parseXML(ACCOUNT_XML))
+    assert account.authToken == "faketoken"
+    data = base.dumps(account, compress=False)
+    assert b"faketoken" not in data
+    loaded = base.loads(data)
+    assert loaded.username == account.username
+    assert loaded._token is None and loaded.authToken is None
+    assert loaded._server is loaded
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
+import json
 from collections import namedtuple
 from datetime import datetime, timedelta
 from urllib.parse import quote_plus
 
 import pytest
 import plexapi.base
+import plexapi.utils
 from plexapi.exceptions import BadRequest, NotFound
+from plexapi.library import LibrarySection
 
 from . import conftest as utils
 
@@ -71,6 +74,19 @@ def test_library_MovieSection_getGuid(movies, movie):
         movies.getGuid(guid='imdb://tt00000000')
 
 
+def test_library_MovieSection_guidIndex(movies, movie, tmp_path):
+    path = str(tmp_path / "guids.json")
+    index = movies.guidIndex(path=path)
+    assert len(index) == movies.totalSize
+    assert index.get(movie.guid) == movie.ratingKey
+    assert index.get(movie.guids[0].id) == movie.ratingKey
+    assert movies.getGuid(guid=movie.guids[0].id) == movie
+    index = movies.guidIndex(path=path, refresh=False)
+    assert movie.guid in index
+    with pytest.raises(NotFound):
+        movies.getGuid(guid='imdb://tt00000000')
+
+
 def test_library_section_movies_all(movies):
     assert movies.totalSize == 4
     assert len(movies.all(container_start=0, container_size=1, maxresults=1)) == 1
@@ -574,6 +590,44 @@ def test_library_section_timeline(plex, movies):
     assert tl.viewMode is None
 
 
+def test_library_loadHubs(plex, movies):
+    hubs = plex.library.loadHubs(size=2)
+    assert hubs
+    for hub in hubs:
+        assert "_items" in hub.__dict__
+        assert len(hub.items()) <= 2
+    hubs = movies.loadHubs(ttl=60)
+    assert hubs
+    assert all("_items" in hub.__dict__ for hub in hubs)
+    assert movies.loadHubs(ttl=60) is hubs
+
+
+def test_library_MovieSection_mediaStats(movies):
+    fields = {
+        "ratingKey": "int",
+        "Media__videoResolution": "str",
+        "Media__Part__Stream__streamType": "int",
+        "Media__Part__Stream__codec": "str",
+    }
+    stats = movies.mediaStats(fields, batchSize=2, maxworkers=2)
+    assert set(stats.tolist("ratingKey")) == {movie.ratingKey for movie in movies.all()}
+    videoCodecs = stats.groupby("Media__Part__Stream__codec", where={"Media__Part__Stream__streamType": 1})
+    assert sum(videoCodecs.values()) >= len(movies.all())
+
+
+def test_library_ShowSection_changesSince(tvshows, show):
+    changes = tvshows.changesSince(libtypes=["show", "episode"])
+    assert show in changes["added"]
+    assert not changes["updated"] and not changes["removed"]
+    watermark = changes["watermark"]
+    assert show.ratingKey in watermark["ratingKeys"]["show"]
+    assert len(watermark["ratingKeys"]["episode"]) == tvshows.count(libtype="episode")
+
+    changes = tvshows.changesSince(watermark, libtypes=["show", "episode"])
+    assert not changes["added"] and not changes["removed"]
+    assert changes["watermark"]["ratingKeys"] == watermark["ratingKeys"]
+
+
 def test_library_MovieSection_hubSearch(movies):
     assert movies.hubSearch("Elephants Dream")
 
@@ -588,6 +642,43 @@ def test_library_MovieSection_search(movies, movie, collection):
     _test_library_search(movies, collection)
 
 
+def test_library_MovieSection_scan(movies, movie):
+    items = movies.all()
+    results = movies.scan(partitions=3)
+    assert len(results) == len(items)
+    assert {item.ratingKey for item in results} == {item.ratingKey for item in items}
+    results = movies.scan(partitions=2, field="year", filters={"title": movie.title})
+    assert movie in results
+    with pytest.raises(BadRequest):
+        movies.scan(field="title")
+
+
+def test_library_MovieSection_aggregate(movies, movie):
+    items = movies.all()
+    assert movies.count() == len(items)
+    assert movies.count(title=movie.title) >= 1
+    assert movies.count(year__gte=movie.year) == len([m for m in items if m.year >= movie.year])
+    assert movies.sum("duration") == sum(m.duration for m in items if m.duration)
+    assert movies.min("year") == min(m.year for m in items if m.year)
+    assert movies.max("year") == max(m.year for m in items if m.year)
+    groups = movies.groupby("year")
+    assert sum(groups.values()) == len(items)
+    assert groups[str(movie.year)] >= 1
+
+
+def test_library_aggregate_nested():
+    xml = (
+        '<MediaContainer>'
+        '<Video ratingKey="1"><Media videoResolution="1080"><Part size="5" /><Part size="7" /></Media></Video>'
+        '<Video ratingKey="2"><Media videoResolution="720"><Part size="1" /></Media></Video>'
+        '</MediaContainer>'
+    )
+    section = LibrarySection.__new__(LibrarySection)
+    section._searchElements = lambda **kwargs: list(plexapi.utils.parseXML(xml))
+    assert section.sum("media__part__size") == 13
+    assert section.groupby("media__videoResolution", sumAttr="media__part__size") == {"1080": 12, "720": 1}
+
+
 def test_library_MovieSection_search_FilterChoice(movies, collection):
     filterChoice = next(c for c in movies.listFilterChoices("collection") if c.title == collection.title)
     results = movies.search(filters={'collection': filterChoice})
@@ -943,6 +1034,91 @@ def test_library_multiedit(movies, tvshows):
     assert show1.title == show1_title
 
 
+def test_library_bulkEdit(movies):
+    movie1, movie2 = movies.all()[:2]
+    movie1_title, movie2_title = movie1.title, movie2.title
+
+    failures = movies.bulkEdit({
+        movie1: {"title.value": "Bulk Title 1", "title.locked": 1},
+        movie2: {"title.value": "Bulk Title 2", "title.locked": 1},
+    })
+    assert failures == []
+    assert movie1.reload().title == "Bulk Title 1"
+    assert movie2.reload().title == "Bulk Title 2"
+
+    assert movies.bulkEdit([([movie1, movie2], {"summary.value": "Bulk Summary"})], chunkSize=1) == []
+    assert movie1.reload().summary == movie2.reload().summary == "Bulk Summary"
+
+    # Reset titles
+    movie1.editTitle(movie1_title, locked=False).editSummary("", locked=False).reload()
+    movie2.editTitle(movie2_title, locked=False).editSummary("", locked=False).reload()
+    assert movie1.title == movie1_title
+    assert movie2.title == movie2_title
+
+
+def test_library_bulkUpload(movies):
+    movie1, movie2 = movies.all()[:2]
+    with open(utils.STUB_IMAGE_PATH, "rb") as image:
+        failures = movies.bulkUpload({
+            movie1: {"poster": utils.STUB_IMAGE_PATH},
+            movie2: {"poster": utils.STUB_IMAGE_PATH, "art": image},
+        })
+    assert failures == []
+    assert any(poster.ratingKey.startswith("upload://") for poster in movie2.posters())
+    assert any(art.ratingKey.startswith("upload://") for art in movie2.arts())
+    with pytest.raises(BadRequest):
+        movies.bulkUpload([(movie1, {"unknown": utils.STUB_IMAGE_PATH})])
+
+
+def test_library_downloadMissingSubtitles(movies):
+    progress = []
+    results = movies.downloadMissingSubtitles(
+        language="en", languageCode="eng", pick=lambda video, subtitles: None, maxworkers=2, rate=10,
+        callback=lambda completed, total: progress.append((completed, total))
+    )
+    total = len(results["missing"]) + len(results["failed"])
+    assert results["downloaded"] == []
+    assert len(progress) == total
+    if progress:
+        assert progress[-1] == (total, total)
+    assert all(video.type == "movie" for video in results["missing"])
+
+
+def test_library_matchUnmatched(movies, tmp_path):
+    items = movies.all()[:2]
+    cache = {}
+    reviewPath = tmp_path / "review.json"
+    results = movies.matchUnmatched(
+        items=items, minScore=101, apply=False, cache=cache, maxworkers=2, rate=5, reviewPath=str(reviewPath)
+    )
+    assert results["matched"] == []
+    assert len(results["review"]) + len(results["failed"]) == len(items)
+    review = json.loads(reviewPath.read_text())
+    assert [row["ratingKey"] for row in review] == [item.ratingKey for item, _ in results["review"]]
+    if results["review"]:
+        assert len(cache) >= 1
+
+
+def test_library_reconcileCollections(movies):
+    movie1, movie2, movie3 = movies.all()[:3]
+    title1, title2 = "test_reconcile_1", "test_reconcile_2"
+    try:
+        failures = movies.reconcileCollections({title1: {movie1.ratingKey, movie2.ratingKey}, title2: [movie3]})
+        assert failures == []
+        assert {item.ratingKey for item in movies.collection(title1).items()} == {movie1.ratingKey, movie2.ratingKey}
+        assert [item.ratingKey for item in movies.collection(title2).items()] == [movie3.ratingKey]
+
+        failures = movies.reconcileCollections({title1: {movie2.ratingKey, movie3.ratingKey}})
+        assert failures == []
+        assert {item.ratingKey for item in movies.collection(title1).items()} == {movie2.ratingKey, movie3.ratingKey}
+    finally:
+        for title in (title1, title2):
+            try:
+                movies.collection(title).delete()
+            except NotFound:
+                pass
+
+
 def test_library_multiedit_exceptions(music, artist, album, photos):
     with pytest.raises(BadRequest):
         music.multiEdit([])
@@ -86,6 +86,24 @@ def test_Playlist_create(plex, show):
         playlist.delete()
 
 
+def test_Playlist_syncTo(plex, show):
+    episodes = show.episodes()
+    playlist = plex.createPlaylist('test_playlist_syncTo', items=episodes[:4])
+    try:
+        target = [episodes[3], episodes[0], episodes[5], episodes[2], episodes[4]]
+        playlist.syncTo(target)
+        items = playlist.reload().items()
+        assert [item.ratingKey for item in items] == [item.ratingKey for item in target]
+        playlist.syncTo(episodes[:2])
+        items = playlist.reload().items()
+        assert [item.ratingKey for item in items] == [item.ratingKey for item in episodes[:2]]
+        playlist.syncTo([episodes[6]])
+        items = playlist.reload().items()
+        assert [item.ratingKey for item in items] == [episodes[6].ratingKey]
+    finally:
+        playlist.delete()
+
+
 def test_Playlist_edit(plex, movie):
     title = 'test_playlist_edit'
     new_title = 'test_playlist_edit_new_title'
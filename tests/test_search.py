@@ -1,2 +1,51 @@
 # -*- coding: utf-8 -*-
 # TODO: Many more tests is for search later.
+import time
+
+import pytest
+from plexapi import federated
+from plexapi.exceptions import BadRequest
+
+
+class _Target:
+    def __init__(self, results, delay=0):
+        self.results = results
+        self.delay = delay
+
+    def hubSearch(self, query, mediatype=None, limit=None):
+        time.sleep(self.delay)
+        if isinstance(self.results, Exception):
+            raise self.results
+        return self.results
+
+
+def test_federated_search():
+    fast, other, slow, failed = _Target(["a1", "a2"]), _Target(["b1"]), _Target(["c1"], delay=2), _Target(ValueError())
+    starttime = time.time()
+    results = federated.search([fast, other, slow, failed], "query", timeout=0.5)
+    assert time.time() - starttime < 1
+    assert results == ["a1", "b1", "a2"]
+    assert results.pending == [slow]
+    assert list(results.errors) == [failed]
+    assert federated.search([fast, other], "query", key=str) == ["a1", "a2", "b1"]
+
+
+def test_federated_search_limit():
+    calls = []
+
+    class _Library:
+        def search(self, **kwargs):
+            calls.append(kwargs)
+            return ["a1"]
+
+    server = type("Server", (), {"library": _Library()})()
+    assert federated.search([server], "query", method="search", limit=5) == ["a1"]
+    assert calls == [{"title": "query", "libtype": None, "maxresults": 5}]
+    with pytest.raises(BadRequest):
+        federated._search(server, "query", "unknown", None, None)
+
+
+def test_server_federated_search(plex, movie):
+    results = federated.search([plex, plex.library.section(movie.librarySectionTitle)], movie.title)
+    assert movie in results
+    assert not results.errors and not results.pending
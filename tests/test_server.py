@@ -1,15 +1,21 @@
 # -*- coding: utf-8 -*-
+import json
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus
 
 import pytest
 from datetime import datetime
 from PIL import Image
 from plexapi.exceptions import BadRequest, NotFound
+from plexapi.imagecache import ImageCache
+from plexapi.library import File, Path
 from plexapi.server import PlexServer
+from plexapi.tasks import TaskQueue
 from plexapi.utils import download
 from requests import Session
+from xml.etree.ElementTree import Element
 
 from . import conftest as utils
 from .payloads import SERVER_RESOURCES, SERVER_TRANSCODE_SESSIONS
@@ -118,6 +124,121 @@ def test_server_transcodeImage(tmpdir, plex, movie):
             assert image1.size == image2.size
 
 
+def test_server_TaskQueue(plex, movies):
+    items = movies.all()[:2]
+    progress = []
+    queue = TaskQueue(plex, maxworkers=2, pollInterval=0.5, track=False, callback=lambda q: progress.append(q.finished))
+    report = queue.add(items, action="refresh").run()
+    assert report["failed"] == []
+    assert len(report["completed"]) + len(report["unconfirmed"]) == len(items)
+    assert progress[-1] == len(items)
+    with pytest.raises(BadRequest):
+        queue.add(items, action="delete")
+
+
+def test_server_TaskQueue_alerts():
+    queue = TaskQueue(None)
+    queue._pending = {"1": ("movie1", "refresh", 0), "2": ("movie2", "analyze", 0)}
+    queue._onAlert({"type": "activity", "ActivityNotification": [
+        {"event": "ended", "Activity": {"Context": {"key": "/library/metadata/1"}}},
+    ]})
+    queue._onAlert({"type": "timeline", "TimelineEntry": [{"itemID": "2", "state": 1}]})
+    assert queue.completed == [("movie1", "refresh")]
+    queue._onAlert({"type": "timeline", "TimelineEntry": [{"itemID": "2", "state": 5}]})
+    assert queue.completed == [("movie1", "refresh"), ("movie2", "analyze")]
+    assert queue._pending == {}
+
+
+def test_server_TaskQueue_sameItem():
+    class _Server:
+        def activities(self):
+            # complete the unfinished jobs as the alert listener would
+            for ratingKey in list(sent):
+                sent.discard(ratingKey)
+                queue._complete(ratingKey)
+            return []
+
+        def transcodeSessions(self):
+            return []
+
+    class _Item:
+        def __init__(self, ratingKey):
+            self.ratingKey = ratingKey
+
+        def refresh(self):
+            assert str(self.ratingKey) not in sent
+            sent.add(str(self.ratingKey))
+
+        analyze = refresh
+
+    sent = set()
+    items = [_Item(1), _Item(2)]
+    queue = TaskQueue(_Server(), maxworkers=4, maxActivities=10, pollInterval=0.01)
+    queue._startListener = lambda: type("Listener", (), {"stop": lambda self: None})()
+    report = queue.add(items, "refresh").add(items, "analyze").run()
+    assert queue.total == queue.finished == 4
+    assert report["failed"] == []
+    assert sorted((item.ratingKey, action) for item, action in report["completed"]) == [
+        (1, "analyze"), (1, "refresh"), (2, "analyze"), (2, "refresh")
+    ]
+    # running the queue again starts a new report
+    rerun = queue.run()
+    assert queue.finished == 4 and len(rerun["completed"]) == 4
+    assert len(report["completed"]) == 4
+
+
+def test_server_imageCache(tmpdir, plex, movies):
+    cache = ImageCache(plex, path=str(tmpdir))
+    movie = movies.all()[0]
+    original = cache.getImage(movie)
+    assert original and cache.misses == 1
+    assert cache.getImage(movie) == original
+    assert cache.hits == 1
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        images = list(pool.map(lambda _: cache.getImage(movie, width=100, height=150), range(4)))
+    assert len(set(images)) == 1
+    assert cache.misses == 2
+    assert cache.prewarm(movies, sizes=[(100, 150)]) == []
+    assert len(ImageCache(plex, path=str(tmpdir))) == len(cache)
+    # Evict the least recently used images
+    cache.maxsize = len(original)
+    cache.getImage(movie, width=50, height=75)
+    assert cache.size <= len(original) or len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_server_imageCache_cacheKey(tmpdir):
+    servers = [type("Server", (), {"machineIdentifier": machineIdentifier}) for machineIdentifier in ("a", "b")]
+    caches = [ImageCache(server, path=str(tmpdir)) for server in servers]
+    path = "/library/metadata/1/thumb"
+    assert caches[0].cacheKey(path)[1] != caches[1].cacheKey(path)[1]
+    assert caches[0].cacheKey(path) == ImageCache(servers[0], path=str(tmpdir)).cacheKey(path)
+    assert caches[0].cacheKey(path, width=100)[1] != caches[0].cacheKey(path)[1]
+
+
+def test_server_imageCache_singleFlight(tmpdir):
+    fetched = []
+
+    def _get(url, **kwargs):
+        fetched.append(url)
+        time.sleep(0.1)
+        return type("Response", (), {"status_code": 200, "content": b"image"})
+
+    server = type("Server", (), {
+        "machineIdentifier": "a", "_timeout": 1, "_headers": lambda self: {},
+        "url": lambda self, path, includeToken=False: path, "_session": type("Session", (), {"get": staticmethod(_get)}),
+    })()
+    cache = ImageCache(server, path=str(tmpdir))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        images = list(pool.map(lambda _: cache.getImage("/library/metadata/1/thumb"), range(4)))
+    assert images == [b"image"] * 4
+    assert fetched == ["/library/metadata/1/thumb"]
+    assert cache.misses == 1 and cache._inflight == {}
+    assert cache.getImage("/library/metadata/1/thumb") == b"image"
+    assert cache.hits == 1
+
+
 def test_server_fetchitem_notfound(plex):
     with pytest.raises(NotFound):
         plex.fetchItem(123456789)
@@ -371,6 +492,39 @@ def test_server_browse(plex, movies):
     for path, paths, files in plex.walk(movies_path):
         assert path.startswith(movies_path)
         assert len(paths) or len(files)
+    # walk concurrently with patterns, depth limit, and cache
+    expected = sorted(path for path, _, _ in plex.walk(movies_path))
+    assert sorted(path for path, _, _ in plex.walk(movies_path, maxworkers=4)) == expected
+    assert [path for path, _, _ in plex.walk(movies_path, maxdepth=0)] == [movies_path]
+    for path, paths, files in plex.walk(movies_path, include="*.mkv"):
+        assert all(f.path.endswith(".mkv") for f in files)
+    cache = {}
+    assert sorted(path for path, _, _ in plex.walk(movies_path, cache=cache)) == expected
+    assert cache
+    assert sorted(path for path, _, _ in plex.walk(movies_path, cache=cache)) == expected
+
+
+def test_server_walk_cacheFile(tmpdir):
+    plex = PlexServer.__new__(PlexServer)
+
+    def _item(cls, path):
+        return cls(plex, Element(cls.TAG, {"key": f"/services/browse/{path}", "path": path, "title": path}))
+
+    tree = {"/a": [_item(Path, "/a/b"), _item(File, "/a/x.mkv")], "/a/b": [_item(File, "/a/b/y.mkv")]}
+    browsed = []
+
+    def _browse(path):
+        path = path.path if isinstance(path, Path) else path
+        browsed.append(path)
+        return tree[path]
+
+    plex.browse = _browse
+    cachePath = str(tmpdir.join("walk.json"))
+    expected = [("/a", ["/a/x.mkv"]), ("/a/b", ["/a/b/y.mkv"])]
+    assert [(path, [f.path for f in files]) for path, _, files in plex.walk("/a", cache=cachePath)] == expected
+    assert json.loads(tmpdir.join("walk.json").read())["/a"][0]["type"] == "path"
+    assert [(path, [f.path for f in files]) for path, _, files in plex.walk("/a", cache=cachePath)] == expected
+    assert browsed == ["/a", "/a/b"]
 
 
 def test_server_allowMediaDeletion(account):
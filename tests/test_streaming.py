@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import pytest
+from plexapi import streaming
+from plexapi.exceptions import BadRequest
+from plexapi.streaming import StreamFetcher
+
+
+def test_streamFetcher_hls(tmpdir, requests_mock):
+    base = "http://plex.test/video/:/transcode/universal"
+    url = f"{base}/start.m3u8?protocol=hls&session=abc"
+    requests_mock.get(url, text="#EXTM3U\n#EXT-X-STREAM-INF:BANDWIDTH=1000\nsession/abc/base/index.m3u8\n")
+    requests_mock.get(f"{base}/session/abc/base/index.m3u8", text=(
+        "#EXTM3U\n#EXT-X-TARGETDURATION:1\n"
+        + "".join(f"#EXTINF:1,\n{i:05d}.ts\n" for i in range(5))
+        + "#EXT-X-ENDLIST\n"
+    ))
+    for i in range(5):
+        requests_mock.get(f"{base}/session/abc/base/{i:05d}.ts", content=f"segment{i}".encode())
+    stop = requests_mock.get(f"{base}/stop?session=abc", text="")
+
+    assert StreamFetcher.isStreamURL(url)
+    assert not StreamFetcher.isStreamURL("http://plex.test/library/parts/1/file.mkv")
+    with StreamFetcher(url, "token", window=2, pingInterval=0) as fetcher:
+        filepath = fetcher.download("movie.ts", str(tmpdir))
+    assert tmpdir.join("movie.ts").read_binary() == b"".join(f"segment{i}".encode() for i in range(5))
+    assert filepath == str(tmpdir.join("movie.ts"))
+    assert stop.called
+
+
+def test_streamFetcher_hls_stalled(requests_mock):
+    url = "http://plex.test/video/:/transcode/universal/start.m3u8?protocol=hls&session=abc"
+    requests_mock.get(url, text="#EXTM3U\n#EXT-X-TARGETDURATION:0.01\n#EXTINF:1,\n00000.ts\n")
+    fetcher = StreamFetcher(url, "token", pingInterval=0, stallTimeout=0.05)
+    segments = fetcher.segments()
+    assert next(segments).endswith("/00000.ts")
+    with pytest.raises(BadRequest):
+        next(segments)
+
+
+def test_streamFetcher_dash():
+    manifest = b"""<?xml version="1.0"?>
+<MPD xmlns="urn:mpeg:dash:schema:mpd:2011" mediaPresentationDuration="PT9.5S">
+  <Period>
+    <AdaptationSet mimeType="video/mp4">
+      <SegmentTemplate timescale="1000" initialization="session/abc/$RepresentationID$/header"
+        media="session/abc/$RepresentationID$/$Number%05d$.m4s" startNumber="0" duration="5000"/>
+      <Representation id="0"/>
+    </AdaptationSet>
+    <AdaptationSet mimeType="audio/mp4">
+      <Representation id="1">
+        <SegmentTemplate initialization="init-$RepresentationID$" media="$Time$.m4s">
+          <SegmentTimeline><S t="0" d="10" r="1"/><S d="5"/></SegmentTimeline>
+        </SegmentTemplate>
+      </Representation>
+    </AdaptationSet>
+  </Period>
+</MPD>"""
+    assert streaming._mpdURIs(manifest) == [
+        "session/abc/0/header", "session/abc/0/00000.m4s", "session/abc/0/00001.m4s"
+    ]
+    assert streaming._mpdURIs(manifest, representation="1") == ["init-1", "0.m4s", "10.m4s", "20.m4s"]
+    assert streaming._mpdURIs(manifest, representation=1) == ["init-1", "0.m4s", "10.m4s", "20.m4s"]
+    with pytest.raises(BadRequest):
+        streaming._mpdURIs(manifest, representation="2")
+    with pytest.raises(BadRequest):
+        streaming._mpdURIs(manifest, representation=2)
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
+import json
+import os
 import time
+from xml.etree import ElementTree
 
 import plexapi.utils as utils
 import pytest
-from plexapi.exceptions import NotFound
+from plexapi.exceptions import BadRequest, NotFound
 
 
 def test_utils_toDatetime():
@@ -53,6 +56,14 @@ def test_utils_joinArgs():
     assert utils.joinArgs(test_dict) == "?genre=action&type=1337"
 
 
+def test_utils_longestIncreasingSubsequence():
+    assert utils.longestIncreasingSubsequence([]) == set()
+    assert utils.longestIncreasingSubsequence([0, 1, 2]) == {0, 1, 2}
+    assert utils.longestIncreasingSubsequence([2, 1, 0]) in ({0}, {1}, {2})
+    result = utils.longestIncreasingSubsequence([3, 0, 1, 5, 2, 4])
+    assert result == {1, 2, 4, 5}
+
+
 def test_utils_cast():
     int_int = utils.cast(int, 1)
     int_str = utils.cast(int, "1")
@@ -88,6 +99,86 @@ def test_utils_download(plex, episode):
     )
 
 
+def test_utils_download_resume(tmpdir, requests_mock):
+    url = "http://plex.test/library/parts/1/file.mkv?download=1"
+    data = b"0123456789"
+    requests_mock.get(url, [
+        {"content": data[4:], "status_code": 206},
+        {"content": data, "status_code": 200},
+    ])
+    savepath = str(tmpdir)
+    tmpdir.join("file.mkv.part").write_binary(data[:4])
+    progress = []
+    filepath = utils.download(
+        url, "token", filename="file.mkv", savepath=savepath, resume=True, size=len(data), callback=progress.append
+    )
+    assert requests_mock.last_request.headers["Range"] == "bytes=4-"
+    assert tmpdir.join("file.mkv").read_binary() == data
+    assert not tmpdir.join("file.mkv.part").exists()
+    assert sum(progress) == len(data)
+    # Already downloaded files are skipped
+    assert utils.download(url, "token", filename="file.mkv", savepath=savepath, resume=True, size=len(data)) == filepath
+    assert requests_mock.call_count == 1
+    # Size mismatch keeps the partial file
+    with pytest.raises(BadRequest):
+        utils.download(url, "token", filename="other.mkv", savepath=savepath, size=len(data) + 1)
+    assert tmpdir.join("other.mkv.part").read_binary() == data
+
+
+def test_utils_downloadSegments(tmpdir, requests_mock):
+    url = "http://plex.test/library/parts/1/file.mkv?download=1"
+    data = bytes(range(256)) * 40
+    ranges = []
+
+    def content(request, context):
+        start, end = map(int, request.headers["Range"][len("bytes="):].split("-"))
+        ranges.append(start)
+        context.status_code = 206
+        return data[start:end + 1]
+
+    requests_mock.get(url, content=content)
+    savepath = str(tmpdir)
+    # Resume from a checkpoint with the first segment completed
+    tmpdir.join("file.mkv.part").write_binary(data[:2560] + bytes(len(data) - 2560))
+    tmpdir.join("file.mkv.segments").write(
+        json.dumps({"size": len(data), "ranges": [[0, 2560, 2560], [2560, 5120, 0], [5120, 7680, 0], [7680, 10240, 0]]})
+    )
+    progress = []
+    assert utils.downloadSegments(
+        url, "token", "file.mkv", len(data), savepath=savepath, segments=4, chunksize=1000, callback=progress.append
+    ) == str(tmpdir.join("file.mkv"))
+    assert sorted(ranges) == [2560, 5120, 7680]
+    assert tmpdir.join("file.mkv").read_binary() == data
+    assert not tmpdir.join("file.mkv.part").exists()
+    assert not tmpdir.join("file.mkv.segments").exists()
+    assert sum(progress) == len(data)
+    # Range requests are required
+    requests_mock.get(url, content=data)
+    with pytest.raises(BadRequest):
+        utils.downloadSegments(url, "token", "other.mkv", len(data), savepath=savepath)
+
+
+def test_utils_downloadSegments_checkpoints(tmpdir, requests_mock):
+    url = "http://plex.test/library/parts/1/file.mkv?download=1"
+    data = bytes(range(256)) * 80
+
+    def content(request, context):
+        start, end = map(int, request.headers["Range"][len("bytes="):].split("-"))
+        context.status_code = 206
+        return data[start:end + 1]
+
+    requests_mock.get(url, content=content)
+    # Every segment writes several checkpoints concurrently
+    for _ in range(5):
+        filepath = utils.downloadSegments(
+            url, "token", "file.mkv", len(data), savepath=str(tmpdir), segments=8, chunksize=16, resume=False
+        )
+        assert tmpdir.join("file.mkv").read_binary() == data
+        assert not tmpdir.join("file.mkv.segments").exists()
+        assert not tmpdir.join("file.mkv.segments.tmp").exists()
+        os.remove(filepath)
+
+
 def test_millisecondToHumanstr():
     res = utils.millisecondToHumanstr(1000)
     assert res == "00:00:01.000"
@@ -101,3 +192,73 @@ def test_millisecondToHumanstr():
 
 def test_toJson(movie):
     assert utils.toJson(movie)
+
+
+@pytest.mark.parametrize("parser", ["elementtree", "lxml"])
+def test_utils_parseXML(parser):
+    if parser not in utils.XMLPARSERS:
+        pytest.skip(f"{parser} is not installed")
+    xml = '<MediaContainer size="1"><Video title="Illegal \x01 char" /></MediaContainer>'
+    data = utils.parseXML(xml.encode("utf-8"), parser=parser)
+    assert data.tag == "MediaContainer"
+    assert data.attrib.get("size") == "1"
+    assert [elem.tag for elem in data] == ["Video"]
+    assert data[0].attrib.get("title").startswith("Illegal ")
+    assert utils.parseXML(b"  \n", parser=parser) is None
+    with pytest.raises(ElementTree.ParseError):
+        utils.parseXML(b"OK", parser=parser)
+
+
+def test_utils_getXMLParser(monkeypatch):
+    assert utils.getXMLParser("elementtree") is utils.XMLPARSERS["elementtree"]
+    assert utils.getXMLParser("unknown") is utils.XMLPARSERS["elementtree"]
+    monkeypatch.delitem(utils.XMLPARSERS, "lxml", raising=False)
+    assert utils.getXMLParser("auto") is utils.XMLPARSERS["elementtree"]
+    assert utils.getXMLParser("lxml") is utils.XMLPARSERS["elementtree"]
+
+
+def test_utils_toColumns():
+    xml = (
+        '<MediaContainer>'
+        '<Video ratingKey="1" addedAt="100" rating="7.5" title="A">'
+        '<Media videoResolution="4k"><Part size="5" /><Part size="6" /></Media><Media videoResolution="1080" />'
+        '</Video>'
+        '<Video ratingKey="2" title="B" />'
+        '</MediaContainer>'
+    )
+    data = utils.parseXML(xml)
+    columns = utils.toColumns(data, ["ratingKey", "addedAt", "rating", "title"])
+    assert columns["ratingKey"].typecode == "q" and list(columns["ratingKey"]) == [1, 2]
+    assert columns["addedAt"].typecode == "d" and columns["addedAt"][0] == 100
+    assert columns["rating"][0] == 7.5
+    assert columns.decode("title") == ["A", "B"]
+
+    columns = utils.toColumns(data, {"ratingKey": "int", "Media__videoResolution": "str", "Media__Part__size": "int"})
+    assert list(columns["ratingKey"]) == [1, 1, 1, 2]
+    assert columns.decode("Media__videoResolution") == ["4k", "4k", "1080", None]
+    assert columns["Media__Part__size"][:2].tolist() == [5, 6]
+    with pytest.raises(BadRequest):
+        utils.toColumns(data, ["Media__videoResolution", "Genre__tag"])
+
+
+def test_utils_Columns_groupby():
+    xml = (
+        '<MediaContainer>'
+        '<Video ratingKey="1"><Media videoResolution="4k" bitrate="40000" /></Video>'
+        '<Video ratingKey="2"><Media videoResolution="1080" bitrate="8000" /></Video>'
+        '<Video ratingKey="3"><Media videoResolution="1080" bitrate="12000" /></Video>'
+        '<Video ratingKey="4"><Media videoResolution="1080" /></Video>'
+        '</MediaContainer>'
+    )
+    columns = utils.toColumns(utils.parseXML(xml), {"Media__videoResolution": "str", "Media__bitrate": "int"})
+    assert columns.tolist("Media__bitrate") == [40000, 8000, 12000, None]
+    assert columns.groupby("Media__videoResolution") == {"4k": 1, "1080": 3}
+    assert columns.groupby("Media__videoResolution", "Media__bitrate", agg="mean") == {"4k": 40000, "1080": 10000}
+    assert columns.groupby(["Media__videoResolution", "Media__bitrate"], where={"Media__videoResolution": "4k"}) == {
+        ("4k", 40000): 1
+    }
+    assert columns.histogram("Media__bitrate", bins=[0, 10000, 50000]) == [(0, 10000, 1), (10000, 50000, 2)]
+    assert [count for _, _, count in columns.histogram("Media__bitrate", bins=2)] == [2, 1]
+    assert columns.histogram("Media__bitrate", bins=3, where={"Media__videoResolution": "4k"}) == [(40000, 40000, 1)]
+    with pytest.raises(BadRequest):
+        columns.groupby("Media__videoResolution", agg="median")
@@ -5,7 +5,7 @@ from time import sleep
 from urllib.parse import quote_plus
 
 import pytest
-from plexapi.exceptions import BadRequest, NotFound
+from plexapi.exceptions import BadRequest, NotFound, Unsupported
 from plexapi.sync import VIDEO_QUALITY_3_MBPS_720p
 
 from . import conftest as utils
@@ -401,6 +401,8 @@ def test_video_Movie_download(monkeydownload, tmpdir, movie):
     assert len(with_resolution) == 1
     filename = os.path.basename(movie.media[0].parts[0].file)
     assert filename in with_resolution[0]
+    with pytest.raises(Unsupported):
+        movie.download(savepath=str(tmpdir), protocol="dash")
 
 
 def test_video_Movie_videoStreams(movie):
@@ -854,6 +856,21 @@ def test_video_Show_episode(show):
         show.episode(season=1337, episode=1337)
 
 
+def test_video_Show_episode_index(show):
+    episodes = show.episodes()
+    episode = show.episode(season=1, episode=1)
+    assert "_episodeIndex" in show.__dict__
+    assert show.episode(season=1, episode=1) is episode
+    assert show.episode(episode.title.upper()) is episode
+    assert len({e.ratingKey for e in episodes}) == len({key for key in show._episodeIndex if key[0] == "index"})
+    show.reload()
+    assert "_episodeIndex" not in show.__dict__
+    season = show.season(season=1)
+    assert season.episode(1) is season.episode(episode=1)
+    with pytest.raises(NotFound):
+        season.episode(1337)
+
+
 def test_video_Show_watched(tvshows):
     show = tvshows.get("The 100")
     episode = show.episodes()[0]